@@ -4,20 +4,140 @@
 """
 import math
 import random
+import time
 from board import Board
+from candidates import CandidateGenerator
+from evaluator import IncrementalEvaluator
+from opening_book import OpeningBook
+from parallel_search import ParallelRootSearch
+from solved_cache import OUTCOME_DEFENDED, OUTCOME_LOST, OUTCOME_NONE, OUTCOME_WIN, SolvedPositionCache
+from symmetry import SymmetricKeys
+from threats import ThreatSolver
+from transposition import EXACT, LOWER_BOUND, UPPER_BOUND, WIN_SCORE, WIN_THRESHOLD, TranspositionTable
+from zobrist import SIDE_TO_MOVE_KEY
+
+MAX_PLY = 64  # 주 변화(PV)를 기록할 최대 탐색 수순 길이
+
+
+class SearchTimeout(Exception):
+    """
+    시간 제한이 지나 진행 중인 반복 심화 탐색을 중단할 때 사용하는 예외
+    """
+
 
 class AIPlayer:
-    def __init__(self, player_number, difficulty=3):
+    def __init__(self, player_number, difficulty=3, evaluator='incremental',
+                 tt_memory_mb=16, keep_tt=False, move_generator='neighborhood', workers=1,
+                 opening_book=None, threat_nodes=20000, tt_symmetry=False, killer_history=False,
+                 stats=False, eval_weights=None, solved_cache=None):
         """
         AI 플레이어를 초기화합니다.
         
         Args:
             player_number (int): AI 플레이어 번호 (1 또는 2)
             difficulty (int): 탐색 깊이 (고정값: 3 - 최고 실력)
+            evaluator (str): 리프 노드 평가 방식
+                             'incremental' - 돌이 바뀐 윈도우만 갱신하는 증분 평가기
+                             'python' - evaluate_board 로 판 전체를 매번 평가
+                             'numpy' - NumPy 로 벡터화한 판 전체 평가 (NumPy 필요)
+                             'learned' - 자가 대국으로 학습한 가중치(eval_weights)의 증분 평가기
+            tt_memory_mb (float): 치환표 메모리 예산 (MB), None 또는 0이면 치환표 미사용
+            keep_tt (bool): get_best_move 호출 사이에 치환표를 유지할지 여부
+            move_generator (str): 후보 수 생성 방식
+                                  'neighborhood' - 돌 주변 빈칸을 위협 휴리스틱 순서로
+                                  'center' - 모든 빈칸을 중앙과의 거리 순서로
+            workers (int): 루트 후보를 나누어 탐색할 작업자 프로세스 수 (1이면 직렬 탐색, 작업자는 치환표 없이 탐색)
+            opening_book: 탐색 전에 찾아볼 개막 정석 (OpeningBook 또는 정석 파일 경로)
+            threat_nodes (int): 탐색 전에 실행하는 위협 공간 탐색(강제 승리/차단)의 수마다 전체 노드 예산,
+                                None 또는 0이면 사용하지 않음
+            tt_symmetry (bool): 치환표 키로 8가지 대칭 중 정규화한 해시를 사용할지 여부
+                                (대칭인 국면이 치환표 항목을 공유, 짝수 크기 판에서는 중앙 보너스가
+                                 완전히 대칭이 아니므로 점수가 조금 달라질 수 있음)
+            killer_history (bool): 킬러 수를 맨 앞으로 옮기고 히스토리 점수로 동점을 정할지 여부
+                                   (후보 수 생성기의 순서만으로도 충분한 얕은 탐색에서는 노드가 늘 수 있어 기본은 끔)
+            stats: 탐색 통계 수집 (True 또는 SearchStats), 수마다 self.stats.to_dict() 로 확인
+                   False 이면 탐색 코드를 전혀 감싸지 않으므로 추가 비용이 없음
+            eval_weights: evaluator='learned' 의 가중치 (learned_eval.PatternWeights 또는 파일 경로),
+                          None 이면 함께 배포하는 learned_weights.json (보드의 승리 길이가 4가 아니면
+                          그 길이의 손으로 정한 가중치)
+            solved_cache: 위협 공간 탐색 결과를 여러 대국/프로세스가 함께 쓰는 캐시
+                          (solved_cache.SolvedPositionCache 또는 SQLite 파일 경로), None 이면 사용 안 함
         """
         self.player = player_number
         self.opponent = 2 if player_number == 1 else 1
         self.max_depth = difficulty
+        self.evaluator = evaluator
+        self._evaluator = None  # get_best_move 탐색 중에만 설정되는 증분 평가기
+        self._evaluate_full = self.evaluate_board  # 증분 평가기가 없을 때의 리프 평가 함수
+        if evaluator == 'numpy':
+            # NumPy 는 이 평가 방식을 고른 경우에만 필요합니다
+            from numpy_eval import NumpyEvaluator
+            self._evaluate_full = NumpyEvaluator(player_number).evaluate
+        # 보드의 승리 길이마다 맞는 가중치를 처음 쓸 때 한 번 읽음 (get_eval_weights)
+        self.eval_weights = eval_weights
+        self._eval_weights = {}
+        if evaluator == 'learned':
+            if eval_weights is not None and not isinstance(eval_weights, str):
+                self._eval_weights[eval_weights.win_length] = eval_weights
+            self._evaluate_full = lambda board: (
+                self.get_eval_weights(board.win_length).evaluate(board, player_number))
+        self.move_generator = move_generator
+        self._candidates = None  # get_best_move 탐색 중에만 설정되는 후보 수 생성기
+        self.keep_tt = keep_tt
+        self.transposition_table = TranspositionTable(tt_memory_mb) if tt_memory_mb else None
+        if isinstance(opening_book, str):
+            opening_book = OpeningBook.load(opening_book)
+        self.opening_book = opening_book
+        self.threat_nodes = threat_nodes
+        self.threat_search_nodes = 0  # 마지막 위협 공간 탐색에서 쓴 노드 수
+        if isinstance(solved_cache, str):
+            solved_cache = SolvedPositionCache(solved_cache)
+        self.solved_cache = solved_cache
+        self.tt_symmetry = tt_symmetry
+        self._symmetry = None  # get_best_move 탐색 중에만 설정되는 대칭 해시 (tt_symmetry)
+        
+        # 탐색 상태와 통계
+        self.nodes = 0  # 이번 get_best_move 에서 방문한 노드 수
+        self.last_search_info = {}  # 마지막 get_best_move 의 탐색 깊이/노드 수/시간
+        self._deadline = None  # 반복 심화 탐색의 마감 시각 (time.perf_counter 기준)
+        self.stop_requested = False  # True 이면 반복 심화 탐색을 마감 전에 멈춤 (request_stop)
+        self.stop_flag = None  # 다른 프로세스가 세우는 중단 플래그 (병렬 탐색 작업자, multiprocessing.Value)
+        self._ply = 0  # 탐색 시작 국면으로부터 둔 수의 개수
+        self._pv = ()  # 이전 반복에서 찾은 주 변화 (수 순서 정렬용)
+        # 수순 깊이별 주 변화를 담는 삼각형 표: _pv_table[ply][ply:_pv_length[ply]] 가 ply 에서 시작하는 수순
+        # (노드마다 튜플을 새로 만들지 않도록 미리 할당하고, 더 좋은 수를 찾으면 자식의 수순을 복사)
+        self._pv_table = [[None] * (MAX_PLY + 2) for _ in range(MAX_PLY + 2)]
+        self._pv_length = [0] * (MAX_PLY + 2)
+        self._move_buffers = [[] for _ in range(MAX_PLY + 2)]  # 수순 깊이별로 다시 쓰는 후보 수 목록
+        self._board = None  # 탐색 중인 보드 (get_best_move 탐색 중에만 설정)
+        self._stack_base = 0  # 탐색 시작 시 보드 수 스택의 길이
+        
+        # 수 순서 정렬: 수순 깊이별 킬러 수 2개, 플레이어별 (row, col) -> 히스토리 점수
+        self.killer_history = killer_history
+        self.reset_move_ordering()
+        self.expanded_nodes = 0  # 자식 수를 탐색한 노드 수
+        self.cutoffs = 0  # 알파-베타 컷오프 수
+        self.first_move_cutoffs = 0  # 첫 번째 후보 수에서 일어난 컷오프 수
+        
+        # 탐색 통계 수집 (켠 경우에만 메서드들을 측정용 함수로 감쌈)
+        self.stats = None
+        if stats:
+            from search_stats import SearchStats
+            self.stats = stats if isinstance(stats, SearchStats) else SearchStats()
+            self.stats.attach(self)
+        
+        # 병렬 루트 탐색 (작업자들은 치환표만 끈 같은 설정의 직렬 AIPlayer 를 사용)
+        self.workers = workers
+        self.parallel = None
+        if workers > 1:
+            self.parallel = ParallelRootSearch(workers, {
+                'player_number': player_number,
+                'difficulty': difficulty,
+                'evaluator': evaluator,
+                'eval_weights': self.eval_weights,
+                'move_generator': move_generator,
+                'killer_history': killer_history,
+            })
         
     def evaluate_position(self, board, row, col, player, length):
         """
@@ -33,6 +153,8 @@ class AIPlayer:
             int: 해당 위치의 점수
         """
         score = 0
+        size = board.size
+        stones = board.stones  # 칸 번호 -> 플레이어 (Board/BitBoard 공통)
         directions = [(0, 1), (1, 0), (1, 1), (1, -1)]  # 가로, 세로, 대각선
         
         for dr, dc in directions:
@@ -45,8 +167,8 @@ class AIPlayer:
                     r = row + start * dr + i * dr
                     c = col + start * dc + i * dc
                     
-                    if 0 <= r < board.size and 0 <= c < board.size:
-                        window.append(board.board[r][c])
+                    if 0 <= r < size and 0 <= c < size:
+                        window.append(stones.get(r * size + c, 0))
                     else:
                         valid_window = False
                         break
@@ -58,10 +180,10 @@ class AIPlayer:
     
     def evaluate_window(self, window, player):
         """
-        4개 길이의 윈도우를 평가하여 점수를 반환합니다.
+        승리 조건 길이(기본 4개)의 윈도우를 평가하여 점수를 반환합니다.
         
         Args:
-            window (list): 4개 위치의 상태 리스트
+            window (list): 윈도우 위치들의 상태 리스트 (길이 = 승리에 필요한 연속 돌 수)
             player (int): 평가할 플레이어 번호
             
         Returns:
@@ -69,6 +191,7 @@ class AIPlayer:
         """
         score = 0
         opponent = 2 if player == 1 else 1
+        length = len(window)
         
         player_count = window.count(player)
         empty_count = window.count(0)
@@ -78,14 +201,14 @@ class AIPlayer:
         if opponent_count > 0:
             return 0
         
-        # 연속된 돌의 개수에 따른 점수
-        if player_count == 4:
+        # 연속된 돌의 개수에 따른 점수 (4목 기준: 4개, 3개, 2개, 1개)
+        if player_count == length:
             score += 1000  # 승리
-        elif player_count == 3 and empty_count == 1:
+        elif player_count == length - 1 and empty_count == 1:
             score += 100   # 3목
-        elif player_count == 2 and empty_count == 2:
+        elif player_count == length - 2 and empty_count == 2:
             score += 10    # 2목
-        elif player_count == 1 and empty_count == 3:
+        elif player_count == length - 3 and empty_count == 3 and player_count > 0:
             score += 1     # 1목
         
         return score
@@ -93,6 +216,7 @@ class AIPlayer:
     def evaluate_board(self, board):
         """
         전체 보드를 평가하여 점수를 반환합니다.
+        (빈 윈도우는 0점이므로 놓인 돌들을 지나는 윈도우만 평가)
         
         Args:
             board: 게임 보드
@@ -101,30 +225,47 @@ class AIPlayer:
             int: 보드의 전체 점수
         """
         score = 0
-        
-        # 모든 위치에 대해 평가
-        for row in range(board.size):
-            for col in range(board.size):
-                if board.board[row][col] != 0:
-                    player = board.board[row][col]
-                    position_score = self.evaluate_position(board, row, col, player, 4)
-                    
-                    if player == self.player:
-                        score += position_score
-                    else:
-                        score -= position_score
-        
-        # 중앙 근처에 더 높은 가중치 부여
         center = board.size // 2
-        for row in range(board.size):
-            for col in range(board.size):
-                if board.board[row][col] == self.player:
-                    distance_from_center = abs(row - center) + abs(col - center)
-                    score += max(0, 10 - distance_from_center)
+        
+        # 놓인 돌마다 그 돌을 지나는 윈도우들을 평가
+        for cell, player in board.stones.items():
+            row, col = divmod(cell, board.size)
+            position_score = self.evaluate_position(board, row, col, player, board.win_length)
+            
+            if player == self.player:
+                score += position_score
+                # 중앙 근처에 더 높은 가중치 부여
+                distance_from_center = abs(row - center) + abs(col - center)
+                score += max(0, 10 - distance_from_center)
+            else:
+                score -= position_score
         
         return score
     
-    def minimax(self, board, depth, alpha, beta, maximizing_player):
+    def make_move(self, board, row, col, player):
+        """
+        탐색 중 돌을 놓습니다. (보드의 수 스택에 쌓이고, 보드에 붙인 증분 평가기/후보 수 생성기/
+        대칭 해시가 함께 갱신됨)
+        
+        Args:
+            board: 게임 보드
+            row, col: 돌을 놓을 위치
+            player: 플레이어 번호
+        """
+        board.make_move(row, col, player)
+        self._ply += 1
+    
+    def unmake_move(self, board):
+        """
+        make_move 로 마지막에 놓은 돌을 되돌립니다.
+        
+        Args:
+            board: 게임 보드
+        """
+        board.unmake_move()
+        self._ply -= 1
+    
+    def minimax(self, board, depth, alpha, beta, maximizing_player, last_move=None):
         """
         미니맥스 알고리즘과 알파-베타 가지치기를 사용하여 최적의 수를 찾습니다.
         
@@ -134,65 +275,241 @@ class AIPlayer:
             alpha: 알파 값 (알파-베타 가지치기)
             beta: 베타 값 (알파-베타 가지치기)
             maximizing_player: 최대화 플레이어인지 여부
+            last_move: 이 국면을 만든 마지막 수 (row, col)
+                       주어지면 그 수 주변만 승리 확인, 없으면 판 전체를 확인
             
         Returns:
             int: 보드의 평가 점수
         """
+        # 시간 제한과 중단 요청 확인 (64 노드마다)
+        self.nodes += 1
+        if (self._deadline is not None and not self.nodes & 63 and
+                (self.stop_requested or time.perf_counter() > self._deadline or
+                 (self.stop_flag is not None and self.stop_flag.value))):
+            raise SearchTimeout()
+        
         # 종료 조건 확인
         if depth == 0:
-            return self.evaluate_board(board)
-        
-        # 승리 조건 확인
-        for row in range(board.size):
-            for col in range(board.size):
-                if board.board[row][col] != 0:
-                    player = board.board[row][col]
-                    if board.check_winner(row, col, player):
-                        if player == self.player:
-                            return 1000 + depth  # AI 승리
-                        else:
-                            return -1000 - depth  # AI 패배
+            if self._evaluator is not None:
+                return self._evaluator.score
+            return self._evaluate_full(board)
+        
+        # 치환표에서 같은 국면의 탐색 결과 확인
+        tt = self.transposition_table
+        if tt is not None:
+            key = self._symmetry.key() if self._symmetry is not None else board.hash
+            if maximizing_player:
+                key ^= SIDE_TO_MOVE_KEY
+            cached_score = tt.probe(key, depth, alpha, beta)
+            if cached_score is not None:
+                return cached_score
+            original_alpha, original_beta = alpha, beta
+        
+        # 승리 조건 확인 (직전 국면에는 승자가 없었으므로 마지막 수만 확인하면 충분)
+        if last_move is not None:
+            row, col = last_move
+            winner = board.stones[row * board.size + col]
+            if not board.check_winner(row, col, winner):
+                winner = None
+        else:
+            winner = board.find_winner()
+        if winner is not None:
+            if winner == self.player:
+                return WIN_SCORE + depth  # AI 승리 (빨리 이길수록 큼)
+            else:
+                return -WIN_SCORE - depth  # AI 패배
         
         # 무승부 확인
         if board.is_board_full():
             return 0
         
-        # 가능한 수들 중에서 중앙 근처부터 우선 탐색
-        empty_positions = board.get_empty_positions()
-        center = board.size // 2
-        empty_positions.sort(key=lambda pos: abs(pos[0] - center) + abs(pos[1] - center))
+        # 가능한 수들 중에서 탐색할 후보 선택 (탐색 범위 제한: 최대 20개)
+        ply = self._ply
+        if self._candidates is not None:
+            empty_positions = self._candidates.get_moves(20, self._move_buffers[ply])
+        else:
+            empty_positions = self.center_ordered_moves(board, 20)
+        
+        # 킬러 수와 히스토리 점수로 후보 순서 조정
+        if self.killer_history:
+            self.order_moves(empty_positions, ply,
+                             self.player if maximizing_player else self.opponent)
         
-        # 탐색 범위 제한 (성능 최적화)
-        if len(empty_positions) > 20:
-            empty_positions = empty_positions[:20]
+        # 이전 반복의 주 변화에 있는 수를 먼저 탐색
+        if ply < len(self._pv) and self._pv[ply] in empty_positions:
+            empty_positions.remove(self._pv[ply])
+            empty_positions.insert(0, self._pv[ply])
+        pv_length = self._pv_length
         
+        self.expanded_nodes += 1
         if maximizing_player:
             max_eval = -math.inf
-            for row, col in empty_positions:
-                board.place_stone(row, col, self.player)
-                eval_score = self.minimax(board, depth - 1, alpha, beta, False)
-                board.board[row][col] = 0  # 되돌리기
+            for index, move in enumerate(empty_positions):
+                pv_length[ply + 1] = ply + 1
+                self.make_move(board, move[0], move[1], self.player)
+                eval_score = self.minimax(board, depth - 1, alpha, beta, False, move)
+                self.unmake_move(board)  # 되돌리기
                 
+                if eval_score > max_eval:
+                    self.update_pv(ply, move)
                 max_eval = max(max_eval, eval_score)
                 alpha = max(alpha, eval_score)
                 if beta <= alpha:
+                    self.record_cutoff(ply, depth, self.player, move, index)
                     break  # 베타 컷오프
             
+            if tt is not None:
+                self.store_result(tt, key, depth, max_eval, original_alpha, original_beta)
             return max_eval
         else:
             min_eval = math.inf
-            for row, col in empty_positions:
-                board.place_stone(row, col, self.opponent)
-                eval_score = self.minimax(board, depth - 1, alpha, beta, True)
-                board.board[row][col] = 0  # 되돌리기
+            for index, move in enumerate(empty_positions):
+                pv_length[ply + 1] = ply + 1
+                self.make_move(board, move[0], move[1], self.opponent)
+                eval_score = self.minimax(board, depth - 1, alpha, beta, True, move)
+                self.unmake_move(board)  # 되돌리기
                 
+                if eval_score < min_eval:
+                    self.update_pv(ply, move)
                 min_eval = min(min_eval, eval_score)
                 beta = min(beta, eval_score)
                 if beta <= alpha:
+                    self.record_cutoff(ply, depth, self.opponent, move, index)
                     break  # 알파 컷오프
             
+            if tt is not None:
+                self.store_result(tt, key, depth, min_eval, original_alpha, original_beta)
             return min_eval
     
+    def update_pv(self, ply, move):
+        """
+        ply 의 주 변화를 move 와 방금 탐색한 자식(ply + 1)의 주 변화로 바꿉니다. (미리 할당한 표에 복사)
+        
+        Args:
+            ply: 탐색 시작 국면으로부터의 수순 깊이
+            move: ply 에서 둔 (row, col)
+        """
+        line = self._pv_table[ply]
+        child = self._pv_table[ply + 1]
+        end = self._pv_length[ply + 1]
+        line[ply] = move
+        for i in range(ply + 1, end):
+            line[i] = child[i]
+        self._pv_length[ply] = end
+    
+    def principal_variation(self, ply):
+        """
+        ply 에서 시작하는 현재 주 변화를 튜플로 반환합니다.
+        """
+        return tuple(self._pv_table[ply][ply:self._pv_length[ply]])
+    
+    def order_moves(self, moves, ply, player):
+        """
+        이 수순 깊이의 킬러 수들을 맨 앞으로 옮기고, 히스토리 점수는 같은 순서 값끼리의 동점 처리에만 씁니다.
+        (moves 를 직접 변경)
+        
+        후보 수 생성기의 순서(열린 줄의 위협 점수, 영향도)가 같은 수들만 히스토리 점수가 높은 순서로 바꾸고
+        나머지 순서는 그대로 둡니다. 생성기가 없으면('center') 히스토리 점수 순으로 정렬합니다.
+        
+        Args:
+            moves: (row, col) 후보 수 리스트
+            ply: 탐색 시작 국면으로부터의 수순 깊이
+            player: 둘 차례인 플레이어 번호
+        """
+        history = self._history[player]
+        if history:
+            generator = self._candidates
+            if generator is not None:
+                rank, unit, size = generator.rank, generator.unit, generator.size
+                moves.sort(key=lambda move: (rank[move[0] * size + move[1]] // unit, history.get(move, 0)),
+                           reverse=True)  # 안정 정렬이므로 둘 다 같으면 원래 순서 유지
+            else:
+                moves.sort(key=lambda move: -history.get(move, 0))
+        for killer in reversed(self._killers[ply]):
+            if killer is not None and killer in moves:
+                moves.remove(killer)
+                moves.insert(0, killer)
+    
+    def record_cutoff(self, ply, depth, player, move, index):
+        """
+        컷오프를 일으킨 수를 킬러 수와 히스토리 점수에 기록하고 컷오프 통계를 갱신합니다.
+        
+        Args:
+            ply: 컷오프가 일어난 수순 깊이
+            depth: 남은 탐색 깊이 (깊을수록 히스토리 점수를 크게 더함)
+            player: 컷오프를 일으킨 수를 둔 플레이어
+            move: 컷오프를 일으킨 (row, col)
+            index: 후보 목록에서 그 수의 순서 (0이면 첫 번째 수)
+        """
+        self.cutoffs += 1
+        if index == 0:
+            self.first_move_cutoffs += 1
+        if not self.killer_history:
+            return
+        killers = self._killers[ply]
+        if killers[0] != move:
+            killers[1] = killers[0]
+            killers[0] = move
+        history = self._history[player]
+        history[move] = history.get(move, 0) + depth * depth
+    
+    def reset_move_ordering(self):
+        """
+        킬러 수와 히스토리 점수를 비웁니다. (새 수를 탐색하기 전에 호출)
+        """
+        self._killers = [[None, None] for _ in range(MAX_PLY + 1)]
+        self._history = [None, {}, {}]
+    
+    def search_stats(self):
+        """
+        탐색의 컷오프 통계를 반환합니다.
+        
+        Returns:
+            dict: 자식을 탐색한 노드 수, 컷오프 수, 컷오프 비율, 첫 번째 수에서 일어난 컷오프 비율
+        """
+        return {
+            'expanded_nodes': self.expanded_nodes,
+            'cutoffs': self.cutoffs,
+            'cutoff_rate': self.cutoffs / self.expanded_nodes if self.expanded_nodes else 0.0,
+            'first_move_cutoff_rate': (self.first_move_cutoffs / self.cutoffs
+                                       if self.cutoffs else 0.0),
+        }
+    
+    def center_ordered_moves(self, board, limit):
+        """
+        모든 빈칸을 중앙과의 맨해튼 거리 순서로 정렬하여 앞에서부터 limit개를 반환합니다.
+        
+        Args:
+            board: 게임 보드
+            limit: 반환할 최대 후보 수
+            
+        Returns:
+            list: (row, col) 튜플들의 리스트
+        """
+        empty_positions = board.get_empty_positions()
+        center = board.size // 2
+        empty_positions.sort(key=lambda pos: abs(pos[0] - center) + abs(pos[1] - center))
+        return empty_positions[:limit]
+    
+    def store_result(self, tt, key, depth, score, alpha, beta):
+        """
+        노드의 탐색 결과를 탐색 창에 따라 정확한 값/하한/상한으로 구분하여 치환표에 저장합니다.
+        
+        Args:
+            tt: 치환표
+            key: 국면 해시 (차례 포함)
+            depth: 남은 탐색 깊이
+            score: 탐색 결과 점수
+            alpha, beta: 노드에 들어올 때의 탐색 창
+        """
+        if score <= alpha:
+            flag = UPPER_BOUND
+        elif score >= beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        tt.store(key, depth, score, flag)
+    
     def find_immediate_win_or_block(self, board):
         """
         즉시 승리할 수 있는 수나 상대방의 승리를 막는 수를 찾습니다.
@@ -203,73 +520,368 @@ class AIPlayer:
         Returns:
             tuple: (row, col) 또는 None
         """
-        empty_positions = board.get_empty_positions()
+        threats = ThreatSolver(board)
         
-        # 1. 즉시 승리할 수 있는 수 찾기
-        for row, col in empty_positions:
-            board.place_stone(row, col, self.player)
-            if board.check_winner(row, col, self.player):
-                board.board[row][col] = 0  # 되돌리기
-                return (row, col)
-            board.board[row][col] = 0  # 되돌리기
+        # 1. 즉시 승리할 수 있는 수 찾기 (3개가 놓인 윈도우의 빈칸만 확인)
+        wins = threats.winning_cells(self.player)
+        if wins:
+            return divmod(min(wins), board.size)
         
         # 2. 상대방의 승리를 막는 수 찾기
-        for row, col in empty_positions:
-            board.place_stone(row, col, self.opponent)
-            if board.check_winner(row, col, self.opponent):
-                board.board[row][col] = 0  # 되돌리기
-                return (row, col)
-            board.board[row][col] = 0  # 되돌리기
+        blocks = threats.winning_cells(self.opponent)
+        if blocks:
+            return divmod(min(blocks), board.size)
         
         return None
     
-    def get_best_move(self, board):
+    def find_threat_move(self, board):
+        """
+        위협 공간 탐색으로 강제 승리 수나 상대의 강제 승리를 막는 수를 찾습니다.
+        
+        1. AI 가 위협(다음 수에 승리 길이가 되는 칸)을 연속으로 만들어 이기는 수순이 있으면 그 첫 수
+        2. 상대에게 그런 수순이 있으면, 그 수순에 나오는 칸 중 두었을 때 상대의 강제 승리가
+           사라지는 칸
+        
+        solved_cache 가 있으면 먼저 찾아보고, 없으면 풀어서 결과를 저장합니다.
+        
+        Args:
+            board: 게임 보드
+            
+        Returns:
+            tuple: (row, col) 또는 None (강제 수순이 없거나 노드 예산 안에 찾지 못함)
+        """
+        cache = self.solved_cache
+        if cache is not None:
+            cached = cache.lookup(board, self.player, self.threat_nodes)
+            if cached is not None:
+                return cached[1]
+        outcome, move = self.solve_threats(board)
+        if cache is not None:
+            cache.store(board, self.player, outcome, move, self.threat_nodes)
+        return move
+    
+    def solve_threats(self, board):
+        """
+        위협 공간 탐색을 실행합니다. (find_threat_move 참고)
+        
+        자신의 강제 승리, 상대의 강제 승리, 막는 수 후보마다의 확인이 모두 탐색기 하나의
+        노드 예산(threat_nodes)을 함께 쓰므로 전체 작업량이 threat_nodes 를 넘지 않습니다.
+        사용한 노드 수는 self.threat_search_nodes 에 기록됩니다.
+        
+        Returns:
+            tuple: (solved_cache.OUTCOME_* 결과, (row, col) 또는 None)
+        """
+        solver = ThreatSolver(board, self.threat_nodes)
+        try:
+            line = solver.find_win(self.player)
+            if line:
+                return OUTCOME_WIN, line[0]
+            
+            line = solver.find_win(self.opponent)
+            if not line:
+                return OUTCOME_NONE, None
+            for row, col in dict.fromkeys(line):
+                cell = row * board.size + col
+                solver.place(cell, self.player)
+                refuted = solver.find_win(self.opponent) is None and not solver.exhausted
+                solver.remove(cell)
+                if refuted:
+                    return OUTCOME_DEFENDED, (row, col)
+                if solver.exhausted:
+                    break  # 예산을 다 써서 남은 후보는 확인할 수 없음
+            return OUTCOME_LOST, None
+        finally:
+            self.threat_search_nodes = solver.nodes
+    
+    def get_eval_weights(self, win_length):
+        """
+        evaluator='learned' 에서 승리 길이 win_length 인 보드에 쓸 가중치를 반환합니다.
+        
+        Raises:
+            ValueError: 직접 넘긴 eval_weights 의 윈도우 길이가 win_length 와 다를 때
+        """
+        weights = self._eval_weights.get(win_length)
+        if weights is None:
+            from learned_eval import get_weights
+            weights = self._eval_weights[win_length] = get_weights(self.eval_weights, win_length)
+        return weights
+    
+    def _start_search(self, board):
+        """
+        board 에서 탐색할 수 있도록 증분 평가기와 후보 수 생성기를 보드에 붙입니다.
+        (보드를 복사하지 않고 make_move/unmake_move 로 두고 되돌리며 탐색)
+        """
+        self._board = board
+        self._stack_base = len(board.move_stack)
+        if self.evaluator in ('incremental', 'learned'):
+            weights = self.get_eval_weights(board.win_length) if self.evaluator == 'learned' else None
+            self._evaluator = IncrementalEvaluator(board, self.player, weights)
+            board.attach(self._evaluator)
+        if self.move_generator == 'neighborhood':
+            self._candidates = CandidateGenerator(board)
+            board.attach(self._candidates)
+        if self.tt_symmetry and self.transposition_table is not None:
+            self._symmetry = SymmetricKeys.from_board(board)
+            board.attach(self._symmetry)
+    
+    def _end_search(self):
+        """
+        시간 초과나 중단으로 탐색이 멈췄으면 둔 수들을 되돌려 보드를 탐색 전 상태로 만들고,
+        _start_search 로 붙인 탐색 상태를 뗍니다.
+        """
+        board = self._board
+        if board is not None:
+            board.undo_to(self._stack_base)
+            for listener in (self._evaluator, self._candidates, self._symmetry):
+                if listener is not None:
+                    board.detach(listener)
+        self._board = None
+        self._evaluator = None
+        self._candidates = None
+        self._symmetry = None
+        self._deadline = None
+        self._ply = 0
+    
+    def search_move(self, board, move, depth, alpha=-math.inf, pv=(), deadline=None):
+        """
+        루트 수 하나를 탐색합니다. (병렬 탐색 작업자의 작업 단위, 끝나면 board 는 원래 상태로 돌아옴)
+        
+        Args:
+            board: 탐색용 보드
+            move: 탐색할 루트 수 (row, col)
+            depth: 탐색 깊이 (루트 수 포함)
+            alpha: 탐색 창의 하한
+            pv: 수 순서 정렬에 사용할 이전 반복의 주 변화
+            deadline: 마감 시각 (time.perf_counter 기준)
+            
+        Returns:
+            tuple: (점수, 주 변화 수순)
+        """
+        self.nodes = 0
+        self.expanded_nodes = self.cutoffs = self.first_move_cutoffs = 0
+        self._pv = pv
+        self._start_search(board)
+        self._deadline = deadline
+        try:
+            row, col = move
+            self._pv_length[1] = 1
+            self.make_move(board, row, col, self.player)
+            score = self.minimax(board, depth - 1, alpha, math.inf, False, move)
+            return score, (move,) + self.principal_variation(1)
+        finally:
+            self._end_search()
+    
+    def run_iteration(self, board, candidates, depth):
+        """
+        루트 탐색 한 번을 실행합니다. (작업자가 있으면 병렬, 없으면 직렬)
+        
+        Returns:
+            tuple: (최선의 수, 점수, 주 변화 수순)
+        """
+        if self.parallel is not None and len(candidates) > 1:
+            return self.parallel_search_root(board, candidates, depth)
+        return self.search_root(board, candidates, depth)
+    
+    def parallel_search_root(self, board, candidates, depth):
+        """
+        첫 번째 후보를 직접 탐색하여 알파 값을 정한 뒤(Young Brothers Wait),
+        나머지 후보들을 작업자 프로세스들에게 나누어 탐색합니다.
+        
+        Returns:
+            tuple: (최선의 수, 점수, 주 변화 수순) - 같은 깊이의 직렬 탐색과 같은 수
+        """
+        best_move, best_score, best_pv = self.search_root(board, candidates[:1], depth)
+        
+        results = self.parallel.search(board, candidates[1:], depth, best_score,
+                                       self._pv, self._deadline)
+        timed_out = False
+        for move, (score, line, nodes) in zip(candidates[1:], results):
+            self.nodes += nodes
+            if score is None:
+                timed_out = True
+            elif score > best_score:
+                best_move, best_score, best_pv = move, score, line
+        
+        if timed_out:
+            raise SearchTimeout()
+        return best_move, best_score, best_pv
+    
+    def request_stop(self):
+        """
+        진행 중인 반복 심화 탐색을 멈추도록 요청합니다. (다른 스레드에서 호출 가능)
+        
+        get_best_move 는 진행 중인 반복을 버리고 마지막으로 끝까지 탐색한 깊이의 수를 반환합니다.
+        (고정 깊이 탐색이면 깊이 1 탐색의 수)
+        깊이 1 반복은 멈추지 않으므로 항상 둘 수를 반환합니다. 다음 탐색 전에
+        stop_requested 를 False 로 되돌려야 합니다. 병렬 탐색 작업자들에게도 중단 요청을 전달합니다.
+        """
+        self.stop_requested = True
+        if self.parallel is not None:
+            self.parallel.request_stop()
+    
+    def close(self):
+        """
+        병렬 탐색 작업자 프로세스를 종료합니다.
+        """
+        if self.parallel is not None:
+            self.parallel.close()
+    
+    def search_root(self, board, candidates, depth):
+        """
+        루트 후보 수들을 주어진 깊이로 탐색합니다.
+        
+        지금까지 찾은 최고 점수를 다음 후보의 알파 값으로 넘겨, 더 나쁜 후보는 정확한 점수 대신
+        그 이하라는 것만 확인하고 가지치기합니다. (동점이면 앞선 후보를 고르므로 고르는 수는 같음)
+        
+        Args:
+            board: 탐색용 보드 (후보 수를 두고 되돌림)
+            candidates: 탐색할 (row, col) 후보 목록 (앞쪽이 동점일 때 우선)
+            depth: 탐색 깊이 (루트 수 포함)
+            
+        Returns:
+            tuple: (최선의 수, 점수, 주 변화 수순)
+        """
+        best_move = None
+        best_score = -math.inf
+        best_pv = ()
+        
+        for row, col in candidates:
+            self._pv_length[1] = 1
+            self.make_move(board, row, col, self.player)
+            score = self.minimax(board, depth - 1,
+                                 best_score, math.inf, False, (row, col))
+            self.unmake_move(board)
+            
+            if score > best_score:
+                best_score = score
+                best_move = (row, col)
+                best_pv = ((row, col),) + self.principal_variation(1)
+        
+        return best_move, best_score, best_pv
+    
+    def get_best_move(self, board, time_limit=None, max_depth=None):
         """
         현재 보드 상태에서 최적의 수를 반환합니다.
         
+        time_limit 이 주어지면 깊이 1, 2, 3, ... 순서로 반복 심화 탐색을 하다가
+        마감 시각이 지나면 마지막으로 끝까지 탐색한 깊이의 최선의 수를 반환합니다.
+        개막 정석이 있으면 탐색 전에 먼저 찾아보고, 정석에 있는 국면이면 탐색 없이 바로 둡니다.
+        탐색 깊이와 노드 수는 last_search_info 에 기록됩니다.
+        
         Args:
             board: 게임 보드
+            time_limit (float): 수당 시간 제한 (초), None이면 difficulty 깊이로 고정 탐색
+            max_depth (int): 반복 심화 탐색의 최대 깊이 (None이면 남은 빈칸 수와 MAX_PLY 중 작은 값까지)
             
         Returns:
             tuple: (row, col) 최적의 위치
         """
+        start_time = time.perf_counter()
+        self.nodes = 0
+        self.expanded_nodes = self.cutoffs = self.first_move_cutoffs = 0
+        self.reset_move_ordering()
+        self._ply = 0
+        self._pv = ()
+        self.last_search_info = {'depth': 0, 'nodes': 0, 'time': 0.0, 'pv': [],
+                                 **self.search_stats()}
+        
+        # 초반 국면이면 정석에서 찾아 탐색 없이 둠
+        if self.opening_book is not None:
+            book_move = self.opening_book.lookup(board, self.player)
+            if book_move is not None:
+                return book_move
+        
+        # 치환표 준비 (유지하지 않으면 이전 수의 결과를 비움, 통계는 수마다 새로 집계)
+        if self.transposition_table is not None:
+            if self.keep_tt:
+                self.transposition_table.reset_stats()
+            else:
+                self.transposition_table.clear()
+            self.transposition_table.new_search()
+        
         # 1. 즉시 승리하거나 상대방을 막는 수가 있는지 확인
         immediate_move = self.find_immediate_win_or_block(board)
         if immediate_move:
             return immediate_move
         
         # 2. 미니맥스 알고리즘으로 최적의 수 찾기
-        empty_positions = board.get_empty_positions()
-        
-        if not empty_positions:
+        # (빈칸 목록을 만들지 않고 놓인 돌 수로 판단하여 큰 판에서도 돌 수에 비례)
+        if len(board.stones) == board.size * board.size:
             return None
         
         # 첫 번째 수는 중앙 근처에서 시작
-        if len(empty_positions) == board.size * board.size:
+        if not board.stones:
             center = board.size // 2
             return (center, center)
         
-        # 중앙 근처부터 우선 탐색
-        center = board.size // 2
-        empty_positions.sort(key=lambda pos: abs(pos[0] - center) + abs(pos[1] - center))
-        
-        # 탐색 범위 제한 (성능 최적화)
-        if len(empty_positions) > 15:
-            empty_positions = empty_positions[:15]
+        # 위협만으로 이어지는 강제 승리 수순이 있으면 그 수를 두고, 상대의 강제 승리는 막음
+        if self.threat_nodes:
+            threat_move = self.find_threat_move(board)
+            if threat_move is not None:
+                return threat_move
         
         best_move = None
-        best_score = -math.inf
-        
-        for row, col in empty_positions:
-            # 보드 복사본에서 테스트
-            test_board = board.copy()
-            test_board.place_stone(row, col, self.player)
-            
-            score = self.minimax(test_board, self.max_depth - 1, 
-                               -math.inf, math.inf, False)
-            
-            if score > best_score:
-                best_score = score
-                best_move = (row, col)
+        completed_depth = 0
+        
+        # 보드를 복사하지 않고 같은 보드에서 수를 두고 되돌리며 테스트
+        # (탐색이 끝나거나 멈추면 _end_search 가 보드를 원래 상태로 되돌림)
+        self._start_search(board)
+        if self.parallel is not None:
+            self.parallel.new_search()
+            if self.stop_requested:
+                # 되돌리지 않은 중단 요청은 작업자들에게도 유지
+                self.parallel.request_stop()
+        
+        # 탐색할 루트 후보 선택 (탐색 범위 제한: 최대 15개)
+        if self._candidates is not None:
+            empty_positions = self._candidates.get_moves(15)
+        else:
+            empty_positions = self.center_ordered_moves(board, 15)
+        
+        try:
+            if time_limit is None:
+                # 시간 제한 없이 중단 요청만 확인 (멈추면 깊이 1 탐색 결과를 사용)
+                self._deadline = math.inf
+                try:
+                    best_move, best_score, self._pv = self.run_iteration(
+                        board, empty_positions, self.max_depth)
+                    completed_depth = self.max_depth
+                except SearchTimeout:
+                    board.undo_to(self._stack_base)
+                    self._ply = 0
+                    self._deadline = None
+                    best_move, best_score, self._pv = self.run_iteration(board, empty_positions, 1)
+                    completed_depth = 1
+            else:
+                deadline = start_time + time_limit
+                # 루트 후보 수(최대 15개)가 아니라 판에 남은 빈칸 수로 제한
+                depth_limit = min(max_depth or MAX_PLY, MAX_PLY, board.size * board.size - len(board.stones))
+                candidates = empty_positions
+                for depth in range(1, depth_limit + 1):
+                    # 깊이 1은 시간과 관계없이 끝까지 탐색하여 항상 둘 수를 확보
+                    self._deadline = deadline if depth > 1 else None
+                    try:
+                        move, best_score, pv = self.run_iteration(board, candidates, depth)
+                    except SearchTimeout:
+                        break  # 중단된 반복의 결과는 버리고 이전 반복의 수를 사용
+                    best_move, self._pv, completed_depth = move, pv, depth
+                    
+                    # 이전 반복의 최선의 수를 루트에서 가장 먼저 탐색
+                    candidates = [move] + [pos for pos in empty_positions if pos != move]
+                    
+                    # 승패가 확정되었거나, 남은 시간으로 다음 깊이를 끝내기 어렵거나, 중단 요청이 있으면 멈춤
+                    elapsed = time.perf_counter() - start_time
+                    if abs(best_score) >= WIN_THRESHOLD or elapsed > time_limit / 2 or self.stop_requested:
+                        break
+        finally:
+            self._end_search()
+        
+        self.last_search_info = {
+            'depth': completed_depth,
+            'nodes': self.nodes,
+            'time': time.perf_counter() - start_time,
+            'pv': list(self._pv),
+            **self.search_stats(),
+        }
         
         return best_move if best_move else random.choice(empty_positions)
@@ -0,0 +1,69 @@
+"""
+여러 보드 일괄 평가 API(evaluate_boards, check_winners) 일치 확인과 처리량 측정
+1. 무작위 보드에서 AIPlayer.evaluate_board, Board.find_winner 와 결과가 같은지 확인합니다.
+2. 보드 수를 늘려 가며 초당 처리 보드 수를 측정합니다.
+
+NumPy 가 필요합니다.
+
+사용법:
+    python3 bench_batch.py [--boards 300] [--batch 1000 10000 50000]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from ai_player import AIPlayer
+from bench_numpy import random_boards
+from numpy_eval import boards_to_array, check_winners, evaluate_boards
+
+
+def verify_equivalence(boards):
+    """
+    일괄 평가 점수와 승자가 보드 하나씩 계산한 값과 같은지 확인합니다.
+    작은 chunk_size 로도 실행하여 나누어 처리하는 경계도 확인합니다.
+    """
+    grids = boards_to_array(boards)
+    for player in (1, 2):
+        expected = [AIPlayer(player).evaluate_board(board) for board in boards]
+        assert evaluate_boards(grids, player).tolist() == expected
+        assert evaluate_boards(grids, player, chunk_size=7).tolist() == expected
+
+    expected = [board.find_winner() or 0 for board in boards]
+    assert check_winners(grids).tolist() == expected
+    assert check_winners(grids, chunk_size=7).tolist() == expected
+
+
+def throughput(function, grids, repeat=3):
+    """
+    function(grids) 의 초당 처리 보드 수를 반환합니다. (repeat 번 중 가장 빠른 값)
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(grids)
+        best = min(best, time.perf_counter() - start)
+    return len(grids) / best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--boards", type=int, default=300)
+    parser.add_argument("--batch", type=int, nargs="+", default=[1000, 10000, 50000])
+    args = parser.parse_args()
+
+    boards = random_boards(args.boards)
+    verify_equivalence(boards)
+    print(f"일괄 평가/승자 판정 일치 확인 완료 ({len(boards)}개 보드)")
+
+    base = boards_to_array(boards)
+    for batch in args.batch:
+        grids = base[np.arange(batch) % len(base)]
+        eval_rate = throughput(lambda g: evaluate_boards(g, 2), grids)
+        winner_rate = throughput(check_winners, grids)
+        print(f"N={batch:>6}: evaluate_boards {eval_rate:>10,.0f}보드/s, "
+              f"check_winners {winner_rate:>10,.0f}보드/s")
+
+
+if __name__ == "__main__":
+    main()
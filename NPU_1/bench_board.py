@@ -0,0 +1,153 @@
+"""
+Board(리스트) 백엔드와 BitBoard(비트보드) 백엔드의 성능 비교 벤치마크
+같은 중반 국면들에서 고정 깊이 AIPlayer.get_best_move 를 실행하여 초당 탐색 노드 수를 측정하고
+(두 백엔드가 같은 수를 고르는지 확인), 돌 놓기/승리 확인/되돌리기와 판 전체 승자 검사의 처리량을 비교합니다.
+
+사용법:
+    python3 bench_board.py [--depth 3] [--positions 10] [--stones 12] [--rounds 3]
+"""
+import argparse
+import random
+import time
+
+from ai_player import AIPlayer
+from bitboard import BitBoard
+from board import Board
+
+
+def make_positions(count, stones, size=20, seed=0):
+    """
+    중앙 부근에 돌이 흩어진 중반 국면의 수순들을 만듭니다. (승자가 없는 국면만)
+
+    Returns:
+        list: [(row, col, player), ...] 수순들의 리스트
+    """
+    rng = random.Random(seed)
+    positions = []
+    while len(positions) < count:
+        board = Board(size)
+        moves = []
+        player = board.PLAYER1
+        center = size // 2
+        while len(moves) < stones:
+            row = center + rng.randint(-4, 4)
+            col = center + rng.randint(-4, 4)
+            if not board.place_stone(row, col, player):
+                continue
+            if board.check_winner(row, col, player):
+                break
+            moves.append((row, col, player))
+            player = 3 - player
+        if len(moves) == stones:
+            positions.append(moves)
+    return positions
+
+
+def build_board(board_class, moves, size=20):
+    """
+    수순을 주어진 백엔드의 보드에 재현합니다.
+    """
+    board = board_class(size)
+    for row, col, player in moves:
+        board.place_stone(row, col, player)
+    return board
+
+
+def verify_backends(positions, size=20):
+    """
+    두 백엔드가 같은 국면에서 같은 결과를 내는지 확인합니다.
+    """
+    for moves in positions:
+        list_board = build_board(Board, moves, size)
+        bit_board = build_board(BitBoard, moves, size)
+        assert list_board.get_empty_positions() == bit_board.get_empty_positions()
+        assert list_board.find_winner() == bit_board.find_winner()
+        assert list_board.board == bit_board.board
+        for row in range(size):
+            assert list_board.row_values(row) == bit_board.row_values(row)
+            for col in range(size):
+                for player in (1, 2):
+                    assert (list_board.check_winner(row, col, player) ==
+                            bit_board.check_winner(row, col, player))
+
+
+def bench_search(board_class, positions, depth):
+    """
+    각 국면에서 고정 깊이 get_best_move(증분 평가, 후보 수 생성기)를 실행하고
+    (고른 수 목록, 노드 수, 소요 시간)을 반환합니다. 위협 공간 탐색은 끄고 미니맥스만 측정합니다.
+    """
+    ai = AIPlayer(2, depth, threat_nodes=0)
+    moves_played = []
+    nodes = 0
+    start = time.perf_counter()
+    for moves in positions:
+        board = build_board(board_class, moves)
+        moves_played.append(ai.get_best_move(board))
+        nodes += ai.nodes
+    return moves_played, nodes, time.perf_counter() - start
+
+
+def bench_primitives(board_class, positions, repeat=200):
+    """
+    탐색에서 쓰는 돌 놓기+되돌리기(make_move, unmake_move), 승리 확인(check_winner),
+    판 전체 승자 검사(find_winner)의 초당 처리량을 측정합니다.
+
+    Returns:
+        tuple: (make+unmake 초당 횟수, check_winner 초당 횟수, find_winner 초당 횟수)
+    """
+    boards = [build_board(board_class, moves) for moves in positions]
+    cells = [board.get_empty_positions()[:40] for board in boards]
+    operations = sum(len(empty) for empty in cells) * repeat
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for board, empty in zip(boards, cells):
+            for row, col in empty:
+                board.make_move(row, col, 1)
+                board.unmake_move()
+    move_rate = operations / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for board, empty in zip(boards, cells):
+            for row, col in empty:
+                board.check_winner(row, col, 1)
+    check_rate = operations / (time.perf_counter() - start)
+
+    scans = 0
+    start = time.perf_counter()
+    for _ in range(repeat * 10):
+        for board in boards:
+            board.find_winner()
+            scans += 1
+    return move_rate, check_rate, scans / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--positions", type=int, default=10)
+    parser.add_argument("--stones", type=int, default=12)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    positions = make_positions(args.positions, args.stones)
+    verify_backends(positions)
+    print("백엔드 결과 일치 확인 완료")
+
+    # 측정 환경의 잡음을 줄이도록 두 백엔드를 번갈아 rounds 번 측정하여 가장 좋은 값을 사용
+    best = {}
+    played = {}
+    for _ in range(args.rounds):
+        for name, board_class in (("list", Board), ("bitboard", BitBoard)):
+            played[name], nodes, elapsed = bench_search(board_class, positions, args.depth)
+            rates = (nodes / elapsed,) + bench_primitives(board_class, positions, repeat=20)
+            best[name] = tuple(map(max, zip(best.get(name, rates), rates)))
+    assert played["list"] == played["bitboard"]
+
+    for name, (node_rate, move_rate, check_rate, scan_rate) in best.items():
+        print(f"{name:>8}: {node_rate:,.0f} nodes/s ({nodes} nodes), make+unmake {move_rate:,.0f} ops/s, "
+              f"check_winner {check_rate:,.0f} ops/s, find_winner {scan_rate:,.0f} scans/s")
+
+if __name__ == "__main__":
+    main()
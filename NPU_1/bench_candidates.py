@@ -0,0 +1,92 @@
+"""
+후보 수 생성 방식 비교 벤치마크
+'center'(모든 빈칸을 중앙 거리 순 정렬)와 'neighborhood'(돌 주변 빈칸을 영향도 순 정렬)의
+노드당 비용과 수당 시간을 비교하고, 중앙에서 먼 곳의 전술을 찾는지 확인합니다.
+
+사용법:
+    python3 bench_candidates.py [--positions 5] [--depth 3]
+"""
+import argparse
+import random
+import time
+
+from ai_player import AIPlayer
+from bench_board import build_board
+from bench_terminal import quiet_positions
+from board import Board
+from candidates import CandidateGenerator
+
+
+def verify_incremental(trials=100, size=20, seed=0):
+    """
+    무작위 돌 놓기/되돌리기 후의 후보 목록과 칸별 정렬 값, 윈도우 상태가 처음부터 새로 만든 것과 같은지 확인합니다.
+    """
+    rng = random.Random(seed)
+    for _ in range(trials):
+        board = Board(size)
+        generator = CandidateGenerator(board)
+        history = []
+        for _ in range(rng.randint(1, 60)):
+            if history and rng.random() < 0.3:
+                row, col, player = history.pop()
+                board.remove_stone(row, col)
+                generator.unmake(row, col, player)
+            else:
+                row, col, player = rng.randrange(size), rng.randrange(size), rng.choice((1, 2))
+                if not board.place_stone(row, col, player):
+                    continue
+                generator.make(row, col, player)
+                history.append((row, col, player))
+            fresh = CandidateGenerator(board)
+            assert generator.get_moves() == fresh.get_moves()
+            assert generator.rank == fresh.rank and generator.window_states == fresh.window_states
+
+
+def edge_tactic_board():
+    """
+    AI(백돌)가 구석(2행)에 열린 2목을 가진 국면을 만듭니다.
+    (2, 2) 또는 (2, 5)에 두면 양쪽이 열린 3목이 되어 상대가 막을 수 없습니다.
+    """
+    board = Board(20)
+    for row, col, player in [(10, 10, 1), (2, 3, 2), (10, 12, 1), (2, 4, 2), (12, 9, 1)]:
+        board.place_stone(row, col, player)
+    return board
+
+
+def bench(generator, positions, depth):
+    """
+    각 국면에서 get_best_move 를 실행하고 (수당 시간, 초당 노드 수)를 반환합니다.
+    """
+    ai = AIPlayer(2, depth, move_generator=generator)
+    nodes = 0
+    start = time.perf_counter()
+    for position in positions:
+        ai.get_best_move(build_board(Board, position))
+        nodes += ai.nodes
+    elapsed = time.perf_counter() - start
+    return elapsed / len(positions), nodes / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--positions", type=int, default=5)
+    parser.add_argument("--stones", type=int, default=12)
+    parser.add_argument("--depth", type=int, default=3)
+    args = parser.parse_args()
+
+    verify_incremental()
+    print("증분 후보 목록 일치 확인 완료")
+
+    positions = quiet_positions(args.positions, args.stones)
+    for generator in ("center", "neighborhood"):
+        per_move, rate = bench(generator, positions, args.depth)
+        # 후보 수 생성기가 전술 수를 찾는지 보도록 위협 공간 탐색은 끔
+        move = AIPlayer(2, args.depth, move_generator=generator,
+                        threat_nodes=0).get_best_move(edge_tactic_board())
+        found = move in [(2, 2), (2, 5)]
+        print(f"{generator:>12}: {per_move:.3f}s/수, {rate:,.0f} nodes/s, "
+              f"구석 열린 3목 만들기 {'발견' if found else '놓침'} {move}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+비동기 엔진(engine.py) 확인과 벤치마크
+1. 시간 제한 없는 백그라운드 탐색이 동기 get_best_move(고정 깊이)와 같은 수를 고르는지,
+   시간 제한 없는 예측 탐색이 적중했을 때도 새로 탐색한 것과 같은 수인지 확인합니다.
+2. 끝없이 반복 심화하는 탐색을 stop 으로 멈추기까지 걸리는 시간(중단 지연)과 멈춘 깊이를 측정하고,
+   고정 깊이 탐색도 멈출 수 있는지 확인합니다.
+   예측 탐색을 멈추려고 건 타이머가 탐색이 끝나면 정리되는지도 확인합니다.
+3. 예측 탐색: AI 가 둔 뒤 주 변화의 응수를 예측해 두고, 예측이 맞았을 때 respond 가
+   기다리는 시간과 새로 탐색할 때의 시간을 비교합니다.
+
+사용법:
+    python3 bench_engine.py [--positions 10] [--stones 4] [--depth 3] [--ponder-time 1.0]
+"""
+import argparse
+import asyncio
+import math
+import time
+
+from ai_player import AIPlayer
+from bench_board import build_board
+from bench_terminal import quiet_positions
+from board import Board
+from engine import AsyncEngine
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--positions", type=int, default=10)
+    parser.add_argument("--stones", type=int, default=4)
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--stop-after", type=float, default=0.3)
+    parser.add_argument("--ponder-time", type=float, default=1.0)
+    args = parser.parse_args()
+
+    positions = quiet_positions(args.positions, args.stones)
+    boards = [build_board(Board, position) for position in positions]
+
+    # 1. 동기 탐색과 같은 수
+    sync_moves = [AIPlayer(2, args.depth).get_best_move(board) for board in boards]
+    engine = AsyncEngine(AIPlayer(2, args.depth))
+    async_moves = [engine.start(board).result() for board in boards]
+    assert async_moves == sync_moves
+
+    async def search_all():
+        return [await engine.search(board) for board in boards]
+    assert asyncio.run(search_all()) == sync_moves
+
+    for board in boards:
+        move = engine.start(board).result()
+        after = board.copy()
+        after.place_stone(move[0], move[1], 2)
+        if not engine.ponder(after, engine.current.info['pv']):
+            continue
+        reply = engine.ponder_move
+        after.place_stone(reply[0], reply[1], 1)
+        assert engine.respond(after, reply).result() == AIPlayer(2, args.depth).get_best_move(after)
+    print(f"동기 탐색과 같은 수 확인 완료 ({len(boards)}개 국면, 깊이 {args.depth}, 예측 탐색 포함)")
+
+    # 2. 중단 지연
+    latencies = []
+    depths = []
+    for board in boards:
+        handle = engine.start(board, time_limit=math.inf, max_depth=50)
+        time.sleep(args.stop_after)
+        start = time.perf_counter()
+        move = handle.stop()
+        latencies.append(time.perf_counter() - start)
+        depths.append(handle.info['depth'])
+        assert board.is_valid_move(*move)
+    print(f"중단 지연: 평균 {sum(latencies) / len(latencies) * 1e3:.1f}ms, "
+          f"최대 {max(latencies) * 1e3:.1f}ms ({args.stop_after}s 뒤 멈춘 깊이 {depths})")
+
+    deep = AsyncEngine(AIPlayer(2, 8))
+    handle = deep.start(boards[0])
+    time.sleep(args.stop_after)
+    start = time.perf_counter()
+    move = handle.stop()
+    assert boards[0].is_valid_move(*move) and handle.info['depth'] == 1
+    deep.close()
+    print(f"고정 깊이 8 탐색 중단 확인 완료 ({(time.perf_counter() - start) * 1e3:.1f}ms, 깊이 1 탐색의 수 사용)")
+
+    # 3. 예측 탐색 적중/미적중
+    hit_waits = []
+    miss_waits = []
+    for board in boards:
+        move = engine.start(board, time_limit=args.ponder_time).result()
+        pv = engine.current.info['pv']
+        after = board.copy()
+        after.place_stone(move[0], move[1], 2)
+        if not engine.ponder(after, pv, args.ponder_time):
+            continue
+        reply = engine.ponder_move
+        time.sleep(args.ponder_time)  # 사람이 생각하는 시간 동안 미리 탐색
+        after.place_stone(reply[0], reply[1], 1)
+        start = time.perf_counter()
+        handle = engine.respond(after, reply, args.ponder_time)
+        handle.result()
+        hit_wait = time.perf_counter() - start
+        assert engine._timer is None or engine._timer.finished.wait(1)  # 타이머 정리
+
+        start = time.perf_counter()
+        handle = engine.start(after, time_limit=args.ponder_time)
+        handle.result()
+        if handle.info['depth'] == 0:
+            continue  # 즉시 승리/차단이나 강제 수순으로 탐색 없이 정해진 국면은 제외
+        hit_waits.append(hit_wait)
+        miss_waits.append(time.perf_counter() - start)
+    engine.close()
+    if hit_waits:
+        print(f"예측 적중 시 대기 {sum(hit_waits) / len(hit_waits):.3f}s/수, "
+              f"새로 탐색 {sum(miss_waits) / len(miss_waits):.3f}s/수 "
+              f"({len(hit_waits)}개 국면, 적중 {engine.ponder_hits}회)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+증분 평가기(IncrementalEvaluator)의 정확성 확인과 성능 비교 벤치마크
+1. 무작위 돌 놓기/되돌리기 수순에서 evaluate_board 와 점수가 항상 같은지 확인합니다.
+2. 같은 중반 국면에서 get_best_move 를 전체 재평가/증분 평가로 실행하여 시간을 비교합니다.
+
+사용법:
+    python3 bench_eval.py [--trials 200] [--positions 5] [--depth 3]
+"""
+import argparse
+import random
+import time
+
+from ai_player import AIPlayer
+from bench_board import build_board, make_positions
+from board import Board
+from evaluator import IncrementalEvaluator
+
+
+def verify_equivalence(trials, size=20, seed=0):
+    """
+    무작위 수순에서 증분 점수와 evaluate_board 점수가 같은지 확인합니다.
+
+    Returns:
+        int: 비교한 국면 수
+    """
+    rng = random.Random(seed)
+    checked = 0
+    for trial in range(trials):
+        ai_player = rng.choice((1, 2))
+        ai = AIPlayer(ai_player)
+        board = Board(size)
+
+        # 이미 돌이 놓인 국면에서 평가기를 만드는 경우도 확인
+        for _ in range(rng.randint(0, 30)):
+            board.place_stone(rng.randrange(size), rng.randrange(size), rng.choice((1, 2)))
+        evaluator = IncrementalEvaluator(board, ai_player)
+        assert evaluator.score == ai.evaluate_board(board)
+
+        history = []
+        for _ in range(rng.randint(1, 80)):
+            if history and rng.random() < 0.3:
+                row, col, player = history.pop()
+                board.remove_stone(row, col)
+                evaluator.unmake(row, col, player)
+            else:
+                row, col = rng.randrange(size), rng.randrange(size)
+                player = rng.choice((1, 2))
+                if not board.place_stone(row, col, player):
+                    continue
+                evaluator.make(row, col, player)
+                history.append((row, col, player))
+            assert evaluator.score == ai.evaluate_board(board), f"trial {trial}"
+            checked += 1
+    return checked
+
+
+def bench_best_move(positions, depth, evaluator):
+    """
+    각 국면에서 get_best_move 를 실행하고 (선택한 수 목록, 소요 시간)을 반환합니다.
+    (평가 방식만 비교하도록 위협 공간 탐색은 끔)
+    """
+    ai = AIPlayer(2, depth, evaluator=evaluator, threat_nodes=0)
+    moves = []
+    start = time.perf_counter()
+    for position in positions:
+        board = build_board(Board, position)
+        moves.append(ai.get_best_move(board))
+    return moves, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--trials", type=int, default=200)
+    parser.add_argument("--positions", type=int, default=5)
+    parser.add_argument("--stones", type=int, default=12)
+    parser.add_argument("--depth", type=int, default=3)
+    args = parser.parse_args()
+
+    checked = verify_equivalence(args.trials)
+    print(f"증분 평가 점수 일치 확인 완료 ({checked}개 국면)")
+
+    positions = make_positions(args.positions, args.stones)
+    full_moves, full_time = bench_best_move(positions, args.depth, 'python')
+    inc_moves, inc_time = bench_best_move(positions, args.depth, 'incremental')
+    assert full_moves == inc_moves
+
+    count = len(positions)
+    print(f"전체 재평가: {full_time / count:.3f}s/수")
+    print(f"증분 평가  : {inc_time / count:.3f}s/수 ({full_time / inc_time:.1f}배)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+학습한 평가 함수(learned_eval.py) 확인과 손으로 정한 평가와의 비교 벤치마크
+1. 손으로 정한 가중치(PatternWeights.heuristic)를 넣은 증분 평가기가 evaluate_board 와 같은지,
+   학습한 가중치의 증분 평가(두고 되돌리기), 전체 평가, NumPy 벡터화 평가가 모두 같은지 확인합니다.
+2. 같은 국면들에서 깊이 3 탐색의 수당 시간과 초당 노드 수를 비교합니다.
+   (학습한 가중치도 같은 상태 점수표를 쓰므로 느려지지 않아야 함)
+3. NumPy 벡터화 평가로 국면들을 한 번에 평가하는 속도를 측정합니다.
+4. 자동 대국(tournament.run_tournament)으로 학습한 평가와 손으로 정한 평가의 승률을 비교합니다.
+
+사용법:
+    python3 bench_learned.py [--weights learned_weights.json] [--games 100] [--positions 10]
+"""
+import argparse
+import random
+import time
+
+from ai_player import AIPlayer
+from bench_board import build_board
+from bench_terminal import quiet_positions
+from board import Board
+from evaluator import IncrementalEvaluator
+from learned_eval import PatternWeights, evaluate_boards, get_weights
+from tournament import run_tournament
+
+
+def verify(positions, weights, rng, trials=200):
+    """
+    평가 방식들이 같은 점수를 내는지 확인합니다.
+    """
+    import numpy as np
+
+    heuristic = PatternWeights.heuristic()
+    for position in positions:
+        board = build_board(Board, position)
+        for player in (1, 2):
+            ai = AIPlayer(player)
+            assert IncrementalEvaluator(board, player, heuristic).score == ai.evaluate_board(board)
+
+        evaluator = IncrementalEvaluator(board, 2, weights)
+        board.attach(evaluator)
+        grids = []
+        scores = []
+        for _ in range(trials):
+            row, col = 10 + rng.randint(-5, 5), 10 + rng.randint(-5, 5)
+            if board.is_valid_move(row, col):
+                board.make_move(row, col, rng.choice((1, 2)))
+                assert evaluator.score == weights.evaluate(board, 2)
+                grids.append(np.array(board.board, dtype=np.int8))
+                scores.append(evaluator.score)
+        board.undo_to(len(position))
+        board.detach(evaluator)
+        assert evaluator.score == weights.evaluate(board, 2)
+        assert evaluate_boards(np.stack(grids), 2, weights).tolist() == scores
+
+
+def bench_search(positions, depth, evaluator, weights=None, repeat=3):
+    """
+    국면마다 get_best_move 를 실행하고 (수당 시간, 초당 노드 수, 고른 수들)을 반환합니다.
+    """
+    ai = AIPlayer(2, depth, evaluator=evaluator, eval_weights=weights, threat_nodes=0)
+    best = None
+    for _ in range(repeat):
+        nodes = 0
+        moves = []
+        start = time.perf_counter()
+        for position in positions:
+            moves.append(ai.get_best_move(build_board(Board, position)))
+            nodes += ai.nodes
+        elapsed = time.perf_counter() - start
+        best = min(best or elapsed, elapsed)
+    return best / len(positions), nodes / best, moves
+
+
+def bench_batch(positions, weights, count=2000):
+    """
+    NumPy 벡터화 평가와 국면마다 증분 평가기를 새로 만드는 평가의 초당 국면 수를 비교합니다.
+    """
+    import numpy as np
+
+    boards = [build_board(Board, positions[i % len(positions)]) for i in range(count)]
+    grids = np.stack([np.array(board.board, dtype=np.int8) for board in boards])
+    start = time.perf_counter()
+    batch = evaluate_boards(grids, 2, weights)
+    batch_rate = count / (time.perf_counter() - start)
+    start = time.perf_counter()
+    single = [weights.evaluate(board, 2) for board in boards]
+    single_rate = count / (time.perf_counter() - start)
+    assert batch.tolist() == single
+    return batch_rate, single_rate
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--weights", default=None, help="가중치 파일 (기본 learned_weights.json)")
+    parser.add_argument("--positions", type=int, default=10)
+    parser.add_argument("--stones", type=int, default=8)
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--opening-stones", type=int, default=4)
+    args = parser.parse_args()
+
+    weights = get_weights(args.weights)
+    print(f"학습한 가중치: {weights}")
+    print(f"손으로 정한 가중치: {PatternWeights.heuristic()}")
+    positions = quiet_positions(args.positions, args.stones)
+
+    # 1. 평가 일치
+    verify(positions, weights, random.Random(0))
+    print(f"손으로 정한 가중치 = evaluate_board, 증분 = 전체 = NumPy 평가 확인 완료 "
+          f"({len(positions)}개 국면)")
+
+    # 2. 탐색 속도
+    base_time, base_rate, base_moves = bench_search(positions, args.depth, 'incremental')
+    time_, rate, moves = bench_search(positions, args.depth, 'learned', weights)
+    same = sum(a == b for a, b in zip(base_moves, moves))
+    print(f"깊이 {args.depth} 탐색: 손으로 정한 평가 {base_time * 1e3:.1f}ms/수 {base_rate:,.0f}노드/s, "
+          f"학습한 평가 {time_ * 1e3:.1f}ms/수 {rate:,.0f}노드/s "
+          f"(초당 노드 {rate / base_rate:.2f}배, 같은 수 {same}/{len(moves)})")
+
+    # 3. 벡터화 평가
+    batch_rate, single_rate = bench_batch(positions, weights)
+    print(f"평가 처리량: NumPy 일괄 {batch_rate:,.0f}국면/s, "
+          f"국면마다 증분 평가기 {single_rate:,.0f}국면/s ({batch_rate / single_rate:.1f}배)")
+
+    # 4. 대국 실력
+    if not args.games:
+        return
+    engine_a = {'evaluator': 'learned', 'difficulty': args.depth}
+    if args.weights:
+        engine_a['eval_weights'] = args.weights
+    engine_b = {'evaluator': 'incremental', 'difficulty': args.depth}
+    _, summary = run_tournament(engine_a, engine_b, args.games, args.workers,
+                                opening_stones=args.opening_stones)
+    a, b = summary['A'], summary['B']
+    print(f"{summary['games']}판 대국 (개막 {args.opening_stones}수, 흑백 교대): "
+          f"학습한 평가 {a['wins']}승, 손으로 정한 평가 {b['wins']}승, 무승부 {summary['draws']}판 "
+          f"(학습한 평가 승률 {a['win_rate'] * 100:.1f}%)")
+    print(f"수당 평균 시간: 학습한 평가 {a['mean_move_time'] * 1e3:.1f}ms, "
+          f"손으로 정한 평가 {b['mean_move_time'] * 1e3:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
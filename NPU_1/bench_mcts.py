@@ -0,0 +1,227 @@
+"""
+MCTS 플레이어(mcts.py) 확인과 벤치마크
+1. 탐색 뒤 보드가 원래 상태(칸, 해시, 놓인 돌, 수 스택)인지, 즉시 승리/차단 수를 바로 두는지,
+   같은 시드와 플레이아웃 예산이면 같은 수를 고르는지 확인합니다.
+   예산이 없는 설정을 거부하는지, 이전 탐색의 중단 요청이 다음 탐색을 멈추지 않는지,
+   작업자 프로세스로 끝없이 탐색하는 중에 request_stop 이 작업자까지 멈추는지도 확인합니다.
+2. 작업자 수별 초당 플레이아웃 수를 측정합니다. (루트 병렬화, CPU 코어 수만큼 늘어야 함,
+   코어가 하나이면 작업자들이 코어를 나눠 쓰므로 늘지 않음)
+3. MCTS 끼리 한 판을 두며 수마다 이전 트리에서 재사용한 방문 수를 작업자 수별로 측정합니다.
+   (작업자마다 전용 프로세스가 트리를 유지하므로 병렬 탐색도 재사용)
+4. 수당 시간 예산별로 알파-베타 AI(깊이 2)와 자동 대국을 두어 시간에 따른 실력 변화를 봅니다.
+   무작위 개막은 대부분 즉시 승리/강제 수순으로 플레이아웃 없이 몇 수 만에 끝나므로,
+   양쪽 모두 즉시 승리/차단과 강제 수순이 없는 개막만 사용하고 MCTS 가 실제로 플레이아웃을 했는지 확인합니다.
+
+사용법:
+    python3 bench_mcts.py [--workers 1 2 4] [--budgets 0.1 0.3 1.0] [--games 10]
+"""
+import argparse
+import math
+import os
+import threading
+import time
+
+from ai_player import AIPlayer
+from bench_board import build_board, make_positions
+from bench_terminal import quiet_positions
+from bitboard import BitBoard
+from board import Board
+from mcts import MCTSPlayer
+from tournament import play_game, summarize
+
+
+def snapshot(board):
+    return ([row[:] for row in board.board], board.hash, list(board.stones.items()),
+            list(board.move_stack))
+
+
+def verify(positions):
+    """
+    보드 복원, 즉시 승리/차단, 시드 재현성을 확인합니다.
+    """
+    for board_class in (Board, BitBoard):
+        for position in positions:
+            board = build_board(board_class, position)
+            before = snapshot(board)
+            first = MCTSPlayer(2, time_limit=None, playouts=500, seed=1).get_best_move(board)
+            assert snapshot(board) == before
+            second = MCTSPlayer(2, time_limit=None, playouts=500, seed=1).get_best_move(board)
+            assert first == second
+
+    # 흑이 (10, 10)-(10, 12) 세 개, 백이 둘 차례: 막아야 함 / 흑이 둘 차례: 이겨야 함
+    board = build_board(Board, [(10, 10, 1), (5, 5, 2), (10, 11, 1), (5, 7, 2), (10, 12, 1)])
+    assert MCTSPlayer(2, time_limit=0.1).get_best_move(board) in ((10, 9), (10, 13))
+    board.place_stone(15, 15, 2)
+    assert MCTSPlayer(1, time_limit=0.1).get_best_move(board) in ((10, 9), (10, 13))
+
+    # 시간과 플레이아웃 예산이 모두 없으면 끝나지 않으므로 거부
+    try:
+        MCTSPlayer(2, time_limit=None, playouts=None)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("예산 없는 MCTSPlayer 를 만들 수 있음")
+
+    # 지난 탐색 뒤에 온 중단 요청은 다음 탐색을 멈추지 않음
+    player = MCTSPlayer(2, time_limit=None, playouts=300, seed=1)
+    player.request_stop()
+    player.get_best_move(build_board(Board, positions[0]))
+    assert player.last_search_info['playouts'] == 300
+
+
+def verify_parallel_stop(position, workers, delay=0.3, limit=2.0):
+    """
+    작업자 프로세스들이 끝없이(time_limit=math.inf) 탐색하는 중에 request_stop 을 보내
+    limit 초 안에 수가 반환되는지 확인하고, 요청부터 반환까지의 시간을 반환합니다.
+    """
+    player = MCTSPlayer(2, workers=workers, seed=0)
+    try:
+        player.start_workers()
+        requested = []
+
+        def stop():
+            requested.append(time.perf_counter())
+            player.request_stop()
+
+        timer = threading.Timer(delay, stop)
+        timer.start()
+        player.get_best_move(build_board(Board, position), time_limit=math.inf)
+        timer.cancel()
+        assert requested and player.last_search_info['playouts'] > 0
+        stopped = time.perf_counter() - requested[0]
+        assert stopped < limit, f"request_stop 후 {stopped:.2f}초"
+        return stopped
+    finally:
+        player.close()
+
+
+def bench_workers(position, workers, time_limit=1.0):
+    """
+    작업자 수별 (초당 플레이아웃 수, 고른 수)를 반환합니다. (작업자 시작 시간 제외)
+    """
+    player = MCTSPlayer(2, time_limit=time_limit, workers=workers, reuse_tree=False, seed=0)
+    try:
+        if workers > 1:
+            player.get_best_move(build_board(Board, position), time_limit=0.05)  # 작업자 시작
+        move = player.get_best_move(build_board(Board, position))
+        info = player.last_search_info
+        return info['playouts'] / info['time'], move
+    finally:
+        player.close()
+
+
+def bench_reuse(position, time_limit, workers=1, max_moves=30):
+    """
+    개막 수순 뒤부터 MCTS 끼리 한 판을 두며 수마다 (재사용한 방문 수, 이번 플레이아웃 수)를 기록합니다.
+    """
+    board = build_board(Board, position)
+    players = {1: MCTSPlayer(1, time_limit=time_limit, workers=workers, seed=0),
+               2: MCTSPlayer(2, time_limit=time_limit, workers=workers, seed=0)}
+    records = []
+    current = 2 if len(position) % 2 else 1
+    try:
+        for _ in range(max_moves):
+            ai = players[current]
+            row, col = ai.get_best_move(board)
+            if ai.last_search_info.get('playouts'):
+                records.append((ai.last_search_info['reused'], ai.last_search_info['playouts']))
+            board.place_stone(row, col, current)
+            if board.check_winner(row, col, current) or board.is_board_full():
+                break
+            current = 3 - current
+    finally:
+        for ai in players.values():
+            ai.close()
+    return records
+
+
+def quiet_openings(count, stones=6):
+    """
+    흑/백 어느 쪽이 두어도 즉시 승리/차단 수와 강제 승리/차단 수가 없는 개막 수순들을 고릅니다.
+    """
+    openings = []
+    seed = 0
+    while len(openings) < count:
+        for position in make_positions(20, stones, seed=seed):
+            board = build_board(Board, position)
+            if all(ai.find_immediate_win_or_block(board) is None and ai.find_threat_move(board) is None
+                   for ai in (AIPlayer(1), AIPlayer(2))):
+                openings.append(position)
+                if len(openings) == count:
+                    break
+        seed += 1
+    return openings
+
+
+def bench_strength(budget, openings, games):
+    """
+    조용한 개막에서 MCTS(A)와 알파-베타 깊이 2(B)를 흑백을 바꾸어 가며 games 판 둡니다.
+
+    Returns:
+        tuple: (요약 사전, 평균 판 길이(개막 제외), 플레이아웃으로 정한 MCTS 수의 비율)
+    """
+    start = time.perf_counter()
+    results = [play_game(game, {'engine': 'mcts', 'time_limit': budget}, {'difficulty': 2},
+                         game % 2 == 0, openings[game // 2 % len(openings)])
+               for game in range(games)]
+    summary = summarize(results, time.perf_counter() - start)
+    for result in results:
+        nodes = result['records']['A']['nodes']
+        # 조용한 개막에서 MCTS 가 먼저 두면 첫 수는 반드시 플레이아웃으로 정함
+        assert not result['a_first'] or nodes[0] > 0, nodes
+    searched = [n for result in results for n in result['records']['A']['nodes']]
+    assert sum(searched) > 0
+    plies = sum(result['moves'] - len(result['opening']) for result in results) / len(results)
+    return summary, plies, sum(1 for n in searched if n > 0) / len(searched)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument("--budgets", type=float, nargs='+', default=[0.1, 0.3, 1.0])
+    parser.add_argument("--games", type=int, default=10)
+    parser.add_argument("--reuse-time", type=float, default=0.5)
+    parser.add_argument("--positions", type=int, default=3)
+    parser.add_argument("--stones", type=int, default=8)
+    args = parser.parse_args()
+
+    positions = quiet_positions(args.positions, args.stones)
+
+    # 1. 확인
+    verify(positions)
+    print(f"보드 복원, 시드 재현성, 즉시 승리/차단, 예산/중단 요청 확인 완료 "
+          f"({len(positions)}개 국면, Board/BitBoard)")
+    stopped = verify_parallel_stop(positions[0], max(args.workers))
+    print(f"작업자 {max(args.workers)}개 중단 요청 확인 완료 (request_stop 후 {stopped:.3f}초 만에 반환)")
+
+    # 2. 작업자 수별 플레이아웃 속도
+    cores = os.cpu_count()
+    print(f"CPU 코어 수: {cores}")
+    base = None
+    for workers in args.workers:
+        rate, move = bench_workers(positions[0], workers)
+        base = base or rate
+        note = " (코어 수 초과)" if workers > cores else ""
+        print(f"작업자 {workers}개: {rate:,.0f}플레이아웃/s ({rate / base:.2f}배), 고른 수 {move}{note}")
+
+    # 3. 트리 재사용
+    openings = quiet_openings(max(1, args.games // 2))
+    for workers in sorted({1, max(args.workers)}):
+        records = bench_reuse(openings[0], args.reuse_time, workers)
+        reused = sum(r for r, _ in records)
+        played = sum(p for _, p in records)
+        print(f"트리 재사용 (작업자 {workers}개, {len(records)}수): 이전 트리에서 이어받은 방문 {reused:,}번, "
+              f"새 플레이아웃 {played:,}번 (재사용 비율 {reused / (reused + played) * 100:.1f}%)")
+
+    # 4. 시간 예산별 실력
+    for budget in args.budgets:
+        summary, plies, searched = bench_strength(budget, openings, args.games)
+        a, b = summary['A'], summary['B']
+        print(f"MCTS {budget}s/수 vs 알파-베타 깊이 2 ({summary['games']}판): "
+              f"{a['wins']}승 {b['wins']}패 {summary['draws']}무 (승률 {a['win_rate'] * 100:.1f}%), "
+              f"평균 {plies:.1f}수, MCTS 수의 {searched * 100:.0f}%를 플레이아웃으로 정함, "
+              f"수당 평균 {a['mean_move_time'] * 1e3:.0f}ms, {a['nodes_per_sec']:,.0f}플레이아웃/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+"""
+수 스택(Board.make_move/unmake_move) 탐색의 확인과 메모리/속도 벤치마크
+1. get_best_move 가 보드를 복사하지 않고 게임 보드에서 직접 탐색한 뒤, 시간 초과로 중간에 멈춘
+   경우까지 포함하여 보드(칸, 해시, 놓인 돌, 수 스택)를 원래대로 되돌리는지 확인합니다.
+   (Board/BitBoard, 탐색 통계를 켠 경우도 확인)
+2. 이전 방식(place_stone/remove_stone 후 증분 상태를 하나씩 갱신)과 수 스택 방식의
+   두고 되돌리기 속도, 그리고 탐색마다 하던 board.copy() 의 시간을 비교합니다.
+3. tracemalloc 으로 깊이별 탐색의 최대 추가 메모리와 탐색 뒤 남는 메모리를 측정하고,
+   노드 수가 수십 배 늘어도 최대 메모리가 늘지 않는지(노드마다 남는 할당이 없는지),
+   같은 탐색을 되풀이해도 남는 메모리가 늘지 않는지, 치환표를 비울 때 할당이 없는지 확인합니다.
+4. 후보 수 목록과 주 변화(PV) 표를 미리 할당해 다시 쓰므로, 깊이가 하나 늘 때 최대 메모리가
+   재귀 프레임의 지역 값 정도만 늘고, 같은 탐색을 되풀이할 때마다의 최대 메모리가 같으며
+   탐색 뒤에도 같은 목록 객체를 쓰는지 확인합니다.
+
+사용법:
+    python3 bench_memory.py [--positions 5] [--stones 8] [--depths 2 3 4]
+"""
+import argparse
+import time
+import tracemalloc
+
+from ai_player import AIPlayer
+from bench_board import build_board
+from bench_terminal import quiet_positions
+from bitboard import BitBoard
+from board import Board
+from candidates import CandidateGenerator
+from evaluator import IncrementalEvaluator
+from transposition import TranspositionTable
+
+# 노드 수와 관계없이 허용하는 최대 메모리 차이 (탐색 깊이만큼 쌓이는 프레임/후보 목록 정도)
+PEAK_SLACK_BYTES = 16 * 1024
+# 깊이가 하나 늘 때 허용하는 최대 메모리 증가 (재귀 프레임 하나의 열거자와 점수 등 지역 값)
+PLY_SLACK_BYTES = 2048
+
+
+def snapshot(board):
+    return ([row[:] for row in board.board], board.hash, list(board.stones.items()),
+            list(board.move_stack), list(board.listeners))
+
+
+def verify_restored(positions):
+    """
+    탐색이 끝나거나 중간에 멈춘 뒤 보드가 원래 상태인지 확인합니다.
+    """
+    for board_class in (Board, BitBoard):
+        for position in positions:
+            board = build_board(board_class, position)
+            before = snapshot(board)
+            AIPlayer(2, 3).get_best_move(board)
+            assert snapshot(board) == before
+            # 깊은 반복 심화 탐색이 시간 초과로 재귀 도중에 멈추는 경우
+            AIPlayer(2).get_best_move(board, time_limit=0.05, max_depth=8)
+            assert snapshot(board) == before
+            AIPlayer(2, 3, stats=True, tt_symmetry=True).get_best_move(board)
+            assert snapshot(board) == before and 'check_winner' not in board.__dict__
+
+
+class PlaceRemoveAIPlayer(AIPlayer):
+    """
+    이전 방식: place_stone(빈칸 확인 포함)/remove_stone 으로 두고 되돌린 뒤
+    증분 평가기, 후보 수 생성기, 대칭 해시를 하나씩 갱신하는 AIPlayer
+    """
+    def make_move(self, board, row, col, player):
+        board.place_stone(row, col, player)
+        self._ply += 1
+        if self._evaluator is not None:
+            self._evaluator.make(row, col, player)
+        if self._candidates is not None:
+            self._candidates.make(row, col, player)
+        if self._symmetry is not None:
+            self._symmetry.make(row, col, player)
+
+    def unmake_move(self, board, row, col, player):
+        board.remove_stone(row, col)
+        self._ply -= 1
+        if self._evaluator is not None:
+            self._evaluator.unmake(row, col, player)
+        if self._candidates is not None:
+            self._candidates.unmake(row, col, player)
+        if self._symmetry is not None:
+            self._symmetry.unmake(row, col, player)
+
+
+def bench_make_unmake(position, repeat):
+    """
+    탐색 상태를 붙인 보드에서 후보 수들을 두고 되돌리는 속도를 비교합니다.
+
+    Returns:
+        tuple: (이전 방식 ops/s, 수 스택 ops/s)
+    """
+    board = build_board(Board, position)
+    old_ai = PlaceRemoveAIPlayer(2)
+    old_ai._evaluator = IncrementalEvaluator(board, 2)
+    old_ai._candidates = CandidateGenerator(board)
+    moves = old_ai._candidates.get_moves(20)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for row, col in moves:
+            old_ai.make_move(board, row, col, 2)
+            old_ai.unmake_move(board, row, col, 2)
+    old_rate = repeat * len(moves) / (time.perf_counter() - start)
+
+    ai = AIPlayer(2)
+    ai._start_search(board)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for row, col in moves:
+            ai.make_move(board, row, col, 2)
+            ai.unmake_move(board)
+    new_rate = repeat * len(moves) / (time.perf_counter() - start)
+    ai._end_search()
+    return old_rate, new_rate
+
+
+def bench_copy(position, size, repeat=2000):
+    """
+    board.copy() 한 번의 시간(us)을 측정합니다.
+    """
+    offset = size // 2 - 10
+    board = build_board(Board, [(row + offset, col + offset, player)
+                                for row, col, player in position], size)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        board.copy()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def measure(board, depth, tt_memory_mb):
+    """
+    같은 국면을 한 번 탐색해 캐시를 채운 뒤, 다시 탐색하는 동안의 메모리를 측정합니다.
+
+    Returns:
+        tuple: (노드 수, 최대 추가 메모리, 탐색 뒤 남은 메모리) - 바이트
+    """
+    ai = AIPlayer(2, depth, tt_memory_mb=tt_memory_mb)
+    ai.get_best_move(board)
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        ai.get_best_move(board)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return ai.nodes, peak - before, current - before
+
+
+def verify_flat_searches(board, depth, repeat=5):
+    """
+    같은 탐색을 되풀이하며 탐색마다의 최대 추가 메모리를 재고, 그 값이 변하지 않는지와
+    수순 깊이별 후보 수 목록/주 변화 표가 새로 만들어지지 않는지 확인합니다.
+
+    Returns:
+        list: 탐색마다의 최대 추가 메모리 (바이트)
+    """
+    ai = AIPlayer(2, depth, tt_memory_mb=None)
+    ai.get_best_move(board)
+    buffers = [id(buffer) for buffer in ai._move_buffers] + [id(line) for line in ai._pv_table]
+    peaks = []
+    tracemalloc.start()
+    try:
+        ai.get_best_move(board)  # 추적을 시작하기 전에 만든 객체들을 추적되는 객체로 바꿈
+        for _ in range(repeat):
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            ai.get_best_move(board)
+            peaks.append(tracemalloc.get_traced_memory()[1] - before)
+    finally:
+        tracemalloc.stop()
+    assert [id(buffer) for buffer in ai._move_buffers] + [id(line) for line in ai._pv_table] == buffers
+    assert max(peaks) - min(peaks) < 1024, peaks
+    return peaks
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--positions", type=int, default=5)
+    parser.add_argument("--stones", type=int, default=8)
+    parser.add_argument("--depths", type=int, nargs='+', default=[2, 3, 4])
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    positions = quiet_positions(args.positions, args.stones)
+
+    # 1. 보드 복원
+    verify_restored(positions)
+    print(f"탐색 뒤 보드 복원 확인 완료 ({len(positions)}개 국면, Board/BitBoard, 시간 초과 포함)")
+
+    # 2. 두고 되돌리기 속도와 복사 비용
+    old_rate, new_rate = bench_make_unmake(positions[0], args.repeat)
+    print(f"두고 되돌리기: place/remove + 증분 상태 {old_rate:,.0f} ops/s, "
+          f"수 스택 {new_rate:,.0f} ops/s ({new_rate / old_rate:.2f}배)")
+    print("board.copy(): " + ", ".join(f"{size}x{size} {bench_copy(positions[0], size):.1f}us"
+                                       for size in (20, 100)) + " (탐색에서 제거)")
+
+    # 3. 메모리
+    for tt_memory_mb in (None, 16):
+        label = "치환표 없음" if tt_memory_mb is None else f"치환표 {tt_memory_mb}MB"
+        peaks = {}
+        for depth in args.depths:
+            results = [measure(build_board(Board, position), depth, tt_memory_mb)
+                       for position in positions]
+            nodes = sum(result[0] for result in results) / len(results)
+            peaks[depth] = max(result[1] for result in results)
+            retained = max(result[2] for result in results)
+            print(f"{label} 깊이 {depth}: 노드 {nodes:,.0f}개, 최대 추가 메모리 {peaks[depth] / 1024:.1f}KB, "
+                  f"탐색 뒤 남은 메모리 {retained / 1024:.1f}KB")
+        if tt_memory_mb is None:
+            # 치환표가 없으면 남는 것이 없으므로 최대 메모리는 노드 수가 아니라 깊이에만 비례
+            assert max(peaks.values()) - min(peaks.values()) < PEAK_SLACK_BYTES, peaks
+            shallowest = min(peaks)
+            for depth, peak in peaks.items():
+                assert peak - peaks[shallowest] <= PLY_SLACK_BYTES * (depth - shallowest), peaks
+
+    # 같은 탐색을 되풀이해도 남는 메모리가 늘지 않음
+    board = build_board(Board, positions[0])
+    ai = AIPlayer(2, args.depths[-1])
+    ai.get_best_move(board)
+    tracemalloc.start()
+    ai.get_best_move(board)
+    baseline = tracemalloc.get_traced_memory()[0]
+    for _ in range(5):
+        ai.get_best_move(board)
+    growth = tracemalloc.get_traced_memory()[0] - baseline
+
+    # 치환표 비우기는 세대만 올림
+    table = TranspositionTable(16)
+    before = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    table.clear()
+    clear_bytes = tracemalloc.get_traced_memory()[1] - before
+    tracemalloc.stop()
+    assert abs(growth) < PEAK_SLACK_BYTES and clear_bytes < 1024, (growth, clear_bytes)
+    print(f"탐색 5번 되풀이 뒤 늘어난 메모리 {growth / 1024:.1f}KB, "
+          f"치환표 비우기 할당 {clear_bytes}바이트")
+
+    peaks = verify_flat_searches(build_board(Board, positions[0]), args.depths[-1])
+    print(f"깊이 {args.depths[-1]} 탐색 {len(peaks)}번의 최대 추가 메모리: "
+          + ", ".join(f"{peak / 1024:.1f}KB" for peak in peaks) + " (후보 목록/주 변화 표 재사용)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+NumPy 벡터화 평가기(NumpyEvaluator) 일치 확인과 시간 비교
+1. 무작위 보드에서 AIPlayer.evaluate_board 와 점수가 같은지 확인합니다.
+2. 보드 하나를 평가하는 시간과, 각 평가 방식으로 get_best_move 를 실행한 수당 시간을 비교합니다.
+
+NumPy 가 필요합니다.
+
+사용법:
+    python3 bench_numpy.py [--boards 300] [--positions 3] [--depth 3]
+"""
+import argparse
+import random
+import time
+
+from ai_player import AIPlayer
+from bench_board import build_board
+from bench_terminal import quiet_positions
+from board import Board
+from numpy_eval import NumpyEvaluator
+
+
+def random_boards(count, size=20, seed=0):
+    """
+    돌 개수가 0개부터 판의 절반 이상까지 다양한 무작위 보드들을 만듭니다.
+    """
+    rng = random.Random(seed)
+    boards = []
+    for _ in range(count):
+        board = Board(size)
+        for _ in range(rng.randint(0, size * size * 3 // 4)):
+            board.place_stone(rng.randrange(size), rng.randrange(size), rng.choice((1, 2)))
+        boards.append(board)
+    return boards
+
+
+def verify_equivalence(boards):
+    """
+    두 플레이어 관점 모두에서 NumPy 점수와 evaluate_board 점수가 같은지 확인합니다.
+    """
+    for player in (1, 2):
+        ai = AIPlayer(player)
+        evaluator = NumpyEvaluator(player)
+        for board in boards:
+            assert evaluator.evaluate(board) == ai.evaluate_board(board)
+
+
+def time_per_call(function, boards, repeat):
+    """
+    보드 하나당 평균 평가 시간(초)을 반환합니다.
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for board in boards:
+            function(board)
+    return (time.perf_counter() - start) / (repeat * len(boards))
+
+
+def bench_best_move(evaluator, positions, depth):
+    """
+    평가 방식 evaluator 로 각 국면의 최선의 수를 찾고 (수 목록, 수당 시간)을 반환합니다.
+    """
+    ai = AIPlayer(2, depth, evaluator=evaluator)
+    moves = []
+    start = time.perf_counter()
+    for position in positions:
+        moves.append(ai.get_best_move(build_board(Board, position)))
+    return moves, (time.perf_counter() - start) / len(positions)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--boards", type=int, default=300)
+    parser.add_argument("--positions", type=int, default=3)
+    parser.add_argument("--stones", type=int, default=12)
+    parser.add_argument("--depth", type=int, default=3)
+    args = parser.parse_args()
+
+    boards = random_boards(args.boards)
+    verify_equivalence(boards)
+    print(f"NumPy 평가 점수 일치 확인 완료 ({len(boards)}개 보드)")
+
+    sample = boards[:50]
+    python_time = time_per_call(AIPlayer(2).evaluate_board, sample, 2)
+    numpy_time = time_per_call(NumpyEvaluator(2).evaluate, sample, 20)
+    print(f"evaluate_board : {python_time * 1e6:,.0f}us/보드")
+    print(f"NumpyEvaluator : {numpy_time * 1e6:,.0f}us/보드 ({python_time / numpy_time:.1f}배)")
+
+    positions = quiet_positions(args.positions, args.stones)
+    baseline = None
+    for evaluator in ("python", "numpy", "incremental"):
+        moves, per_move = bench_best_move(evaluator, positions, args.depth)
+        if baseline is None:
+            baseline = moves
+        assert moves == baseline
+        print(f"get_best_move ({evaluator:>11}): {per_move:.3f}s/수")
+
+
+if __name__ == "__main__":
+    main()
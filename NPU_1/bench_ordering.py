@@ -0,0 +1,61 @@
+"""
+킬러 수/히스토리 휴리스틱 수 순서 정렬 벤치마크
+같은 국면들을 고정 깊이로 탐색하여 정렬을 켜고 끈 경우의 노드 수, 수당 시간,
+(끈 경우도 후보 수 생성기의 열린 줄 위협 점수 순서를 그대로 사용)
+컷오프 비율(자식을 탐색한 노드 중 컷오프가 일어난 비율)과 첫 번째 수 컷오프 비율을 비교하고,
+두 설정이 같은 수를 고르는지 확인합니다.
+
+사용법:
+    python3 bench_ordering.py [--positions 5] [--depth 3 4 5]
+"""
+import argparse
+import time
+
+from ai_player import AIPlayer
+from bench_board import build_board
+from bench_terminal import quiet_positions
+from board import Board
+
+
+def bench(positions, depth, killer_history):
+    """
+    각 국면의 최선의 수를 찾고 (수 목록, 수당 시간, 전체 노드 수, 컷오프 통계)를 반환합니다.
+    """
+    ai = AIPlayer(2, depth, killer_history=killer_history)
+    moves = []
+    nodes = expanded = cutoffs = first_move_cutoffs = 0
+    start = time.perf_counter()
+    for position in positions:
+        moves.append(ai.get_best_move(build_board(Board, position)))
+        nodes += ai.nodes
+        expanded += ai.expanded_nodes
+        cutoffs += ai.cutoffs
+        first_move_cutoffs += ai.first_move_cutoffs
+    per_move = (time.perf_counter() - start) / len(positions)
+    return moves, per_move, nodes, cutoffs / expanded, first_move_cutoffs / cutoffs
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--positions", type=int, default=5)
+    parser.add_argument("--stones", type=int, default=12)
+    parser.add_argument("--depth", type=int, nargs="+", default=[3, 4, 5])
+    args = parser.parse_args()
+
+    positions = quiet_positions(args.positions, args.stones)
+    for depth in args.depth:
+        baseline = None
+        for label, killer_history in (("정렬 없음  ", False), ("킬러+히스토리", True)):
+            moves, per_move, nodes, cutoff_rate, first_rate = bench(positions, depth,
+                                                                     killer_history)
+            if baseline is None:
+                baseline = nodes
+                base_moves = moves
+            assert moves == base_moves, f"depth={depth}: {moves} != {base_moves}"
+            print(f"깊이 {depth} {label}: {per_move:.3f}s/수, 노드 {nodes:,}개 "
+                  f"({nodes / baseline * 100:.0f}%), 컷오프 비율 {cutoff_rate * 100:.1f}%, "
+                  f"첫 수 컷오프 {first_rate * 100:.1f}%")
+
+
+if __name__ == "__main__":
+    main()
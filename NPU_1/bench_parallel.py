@@ -0,0 +1,132 @@
+"""
+병렬 루트 탐색 벤치마크
+먼저 돌 수가 다른 여러 국면에서 깊이 3, 4 고정 깊이 탐색을 작업자 2/4개와 직렬로 실행하여
+같은 수를 고르는지 확인합니다. 그다음 기준 국면들에서 작업자 1/2/4/8개로 고정 깊이 탐색을 실행하여
+수당 시간과 속도 향상을 측정하고, 모든 설정이 직렬 탐색과 같은 수를 고르는지 확인합니다.
+직렬 탐색도 루트에서 지금까지의 최고 점수를 알파 값으로 넘기므로, 속도 향상은 같은 가지치기를 하는
+직렬 탐색과의 비교입니다. 작업자가 CPU 코어 수보다 많으면 프로세스들이 코어를 나눠 쓰므로
+속도 향상은 기대할 수 없고, 코어가 하나인 환경의 결과는 병렬화 부담만 보여 줍니다.
+마지막으로 깊은 고정 깊이 탐색 중에 request_stop 을 호출하여 작업자들까지 바로 멈추는지 확인합니다.
+
+사용법:
+    python3 bench_parallel.py [--positions 4] [--depth 4] [--workers 1 2 4 8] [--check-depths 3 4]
+"""
+import argparse
+import os
+import threading
+import time
+
+from ai_player import AIPlayer
+from bench_board import build_board
+from bench_terminal import quiet_positions
+from board import Board
+
+
+def bench(workers, positions, depth):
+    """
+    작업자 수 workers 로 각 국면의 최선의 수를 찾고 (수 목록, 수당 시간)을 반환합니다.
+    작업자 프로세스 시작 비용은 측정에서 제외합니다.
+    """
+    ai = AIPlayer(2, depth, workers=workers)
+    try:
+        if ai.parallel is not None:
+            ai.parallel.start()
+            ai.get_best_move(build_board(Board, positions[0]))  # 작업자 준비
+        moves = []
+        nodes = 0
+        start = time.perf_counter()
+        for position in positions:
+            moves.append(ai.get_best_move(build_board(Board, position)))
+            nodes += ai.nodes
+        return moves, (time.perf_counter() - start) / len(positions), nodes // len(positions)
+    finally:
+        ai.close()
+
+
+def verify_equivalence(positions, depths, workers_list):
+    """
+    국면마다 깊이별로 직렬 탐색과 작업자 workers_list 개의 병렬 탐색이 같은 수를 고르는지 확인합니다.
+
+    Returns:
+        int: 확인한 (국면, 깊이, 작업자 수) 조합의 수
+    """
+    checked = 0
+    for depth in depths:
+        serial_moves = bench(1, positions, depth)[0]
+        for workers in workers_list:
+            moves = bench(workers, positions, depth)[0]
+            for index, (move, expected) in enumerate(zip(moves, serial_moves)):
+                assert move == expected, (f"국면 {index}, 깊이 {depth}, workers={workers}: "
+                                          f"{move} != 직렬 {expected}")
+            checked += len(positions)
+    return checked
+
+
+def verify_stop(workers, position, depth=8, delay=0.3, limit=2.0):
+    """
+    작업자 workers 개로 깊은 고정 깊이 탐색을 시작하고 delay 초 뒤에 request_stop 을 호출하여,
+    작업자들이 멈추어 limit 초 안에 깊이 1 탐색의 수가 반환되는지 확인합니다.
+
+    Returns:
+        float: request_stop 호출부터 수를 반환할 때까지의 시간 (초)
+    """
+    ai = AIPlayer(2, depth, workers=workers, threat_nodes=0)
+    try:
+        ai.parallel.start()
+        board = build_board(Board, position)
+        requested = []
+
+        def stop():
+            requested.append(time.perf_counter())
+            ai.request_stop()
+
+        timer = threading.Timer(delay, stop)
+        timer.start()
+        ai.get_best_move(board)
+        timer.cancel()
+        assert requested, "중단 요청 전에 탐색이 끝남"
+        stopped = time.perf_counter() - requested[0]
+        assert ai.last_search_info['depth'] == 1
+        assert stopped < limit, f"request_stop 후 {stopped:.2f}초"
+        return stopped
+    finally:
+        ai.close()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--positions", type=int, default=4)
+    parser.add_argument("--stones", type=int, default=12)
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--check-depths", type=int, nargs="+", default=[3, 4])
+    args = parser.parse_args()
+
+    check_positions = (quiet_positions(3, 8) + quiet_positions(3, 12)
+                       + quiet_positions(2, 16))
+    checked = verify_equivalence(check_positions, args.check_depths, [2, 4])
+    print(f"직렬 탐색과 같은 수 확인 완료: 국면 {len(check_positions)}개 x 깊이 {args.check_depths} "
+          f"x 작업자 2/4개 ({checked}번)")
+
+    cores = os.cpu_count()
+    print(f"CPU 코어 수: {cores}")
+    if cores == 1:
+        print("코어가 하나이므로 작업자가 2개 이상이면 속도 향상 없이 병렬화 부담만 측정됩니다")
+    positions = quiet_positions(args.positions, args.stones)
+    serial_moves, serial_time, serial_nodes = bench(1, positions, args.depth)
+    for workers in args.workers:
+        if workers == 1:
+            moves, per_move, nodes = serial_moves, serial_time, serial_nodes
+        else:
+            moves, per_move, nodes = bench(workers, positions, args.depth)
+        assert moves == serial_moves, f"workers={workers}: {moves} != {serial_moves}"
+        note = " (코어 수 초과)" if workers > cores else ""
+        print(f"workers={workers}: {per_move:.3f}s/수 ({serial_time / per_move:.2f}배), "
+              f"평균 {nodes}노드/수{note}")
+
+    stopped = verify_stop(max(args.workers), positions[0])
+    print(f"중단 요청 확인 완료: workers={max(args.workers)}, request_stop 후 {stopped:.3f}초 만에 반환")
+
+
+if __name__ == "__main__":
+    main()
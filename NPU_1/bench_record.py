@@ -0,0 +1,143 @@
+"""
+압축 기보(game_record.py) 확인과 벤치마크
+1. 무작위 대국들을 기보 파일과 JSON 줄 파일로 기록하고 대국당 크기를 비교합니다.
+   (절반은 수마다 덧붙이는 GameRecordWriter.add_move, 절반은 write_game 으로 기록)
+2. 무작위 (대국 n, 수 k) 국면을 mmap 기보에서 바로 만든 결과가
+   JSON 을 읽어 Board.place_stone 으로 다시 둔 결과와 같은지 확인하고 시간을 비교합니다.
+3. 모든 대국을 훑는 속도(초당 대국 수)를 측정합니다.
+
+사용법:
+    python3 bench_record.py [--games 2000] [--lookups 5000]
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+
+from board import Board
+from game_record import GameRecordReader, GameRecordWriter, game_result
+
+
+def random_game(rng, size=20, max_moves=200):
+    """
+    돌 근처에 무작위로 두는 대국 하나를 만듭니다.
+
+    Returns:
+        tuple: ((row, col) 수 목록, 기보 결과)
+    """
+    board = Board(size)
+    moves = []
+    winner = None
+    player = 1
+    while len(moves) < max_moves:
+        if moves:
+            row, col = rng.choice(moves)
+            row, col = row + rng.randint(-2, 2), col + rng.randint(-2, 2)
+        else:
+            row, col = size // 2, size // 2
+        if not board.is_valid_move(row, col):
+            continue
+        board.place_stone(row, col, player)
+        moves.append((row, col))
+        if board.check_winner(row, col, player):
+            winner = player
+            break
+        player = 3 - player
+    return moves, game_result(winner, winner is not None)
+
+
+def replay(moves, k):
+    """
+    이전 방식: 처음부터 Board.place_stone 으로 k개 수를 다시 둡니다.
+    """
+    board = Board(20)
+    for i, (row, col) in enumerate(moves[:k]):
+        board.place_stone(row, col, 1 if i % 2 == 0 else 2)
+    return board
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=2000)
+    parser.add_argument("--lookups", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    games = [random_game(rng) for _ in range(args.games)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        record_path = os.path.join(directory, 'games.grc')
+        json_path = os.path.join(directory, 'games.jsonl')
+
+        with GameRecordWriter(record_path) as writer:
+            for i, (moves, result) in enumerate(games):
+                if i % 2:
+                    writer.write_game(moves, result)
+                else:
+                    for row, col in moves:
+                        writer.add_move(row, col)
+                    writer.finish(result)
+        with open(json_path, 'w') as f:
+            for moves, result in games:
+                f.write(json.dumps({'size': 20, 'result': result, 'moves': moves}) + '\n')
+
+        record_size = os.path.getsize(record_path)
+        json_size = os.path.getsize(json_path)
+        total_moves = sum(len(moves) for moves, _ in games)
+        print(f"대국 {len(games)}개 (평균 {total_moves / len(games):.1f}수): "
+              f"기보 {record_size / len(games):.1f}바이트/대국, "
+              f"JSON {json_size / len(games):.1f}바이트/대국 ({json_size / record_size:.1f}배)")
+
+        queries = []
+        for _ in range(args.lookups):
+            n = rng.randrange(len(games))
+            queries.append((n, rng.randint(0, len(games[n][0]))))
+
+        # 이전 방식: 줄 위치 색인으로 n번째 줄을 읽고 JSON 을 풀어 처음부터 다시 둠
+        line_offsets = []
+        with open(json_path, 'rb') as f:
+            offset = 0
+            for line in f:
+                line_offsets.append(offset)
+                offset += len(line)
+        with open(json_path, 'rb') as f:
+            start = time.perf_counter()
+            replayed = []
+            for n, k in queries:
+                f.seek(line_offsets[n])
+                replayed.append(replay(json.loads(f.readline())['moves'], k))
+            replay_time = time.perf_counter() - start
+
+        with GameRecordReader(record_path) as reader:
+            assert len(reader) == len(games)
+            for n, (moves, result) in enumerate(games):
+                assert reader.header(n) == (20, 4, result, len(moves))
+                assert reader.move_list(n) == moves
+
+            start = time.perf_counter()
+            cells = [reader.cells(n, k) for n, k in queries]
+            cells_time = time.perf_counter() - start
+            start = time.perf_counter()
+            boards = [reader.board(n, k) for n, k in queries]
+            board_time = time.perf_counter() - start
+
+            for old, new, flat in zip(replayed, boards, cells):
+                assert new.board == old.board and new.hash == old.hash
+                assert list(flat) == [cell for row in old.board for cell in row]
+            print(f"국면 {len(queries)}개 일치 확인 완료")
+            print(f"JSON + place_stone 재생: {replay_time / len(queries) * 1e6:.1f}us/국면, "
+                  f"기보 cells: {cells_time / len(queries) * 1e6:.1f}us/국면 "
+                  f"({replay_time / cells_time:.1f}배), "
+                  f"기보 board: {board_time / len(queries) * 1e6:.1f}us/국면")
+
+            start = time.perf_counter()
+            scanned = sum(1 for size, win_length, result, moves in reader if result == 1)
+            scan_time = time.perf_counter() - start
+            print(f"전체 훑기: {len(reader) / scan_time:,.0f}대국/s (흑 승 {scanned}판)")
+
+
+if __name__ == "__main__":
+    main()
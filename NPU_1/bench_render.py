@@ -0,0 +1,276 @@
+"""
+콘솔 렌더러(renderer.py) 확인과 초당 프레임 수 벤치마크
+1. 칸마다 print 를 부르던 이전 display_board/display_game_state 의 출력과
+   BoardRenderer 가 write 한 번으로 출력하는 프레임이 글자 하나까지 같은지 확인합니다.
+2. ANSI 모드의 출력을 간단한 화면 모형에 적용했을 때 매 프레임 전체를 그린 화면과 같은지 확인합니다.
+3. 판 크기별로 한 수씩 두며 다시 그리는 초당 프레임 수, 프레임당 write 호출 수와 바이트 수를
+   메모리 출력과 줄 버퍼 파이프(원격 터미널/로그처럼 줄마다 내보냄)에서 측정합니다.
+   (BitBoard 는 한 번에 write 하는 방식의 초당 프레임 수만 측정)
+
+사용법:
+    python3 bench_render.py [--sizes 20 50 100] [--frames 200]
+"""
+import argparse
+import contextlib
+import io
+import os
+import random
+import re
+import threading
+import time
+
+from bitboard import BitBoard
+from board import Board
+from renderer import BoardRenderer, render_board
+
+HEADER = ["", "=" * 50, "          4목 게임 (Connect Four)", "=" * 50]
+ESCAPE = re.compile(r'\x1b\[(\d*)(?:;(\d+))?([HJK])')
+
+
+def legacy_display_board(board):
+    """
+    이전 Board.display_board (칸마다 print 호출)
+    """
+    print("   ", end="")
+    for i in range(board.size):
+        print(f"{i:2}", end=" ")
+    print()
+    for i in range(board.size):
+        print(f"{i:2}:", end="")
+        for j in range(board.size):
+            if board.board[i][j] == board.PLAYER1:
+                print(" ●", end="")
+            elif board.board[i][j] == board.PLAYER2:
+                print(" ○", end="")
+            else:
+                print("  ", end="")
+            if j < board.size - 1:
+                print("─", end="")
+        print()
+        if i < board.size - 1:
+            print("   ", end="")
+            for j in range(board.size):
+                print(" │", end="")
+                if j < board.size - 1:
+                    print(" ", end="")
+            print()
+    print()
+
+
+def legacy_display_game_state(board, status):
+    """
+    이전 Game.display_game_state (제목, 바둑판, 상태를 따로 print)
+    """
+    print("\n" + "=" * 50)
+    print(HEADER[2])
+    print("=" * 50)
+    legacy_display_board(board)
+    print(status)
+
+
+class CountingSink:
+    """
+    출력을 버리고 write 호출 수와 글자 수만 세는 스트림
+    """
+    def __init__(self):
+        self.writes = 0
+        self.chars = 0
+
+    def write(self, text):
+        self.writes += 1
+        self.chars += len(text)
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+class Screen:
+    """
+    렌더러가 쓰는 ANSI 명령(커서 이동, 줄/아래/화면 지우기)만 처리하는 화면 모형
+    """
+    def __init__(self):
+        self.lines = []
+        self.row = 0
+        self.col = 0
+
+    def write(self, text):
+        position = 0
+        for match in ESCAPE.finditer(text):
+            self._text(text[position:match.start()])
+            position = match.end()
+            first, second, command = match.groups()
+            if command == 'H':
+                self.row, self.col = int(first or 1) - 1, int(second or 1) - 1
+            elif command == 'J' and first == '2':
+                self.lines = []
+            else:
+                self._line()
+                self.lines[self.row] = self.lines[self.row][:self.col]
+                if command == 'J':
+                    del self.lines[self.row + 1:]
+        self._text(text[position:])
+
+    def _line(self):
+        while len(self.lines) <= self.row:
+            self.lines.append("")
+
+    def _text(self, text):
+        for i, part in enumerate(text.split("\n")):
+            if i:
+                self.row += 1
+                self.col = 0
+            if part:
+                self._line()
+                line = self.lines[self.row].ljust(self.col)
+                self.lines[self.row] = line[:self.col] + part + line[self.col + len(part):]
+                self.col += len(part)
+
+    def flush(self):
+        pass
+
+
+def random_moves(size, count, seed=0):
+    """
+    돌 근처에 번갈아 두는 (row, col, player) 수순을 만듭니다.
+    """
+    rng = random.Random(seed)
+    board = Board(size)
+    moves = []
+    center = size // 2
+    while len(moves) < min(count, size * size):
+        if moves:
+            row, col, _ = rng.choice(moves)
+            row, col = row + rng.randint(-2, 2), col + rng.randint(-2, 2)
+        else:
+            row = col = center
+        player = 1 if len(moves) % 2 == 0 else 2
+        if board.place_stone(row, col, player):
+            moves.append((row, col, player))
+    return moves
+
+
+def status_line(index):
+    return f"현재 차례: {'플레이어 1 (●)' if index % 2 else '플레이어 2 (○)'}"
+
+
+def verify(size, moves):
+    """
+    이전 출력과 같은지, ANSI 모드 화면이 전체를 그린 화면과 같은지,
+    BitBoard(row_values 로 행을 그림)의 프레임이 Board 와 같은지 확인합니다.
+    """
+    board = Board(size)
+    bit_board = BitBoard(size)
+    bit_plain = BoardRenderer(io.StringIO())
+    plain = BoardRenderer(io.StringIO())
+    screen = Screen()
+    ansi = BoardRenderer(screen, ansi=True, height=10 ** 6)
+    for index, (row, col, player) in enumerate(moves):
+        board.place_stone(row, col, player)
+        bit_board.place_stone(row, col, player)
+        status = status_line(index)
+        legacy = io.StringIO()
+        with contextlib.redirect_stdout(legacy):
+            legacy_display_game_state(board, status)
+        plain.stream = io.StringIO()
+        plain.draw(board, HEADER, [status])
+        assert plain.stream.getvalue() == legacy.getvalue()
+        assert bit_plain.render(bit_board, HEADER, [status]) == legacy.getvalue()
+
+        ansi.draw(board, HEADER, [status])
+        expected = legacy.getvalue().split("\n")[:-1]
+        assert screen.lines[:len(expected)] == expected
+        assert not any(screen.lines[len(expected):])
+    # 되돌린 돌도 다시 그림
+    row, col, _ = moves[-1]
+    board.remove_stone(row, col)
+    bit_board.remove_stone(row, col)
+    assert render_board(bit_board) == render_board(board)
+    ansi.draw(board, HEADER, ["되돌림"])
+    assert screen.lines[:-1] == plain.render(board, HEADER, ["되돌림"]).split("\n")[:-1]
+
+
+def run_legacy(board, moves, stream):
+    with contextlib.redirect_stdout(stream):
+        for index, (row, col, player) in enumerate(moves):
+            board.place_stone(row, col, player)
+            legacy_display_game_state(board, status_line(index))
+
+
+def run_renderer(board, moves, renderer):
+    for index, (row, col, player) in enumerate(moves):
+        board.place_stone(row, col, player)
+        renderer.draw(board, HEADER, [status_line(index)])
+
+
+@contextlib.contextmanager
+def line_buffered_pipe():
+    """
+    다른 스레드가 읽어 버리는 파이프에 줄 버퍼 텍스트 스트림을 엽니다. (터미널과 같이 줄마다 내보냄)
+    """
+    read_fd, write_fd = os.pipe()
+
+    def read_all():
+        while os.read(read_fd, 1 << 16):
+            pass
+
+    drain = threading.Thread(target=read_all)
+    drain.start()
+    stream = open(write_fd, 'w', encoding='utf-8', buffering=1)
+    try:
+        yield stream
+    finally:
+        stream.close()
+        drain.join()
+        os.close(read_fd)
+
+
+def measure(size, moves, mode, pipe, board_class=Board):
+    """
+    수순을 두며 프레임을 그리고 (초당 프레임 수, 프레임당 write 수, 프레임당 글자 수)를 반환합니다.
+    """
+    board = board_class(size)
+    sink = CountingSink()
+    stream = sink
+    with contextlib.ExitStack() as stack:
+        if pipe:
+            stream = stack.enter_context(line_buffered_pipe())
+        start = time.perf_counter()
+        if mode == 'legacy':
+            run_legacy(board, moves, stream)
+        else:
+            renderer = BoardRenderer(stream, ansi=(mode == 'ansi'), height=10 ** 6)
+            run_renderer(board, moves, renderer)
+        elapsed = time.perf_counter() - start
+    if pipe:
+        return len(moves) / elapsed, None, None
+    return len(moves) / elapsed, sink.writes / len(moves), sink.chars / len(moves)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs='+', default=[20, 50, 100])
+    parser.add_argument("--frames", type=int, default=200)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        verify(size, random_moves(size, 60, seed=size))
+    print(f"이전 출력과 같은 프레임, ANSI 화면 일치 확인 완료 (판 크기 {args.sizes})")
+
+    labels = {'legacy': '칸마다 print', 'buffer': '한 번에 write', 'ansi': 'ANSI 바뀐 줄만'}
+    for size in args.sizes:
+        moves = random_moves(size, args.frames)
+        base = None
+        for mode in ('legacy', 'buffer', 'ansi'):
+            fps, writes, chars = measure(size, moves, mode, pipe=False)
+            pipe_fps, _, _ = measure(size, moves, mode, pipe=True)
+            base = base or (fps, pipe_fps)
+            print(f"{size}x{size} {labels[mode]:>14}: {fps:8,.0f} fps ({fps / base[0]:5.1f}배), "
+                  f"파이프 {pipe_fps:8,.0f} fps ({pipe_fps / base[1]:5.1f}배), "
+                  f"프레임당 write {writes:,.0f}번, {chars:,.0f}자")
+        fps, _, _ = measure(size, moves, 'buffer', pipe=False, board_class=BitBoard)
+        print(f"{size}x{size} {'BitBoard write':>14}: {fps:8,.0f} fps ({fps / base[0]:5.1f}배)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+판 크기와 승리 길이에 따른 확장성 확인과 벤치마크
+1. 20x20 중반 국면들을 더 큰 판(기본 50x50, 100x100)의 중앙으로 옮겨 놓고,
+   승리 길이(기본 4, 5)마다 다음을 확인합니다.
+   - Board 와 BitBoard 의 승패 판정(check_winner, find_winner)이 같은지
+   - 증분 평가(IncrementalEvaluator)가 전체 평가(evaluate_board)와 같은지
+   - 옮긴 국면에서 고른 수가 20x20 에서 고른 수를 같이 옮긴 것과 같은지
+     (돌이 판 가장자리에서 멀리 있으면 판 크기와 상관없이 같은 수를 골라야 함)
+2. get_best_move 의 수당 시간을 판 크기별로 측정합니다.
+   평가와 후보 생성이 판 넓이가 아니라 놓인 돌 수에 비례하므로 큰 판에서도 시간이 거의 같아야 합니다.
+   (판 크기별 표는 처음 한 번만 만들고 캐시하므로, 측정 전에 한 번 탐색해 둠)
+
+사용법:
+    python3 bench_scaling.py [--sizes 20 50 100] [--lengths 4 5] [--positions 5] [--stones 8] [--depth 3]
+"""
+import argparse
+import random
+import time
+
+from ai_player import AIPlayer
+from bench_terminal import quiet_positions
+from bitboard import BitBoard
+from board import Board
+from evaluator import IncrementalEvaluator
+
+BASE_SIZE = 20
+
+
+def shift_position(position, size):
+    """
+    20x20 수순을 size x size 판의 중앙으로 옮깁니다.
+    """
+    offset = size // 2 - BASE_SIZE // 2
+    return [(row + offset, col + offset, player) for row, col, player in position]
+
+
+def build(board_class, position, size, win_length):
+    board = board_class(size, win_length)
+    for row, col, player in position:
+        board.place_stone(row, col, player)
+    return board
+
+
+def verify(positions, size, win_length, rng, trials=200):
+    """
+    두 백엔드의 승패 판정과 증분 평가가 같은지 확인합니다.
+    """
+    for position in positions:
+        board = build(Board, position, size, win_length)
+        bitboard = build(BitBoard, position, size, win_length)
+        assert board.find_winner() == bitboard.find_winner()
+        for cell in board.stones:
+            row, col = divmod(cell, size)
+            for player in (1, 2):
+                assert (board.check_winner(row, col, player)
+                        == bitboard.check_winner(row, col, player))
+
+        ai = AIPlayer(2)
+        evaluator = IncrementalEvaluator(board, 2)
+        assert evaluator.score == ai.evaluate_board(board)
+
+        # 무작위로 돌을 더 놓고 되돌리며 증분 평가를 비교
+        placed = []
+        for _ in range(trials):
+            row = size // 2 + rng.randint(-6, 6)
+            col = size // 2 + rng.randint(-6, 6)
+            player = rng.choice((1, 2))
+            if board.place_stone(row, col, player):
+                evaluator.make(row, col, player)
+                placed.append((row, col, player))
+                assert evaluator.score == ai.evaluate_board(board)
+        for row, col, player in reversed(placed):
+            board.remove_stone(row, col)
+            evaluator.unmake(row, col, player)
+        assert evaluator.score == ai.evaluate_board(board)
+
+
+def bench(positions, size, win_length, depth):
+    """
+    각 국면에서 get_best_move 를 실행하고 (고른 수 목록, 수당 평균 시간)을 반환합니다.
+    """
+    ai = AIPlayer(2, depth)
+    boards = [build(Board, position, size, win_length) for position in positions]
+    ai.get_best_move(boards[0].copy())  # 판 크기별 표 캐시를 미리 만듦
+    moves = []
+    start = time.perf_counter()
+    for board in boards:
+        moves.append(ai.get_best_move(board))
+    return moves, (time.perf_counter() - start) / len(boards)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs='+', default=[20, 50, 100])
+    parser.add_argument("--lengths", type=int, nargs='+', default=[4, 5])
+    parser.add_argument("--positions", type=int, default=5)
+    parser.add_argument("--stones", type=int, default=8)
+    parser.add_argument("--depth", type=int, default=3)
+    args = parser.parse_args()
+
+    positions = quiet_positions(args.positions, args.stones)
+    rng = random.Random(0)
+    for win_length in args.lengths:
+        base_moves = None
+        base_time = None
+        for size in args.sizes:
+            shifted = [shift_position(position, size) for position in positions]
+            verify(shifted, size, win_length, rng)
+            moves, elapsed = bench(shifted, size, win_length, args.depth)
+
+            offset = size // 2 - BASE_SIZE // 2
+            moves = [(row - offset, col - offset) for row, col in moves]
+            if base_moves is None:
+                base_moves, base_time = moves, elapsed
+            assert moves == base_moves, f"{size}x{size} 에서 다른 수"
+            print(f"{win_length}목 {size}x{size}: {elapsed * 1e3:.1f}ms/수 "
+                  f"({elapsed / base_time:.2f}배, 판 넓이 {size * size / BASE_SIZE ** 2:.0f}배)")
+    print(f"Board/BitBoard 판정, 증분 평가, 판 크기별 같은 수 확인 완료 ({len(positions)}개 국면)")
+
+
+if __name__ == "__main__":
+    main()
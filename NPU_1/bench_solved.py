@@ -0,0 +1,246 @@
+"""
+강제 수순 캐시(solved_cache.py) 확인과 벤치마크
+1. 자가 대국 국면들의 위협 공간 탐색 결과를 캐시에 저장한 뒤, 같은 국면을 8가지 대칭으로 돌린
+   보드에서 찾았을 때 결과가 같고 수도 같은 대칭으로 옮겨지는지 확인합니다.
+   (스스로 대칭인 국면은 대칭으로 같은 다른 칸이 나올 수 있으므로 둔 뒤의 정규화 국면으로 비교)
+2. 같은 국면들이 여러 대국에서 다시 나오는 경우(두 번째 훑기)에 위협 공간 탐색을 매번 푸는 것과
+   캐시에서 찾는 것의 국면당 시간과 get_best_move 의 수당 시간을 비교합니다.
+3. 작은 max_entries 로 가장 오래 쓰지 않은 항목부터 지우는지(LRU), 항목 수가 제한을 지키는지 확인합니다.
+4. 여러 프로세스가 같은 캐시 파일에 동시에 저장하고 찾아도 오류 없이 같은 결과를 얻는지 확인합니다.
+
+사용법:
+    python3 bench_solved.py [--games 200] [--processes 4]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from ai_player import AIPlayer
+from board import Board
+from learned_eval import play_self_game
+from solved_cache import OUTCOME_WIN, SolvedPositionCache
+from symmetry import canonical_key, transform_board, transform_move
+
+THREAT_NODES = 20000
+
+
+def self_play_positions(games, seed=0):
+    """
+    자가 대국(learned_eval.play_self_game: 깊이 3, 가끔 무작위 수)의 국면 중
+    즉시 승리/차단이 없는 국면들을 모읍니다.
+    대칭까지 같은 국면은 처음 나온 하나만 남깁니다. (위협 공간 탐색은 방향에 따라 같은 값의
+    다른 수나, 노드 예산 안에서 다른 결과를 낼 수 있어 캐시 결과와 1:1 비교하기 위함)
+
+    Returns:
+        tuple: ((돌 목록, 둘 차례) 튜플들의 리스트, 대칭까지 같은 국면이 다시 나온 횟수)
+    """
+    positions = []
+    seen = set()
+    repeats = 0
+    for game in range(games):
+        moves, _ = play_self_game(seed + game)
+        board = Board(20)
+        for i, (row, col) in enumerate(moves[:-1]):
+            board.place_stone(row, col, 1 if i % 2 == 0 else 2)
+            player = 2 if i % 2 == 0 else 1
+            if AIPlayer(player, tt_memory_mb=None).find_immediate_win_or_block(board) is None:
+                stones = [divmod(cell, 20) + (stone,) for cell, stone in board.stones.items()]
+                key = canonical_key(20, stones, player)[0]
+                if key in seen:
+                    repeats += 1
+                    continue
+                seen.add(key)
+                positions.append((stones, player))
+    return positions, repeats
+
+
+def build(stones):
+    board = Board(20)
+    for row, col, player in stones:
+        board.place_stone(row, col, player)
+    return board
+
+
+def played_key(board, move, player):
+    """
+    board 에 move 를 둔 국면의 정규화 해시를 반환합니다.
+    """
+    stones = [divmod(cell, board.size) + (stone,) for cell, stone in board.stones.items()]
+    return canonical_key(board.size, stones + [(*move, player)], player)[0]
+
+
+def verify_symmetry(cache, positions):
+    """
+    저장한 결과를 대칭인 보드에서 찾아도 같은 결과, 같은 대칭으로 옮긴 수인지 확인합니다.
+    """
+    for stones, player in positions:
+        board = build(stones)
+        outcome, move = AIPlayer(player, tt_memory_mb=None).solve_threats(board)
+        cache.store(board, player, outcome, move, THREAT_NODES)
+        for transform in range(8):
+            rotated = transform_board(board, transform)
+            cached = cache.lookup(rotated, player, THREAT_NODES)
+            expected = None if move is None else transform_move(move, transform, 20)
+            assert cached[0] == outcome and (cached[1] is None) == (expected is None)
+            if expected is not None and cached[1] != expected:
+                # 스스로 대칭인 국면이면 대칭으로 같은 다른 칸이 나올 수 있음
+                assert played_key(rotated, cached[1], player) == played_key(rotated, expected, player)
+        # 예산을 늘리면 강제 승리가 아닌 결과는 다시 풀어야 함
+        assert (cache.lookup(board, player, THREAT_NODES * 2) is not None) == (outcome == OUTCOME_WIN)
+
+
+def timed(function, items):
+    """
+    항목마다 function 을 실행하고 (결과 리스트, 항목별 시간 리스트)를 반환합니다.
+    """
+    results, times = [], []
+    for item in items:
+        start = time.perf_counter()
+        results.append(function(*item))
+        times.append(time.perf_counter() - start)
+    return results, times
+
+
+def bench_threats(positions, cache):
+    """
+    국면마다 위협 공간 탐색을 새로 푸는 시간과 캐시를 거치는 시간을 비교합니다.
+
+    Returns:
+        tuple: (풀기 평균, 캐시 평균, 풀기가 가장 오래 걸린 5% 국면의 풀기 평균, 같은 국면들의 캐시 평균) - us
+    """
+    boards = [(build(stones), player) for stones, player in positions]
+    plain = {player: AIPlayer(player, tt_memory_mb=None) for player in (1, 2)}
+    solved, solve_times = timed(lambda board, player: plain[player].find_threat_move(board), boards)
+
+    ais = {player: AIPlayer(player, tt_memory_mb=None, solved_cache=cache) for player in (1, 2)}
+    for board, player in boards:  # 첫 번째 대국들: 풀어서 저장
+        ais[player].find_threat_move(board)
+    cached, cache_times = timed(lambda board, player: ais[player].find_threat_move(board), boards)
+    assert cached == solved
+
+    hardest = sorted(range(len(boards)), key=solve_times.__getitem__)[-max(1, len(boards) // 20):]
+    mean = lambda values: sum(values) / len(values) * 1e6
+    return (mean(solve_times), mean(cache_times),
+            mean([solve_times[i] for i in hardest]), mean([cache_times[i] for i in hardest]))
+
+
+def bench_moves(positions, cache, depth=2):
+    """
+    같은 국면들의 get_best_move 수당 시간(ms)을 캐시 없이/따뜻한 캐시로 비교합니다.
+    """
+    boards = [(build(stones), player) for stones, player in positions]
+    plain = {player: AIPlayer(player, depth) for player in (1, 2)}
+    cached = {player: AIPlayer(player, depth, solved_cache=cache) for player in (1, 2)}
+    start = time.perf_counter()
+    moves = [plain[player].get_best_move(board) for board, player in boards]
+    plain_time = time.perf_counter() - start
+    start = time.perf_counter()
+    cached_moves = [cached[player].get_best_move(board) for board, player in boards]
+    cache_time = time.perf_counter() - start
+    assert cached_moves == moves
+    return plain_time / len(boards) * 1e3, cache_time / len(boards) * 1e3
+
+
+def verify_lru(path, positions, limit=50):
+    """
+    항목 수 제한과 가장 오래 쓰지 않은 항목부터 지우는지 확인합니다.
+    """
+    cache = SolvedPositionCache(path, max_entries=limit)
+    boards = [(build(stones), player) for stones, player in positions[:limit * 3]]
+    first_board, first_player = boards[0]
+    cache.store(first_board, first_player, 0, None, THREAT_NODES)
+    for board, player in boards[1:]:
+        cache.lookup(first_board, first_player, THREAT_NODES)  # 첫 항목은 계속 사용
+        cache.store(board, player, 0, None, THREAT_NODES)
+    cache.evict()
+    assert len(cache) <= limit, len(cache)
+    assert cache.lookup(first_board, first_player, THREAT_NODES) is not None
+    assert cache.lookup(*boards[1], THREAT_NODES) is None  # 오래 쓰지 않은 항목은 지워짐
+    evicted = cache.evicted
+    cache.close()
+    return evicted
+
+
+def _worker(path, positions, seed):
+    """
+    작업자 프로세스: 섞은 순서로 국면들을 찾아보고 없으면 풀어서 저장합니다.
+
+    Returns:
+        list: 국면 순서대로 (결과, 수)
+    """
+    rng = random.Random(seed)
+    order = list(range(len(positions)))
+    rng.shuffle(order)
+    results = {}
+    with SolvedPositionCache(path) as cache:
+        for index in order:
+            stones, player = positions[index]
+            board = build(stones)
+            found = cache.lookup(board, player, THREAT_NODES)
+            if found is None:
+                found = AIPlayer(player, tt_memory_mb=None).solve_threats(board)
+                cache.store(board, player, *found, THREAT_NODES)
+            results[index] = found
+        stats = cache.get_stats()
+    return [results[index] for index in range(len(positions))], stats
+
+
+def verify_processes(path, positions, processes):
+    """
+    여러 프로세스가 같은 파일을 동시에 쓰고 읽어도 모두 같은 결과를 얻는지 확인합니다.
+    """
+    expected = [AIPlayer(player, tt_memory_mb=None).solve_threats(build(stones)) for stones, player in positions]
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = [executor.submit(_worker, path, positions, seed) for seed in range(processes)]
+        outputs = [future.result() for future in futures]
+    for results, _ in outputs:
+        assert results == expected
+    hits = sum(stats['hits'] for _, stats in outputs)
+    lookups = sum(stats['lookups'] for _, stats in outputs)
+    return hits, lookups
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=200)
+    parser.add_argument("--processes", type=int, default=4)
+    args = parser.parse_args()
+
+    positions, repeats = self_play_positions(args.games)
+    print(f"자가 대국 {args.games}판에서 서로 다른 국면 {len(positions)}개 "
+          f"(대칭까지 같은 국면이 다른 대국에서 다시 나온 횟수 {repeats}번)")
+
+    with tempfile.TemporaryDirectory() as directory:
+        # 1. 대칭 확인
+        with SolvedPositionCache(os.path.join(directory, 'symmetry.db')) as cache:
+            verify_symmetry(cache, positions[:200])
+        print(f"8가지 대칭 보드에서 같은 결과와 수 확인 완료 ({min(200, len(positions))}개 국면)")
+
+        # 2. 속도
+        with SolvedPositionCache(os.path.join(directory, 'speed.db')) as cache:
+            solve_us, cache_us, hard_solve_us, hard_cache_us = bench_threats(positions, cache)
+            print(f"위협 공간 탐색: 매번 풀기 {solve_us:,.0f}us/국면, "
+                  f"캐시 {cache_us:,.0f}us/국면 ({solve_us / cache_us:.1f}배), "
+                  f"가장 오래 걸린 5% 국면 {hard_solve_us:,.0f}us -> {hard_cache_us:,.0f}us "
+                  f"({hard_solve_us / hard_cache_us:.1f}배)")
+            plain_ms, cached_ms = bench_moves(positions, cache)
+            print(f"get_best_move (깊이 2, 같은 수 확인): 캐시 없음 {plain_ms:.2f}ms/수, "
+                  f"캐시 {cached_ms:.2f}ms/수 ({plain_ms / cached_ms:.2f}배), "
+                  f"캐시 항목 {len(cache):,}개")
+
+        # 3. LRU
+        evicted = verify_lru(os.path.join(directory, 'lru.db'), positions)
+        print(f"항목 수 제한과 LRU 삭제 확인 완료 ({evicted}개 삭제)")
+
+        # 4. 여러 프로세스
+        hits, lookups = verify_processes(os.path.join(directory, 'shared.db'),
+                                         positions[:300], args.processes)
+        print(f"프로세스 {args.processes}개 동시 사용 확인 완료: 조회 {lookups}번 중 "
+              f"다른 프로세스가 저장한 결과 적중 {hits}번")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+탐색 통계 수집기(search_stats.py) 확인과 비용 측정
+1. 통계를 켜고 끈 AIPlayer 가 같은 수를 고르고, 수집한 노드 수가 ai.nodes 와 같은지 확인합니다.
+2. 통계를 켰을 때와 껐을 때의 수당 시간을 비교하고, 마지막 수의 통계를 JSON 으로 출력합니다.
+3. --profile 을 주면 get_best_move 한 번을 cProfile/pyinstrument 로 실행한 결과를 출력합니다.
+
+사용법:
+    python3 bench_stats.py [--positions 5] [--depth 3] [--profile cprofile|pyinstrument]
+"""
+import argparse
+import time
+
+from ai_player import AIPlayer
+from bench_board import build_board
+from bench_terminal import quiet_positions
+from board import Board
+from search_stats import profile_search
+
+
+def bench(positions, depth, stats):
+    """
+    각 국면의 최선의 수를 찾고 (AIPlayer, 수 목록, 수당 시간)을 반환합니다.
+    """
+    ai = AIPlayer(2, depth, stats=stats)
+    ai.get_best_move(build_board(Board, positions[0]))  # 준비 실행 (측정에서 제외)
+    moves = []
+    start = time.perf_counter()
+    for position in positions:
+        moves.append(ai.get_best_move(build_board(Board, position)))
+        if stats:
+            assert ai.stats.to_dict()['nodes'] == ai.nodes
+    return ai, moves, (time.perf_counter() - start) / len(positions)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--positions", type=int, default=5)
+    parser.add_argument("--stones", type=int, default=12)
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--profile", choices=("cprofile", "pyinstrument"), default=None)
+    args = parser.parse_args()
+
+    positions = quiet_positions(args.positions, args.stones)
+    _, off_moves, off_time = bench(positions, args.depth, False)
+    ai, on_moves, on_time = bench(positions, args.depth, True)
+    assert off_moves == on_moves
+    print(f"통계 끔: {off_time:.3f}s/수")
+    print(f"통계 켬: {on_time:.3f}s/수 ({on_time / off_time:.2f}배)")
+    print(ai.stats.to_json(indent=2))
+
+    if args.profile:
+        move, report = profile_search(AIPlayer(2, args.depth),
+                                      build_board(Board, positions[0]), args.profile)
+        print(f"\n프로파일 ({args.profile}), 선택한 수 {move}")
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
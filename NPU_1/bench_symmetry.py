@@ -0,0 +1,103 @@
+"""
+대칭 정규화(symmetry.py) 확인과 치환표 공유 효과 벤치마크
+1. 무작위 보드를 8가지로 변환해도 정규화 해시가 같은지, 수 변환과 역변환이 맞는지,
+   증분으로 유지한 해시가 처음부터 계산한 값과 같은지 확인합니다.
+2. 초반 국면에서 치환표 키를 일반 해시/정규화 해시로 바꾸어 적중률, 노드 수, 수당 시간을 비교합니다.
+
+사용법:
+    python3 bench_symmetry.py [--boards 50] [--positions 6] [--depth 4]
+"""
+import argparse
+import random
+import time
+
+from ai_player import AIPlayer
+from bench_board import build_board
+from bench_numpy import random_boards
+from board import Board
+from symmetry import (SYMMETRY_COUNT, SymmetricKeys, canonicalize, inverse_move,
+                      transform_board, transform_move)
+
+
+def verify_symmetry(boards, seed=0):
+    """
+    정규화 해시의 대칭 불변성과 증분 갱신이 올바른지 확인합니다.
+    """
+    rng = random.Random(seed)
+    for board in boards:
+        keys = SymmetricKeys.from_board(board)
+        canonical_board, _ = canonicalize(board)
+        for transform in range(SYMMETRY_COUNT):
+            moved = transform_board(board, transform)
+            assert SymmetricKeys.from_board(moved).key() == keys.key()
+            assert canonicalize(moved)[0].hash == canonical_board.hash
+            move = (rng.randrange(board.size), rng.randrange(board.size))
+            assert inverse_move(transform_move(move, transform, board.size),
+                                transform, board.size) == move
+
+        # 돌을 놓고 되돌리며 증분 해시가 처음부터 계산한 값과 같은지 확인
+        history = []
+        for _ in range(20):
+            if history and rng.random() < 0.4:
+                row, col, player = history.pop()
+                board.remove_stone(row, col)
+                keys.unmake(row, col, player)
+            else:
+                row, col = rng.randrange(board.size), rng.randrange(board.size)
+                player = rng.choice((1, 2))
+                if not board.place_stone(row, col, player):
+                    continue
+                keys.make(row, col, player)
+                history.append((row, col, player))
+            assert keys.hashes == SymmetricKeys.from_board(board).hashes
+
+
+def opening_positions(count, seed=0):
+    """
+    중앙 근처에 돌 1~3개가 놓인 초반 국면들을 만듭니다. (대칭인 수순이 많은 국면)
+    """
+    rng = random.Random(seed)
+    positions = []
+    for _ in range(count):
+        moves = [(10, 10, 1)]
+        for i in range(rng.randint(0, 2)):
+            moves.append((10 + rng.randint(-1, 1), 10 + rng.randint(-1, 1), 2 - i % 2))
+        positions.append(list(dict.fromkeys(moves)))
+    return positions
+
+
+def bench(positions, depth, tt_symmetry):
+    """
+    각 국면에서 get_best_move 를 실행하고 (수당 시간, 노드 수, 적중률)을 반환합니다.
+    """
+    ai = AIPlayer(2, depth, threat_nodes=0, tt_symmetry=tt_symmetry)
+    nodes = probes = hits = 0
+    start = time.perf_counter()
+    for position in positions:
+        ai.get_best_move(build_board(Board, position))
+        nodes += ai.nodes
+        stats = ai.transposition_table.get_stats()
+        probes += stats['probes']
+        hits += stats['hits']
+    elapsed = time.perf_counter() - start
+    return elapsed / len(positions), nodes, hits / probes if probes else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--boards", type=int, default=50)
+    parser.add_argument("--positions", type=int, default=6)
+    parser.add_argument("--depth", type=int, default=4)
+    args = parser.parse_args()
+
+    verify_symmetry(random_boards(args.boards))
+    print(f"대칭 정규화 확인 완료 ({args.boards}개 보드)")
+
+    positions = opening_positions(args.positions)
+    for label, tt_symmetry in (("일반 해시  ", False), ("정규화 해시", True)):
+        per_move, nodes, hit_rate = bench(positions, args.depth, tt_symmetry)
+        print(f"{label}: {per_move:.3f}s/수, 노드 {nodes:,}개, 적중률 {hit_rate * 100:.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+minimax 의 종료(승리) 판정 방식 비교 마이크로 벤치마크
+노드마다 판 전체를 find_winner 로 훑는 방식(이전)과 마지막 수 주변만 check_winner 로
+확인하는 방식(현재)을 같은 중반 국면들에서 실행하여 초당 탐색 국면 수를 비교합니다.
+
+사용법:
+    python3 bench_terminal.py [--positions 5] [--depth 3]
+"""
+import argparse
+import time
+
+from ai_player import AIPlayer
+from bench_board import build_board, make_positions
+from bitboard import BitBoard
+from board import Board
+
+
+class FullScanAIPlayer(AIPlayer):
+    """
+    마지막 수 정보를 버리고 노드마다 판 전체의 승자를 확인하는 AIPlayer (이전 방식)
+    """
+    def minimax(self, board, depth, alpha, beta, maximizing_player, last_move=None):
+        return super().minimax(board, depth, alpha, beta, maximizing_player)
+
+
+def quiet_positions(count, stones):
+    """
+    즉시 승리/방어 수나 강제 승리/차단 수가 없어 get_best_move 가 실제로 탐색하는 국면들만 고릅니다.
+    """
+    positions = []
+    seed = 0
+    while len(positions) < count:
+        for position in make_positions(count, stones, seed=seed):
+            board = build_board(Board, position)
+            ai = AIPlayer(2)
+            if (ai.find_immediate_win_or_block(board) is None
+                    and ai.find_threat_move(board) is None):
+                positions.append(position)
+        seed += 1
+    return positions[:count]
+
+
+def bench(player_class, board_class, positions, depth):
+    """
+    각 국면에서 get_best_move 를 실행하고 (선택한 수 목록, 초당 탐색 국면 수)를 반환합니다.
+    """
+    ai = player_class(2, depth)
+    moves = []
+    nodes = 0
+    start = time.perf_counter()
+    for position in positions:
+        moves.append(ai.get_best_move(build_board(board_class, position)))
+        nodes += ai.nodes
+    return moves, nodes / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--positions", type=int, default=5)
+    parser.add_argument("--stones", type=int, default=12)
+    parser.add_argument("--depth", type=int, default=3)
+    args = parser.parse_args()
+
+    positions = quiet_positions(args.positions, args.stones)
+    for name, board_class in (("list", Board), ("bitboard", BitBoard)):
+        before_moves, before_rate = bench(FullScanAIPlayer, board_class, positions, args.depth)
+        after_moves, after_rate = bench(AIPlayer, board_class, positions, args.depth)
+        assert before_moves == after_moves
+        print(f"{name:>8}: 판 전체 확인 {before_rate:,.0f} positions/s -> "
+              f"마지막 수 확인 {after_rate:,.0f} positions/s ({after_rate / before_rate:.1f}배)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""
+위협 공간 탐색(ThreatSolver) 확인과 벤치마크
+1. 무작위 국면에서 찾은 강제 승리 수순을 실제 보드에 두어 보며 올바른지 확인합니다.
+   (공격 수마다 승리 칸이 생기고, 응수는 그 칸을 막으며, 마지막 수는 4목이거나 승리 칸이 두 곳)
+2. 즉시 승리/차단 수 찾기를 빈칸 전체 확인 방식과 비교합니다. (결과와 시간)
+3. 강제 수순을 찾은 국면 비율과 탐색 노드 수, 시간을 출력합니다.
+4. 무작위 국면 대부분은 첫 수에 승리 칸이 두 곳 생기는 얕은 수순(1노드)이므로, 공격 수가 3수 이상
+   필요한 깊은 수순 국면만 따로 모아 확인하고 노드 수와 시간을 측정합니다.
+5. 상대에게 깊은 강제 승리가 있는 국면에서 AIPlayer.solve_threats 가 막는 수 후보마다 다시 탐색해도
+   전체 노드 수가 threat_nodes 예산을 넘지 않는지, 찾은 막는 수가 실제로 상대의 강제 승리를 없애는지 확인합니다.
+
+사용법:
+    python3 bench_threats.py [--positions 300] [--stones 16] [--deep 30]
+"""
+import argparse
+import time
+
+from ai_player import AIPlayer
+from bench_board import build_board, make_positions
+from board import Board
+from solved_cache import OUTCOME_DEFENDED
+from threats import ThreatSolver
+
+DEEP_NODES = 200000  # 깊은 수순 국면을 고를 때의 넉넉한 노드 예산
+
+
+def full_scan_immediate(ai, board):
+    """
+    이전 방식: 모든 빈칸에 돌을 놓아 보고 check_winner 로 즉시 승리/차단 수를 찾습니다.
+    """
+    for player in (ai.player, ai.opponent):
+        for row, col in board.get_empty_positions():
+            board.place_stone(row, col, player)
+            won = board.check_winner(row, col, player)
+            board.remove_stone(row, col)
+            if won:
+                return (row, col)
+    return None
+
+
+def winning_count(board, player):
+    """
+    player 가 두면 바로 4목이 되는 빈칸 수를 셉니다. (빈칸 전체 확인)
+    """
+    count = 0
+    for row, col in board.get_empty_positions():
+        board.place_stone(row, col, player)
+        count += board.check_winner(row, col, player)
+        board.remove_stone(row, col)
+    return count
+
+
+def verify_line(board, attacker, line):
+    """
+    강제 승리 수순을 보드에 두어 보며 올바른지 확인합니다.
+    """
+    defender = 2 if attacker == 1 else 1
+    board = board.copy()
+    for i, (row, col) in enumerate(line):
+        player = attacker if i % 2 == 0 else defender
+        if player == defender:
+            # 응수는 공격 수가 만든 하나뿐인 승리 칸이어야 함
+            board.place_stone(row, col, attacker)
+            assert board.check_winner(row, col, attacker)
+            board.remove_stone(row, col)
+        assert board.place_stone(row, col, player)
+        if player == attacker:
+            assert winning_count(board, defender) == 0 or i == len(line) - 1
+            threats = winning_count(board, attacker)
+            assert threats >= 1 or board.check_winner(row, col, attacker)
+
+    row, col = line[-1]
+    assert board.check_winner(row, col, attacker) or winning_count(board, attacker) >= 2
+
+
+def deep_positions(count, attacker, min_attacks=3, stones=10):
+    """
+    백 차례이고 즉시 승리/차단이 없는 무작위 국면 중 attacker 의 강제 승리에
+    공격 수가 min_attacks 개 이상 필요한 국면들을 모읍니다.
+
+    Returns:
+        list: (보드, 강제 승리 수순) 튜플들의 리스트
+    """
+    ai = AIPlayer(2, tt_memory_mb=None)
+    found = []
+    seed = 0
+    while len(found) < count:
+        for position in make_positions(200, stones, seed=seed):
+            board = build_board(Board, position)
+            if ai.find_immediate_win_or_block(board) is not None:
+                continue
+            if attacker == 1 and ThreatSolver(board, DEEP_NODES).find_win(2):
+                continue  # 백이 먼저 이기는 국면은 막을 필요가 없음
+            line = ThreatSolver(board, DEEP_NODES).find_win(attacker)
+            if line and (len(line) + 1) // 2 >= min_attacks:
+                found.append((board, line))
+                if len(found) == count:
+                    break
+        seed += 1
+    return found
+
+
+def bench_deep(positions):
+    """
+    깊은 강제 승리 국면에서 수순을 확인하고 (평균 노드 수, 최대 노드 수, 국면당 ms, 최장 공격 수)를 반환합니다.
+    """
+    nodes = []
+    longest = 0
+    start = time.perf_counter()
+    for board, _ in positions:
+        solver = ThreatSolver(board)
+        line = solver.find_win(2)
+        assert line is not None
+        verify_line(board, 2, line)
+        nodes.append(solver.nodes)
+        longest = max(longest, (len(line) + 1) // 2)
+    elapsed = time.perf_counter() - start
+    return sum(nodes) / len(nodes), max(nodes), elapsed / len(positions) * 1e3, longest
+
+
+def verify_defence(positions, budgets):
+    """
+    상대(흑)의 깊은 강제 승리를 막을 때 전체 노드 수가 예산 안인지, 막는 수가 맞는지 확인합니다.
+
+    Returns:
+        dict: 예산별 (막은 국면 수, 평균 노드 수, 최대 노드 수)
+    """
+    results = {}
+    for budget in budgets:
+        ai = AIPlayer(2, tt_memory_mb=None, threat_nodes=budget)
+        defended = 0
+        used = []
+        for board, _ in positions:
+            outcome, move = ai.solve_threats(board)
+            # 예산을 넘는 노드는 하나(예산 초과를 알아챈 노드)뿐
+            assert ai.threat_search_nodes <= budget + 1, (budget, ai.threat_search_nodes)
+            used.append(ai.threat_search_nodes)
+            if outcome == OUTCOME_DEFENDED:
+                defended += 1
+                after = board.copy()
+                after.place_stone(*move, 2)
+                assert ThreatSolver(after, DEEP_NODES).find_win(1) is None
+        results[budget] = (defended, sum(used) / len(used), max(used))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--positions", type=int, default=300)
+    parser.add_argument("--stones", type=int, default=16)
+    parser.add_argument("--nodes", type=int, default=20000)
+    parser.add_argument("--deep", type=int, default=30, help="깊은 강제 수순 국면 수")
+    args = parser.parse_args()
+
+    boards = [build_board(Board, position)
+              for position in make_positions(args.positions, args.stones)]
+    boards = [board for board in boards if board.find_winner() is None]
+
+    ai = AIPlayer(2)
+    start = time.perf_counter()
+    scan_moves = [full_scan_immediate(ai, board) for board in boards]
+    scan_time = time.perf_counter() - start
+    start = time.perf_counter()
+    window_moves = [ai.find_immediate_win_or_block(board) for board in boards]
+    window_time = time.perf_counter() - start
+    assert scan_moves == window_moves
+    print(f"즉시 승리/차단 일치 확인 완료 ({len(boards)}개 국면)")
+    print(f"빈칸 전체 확인: {scan_time / len(boards) * 1e3:.2f}ms/국면, "
+          f"윈도우 확인: {window_time / len(boards) * 1e3:.2f}ms/국면 "
+          f"({scan_time / window_time:.1f}배)")
+
+    found = 0
+    nodes = 0
+    longest = 0
+    start = time.perf_counter()
+    for board, immediate in zip(boards, window_moves):
+        if immediate is not None:
+            continue
+        solver = ThreatSolver(board, args.nodes)
+        line = solver.find_win(2)
+        nodes += solver.nodes
+        if line:
+            verify_line(board, 2, line)
+            found += 1
+            longest = max(longest, (len(line) + 1) // 2)
+    elapsed = time.perf_counter() - start
+    quiet = sum(1 for move in window_moves if move is None)
+    print(f"강제 승리 수순 확인 완료: {quiet}개 국면 중 {found}개에서 발견 "
+          f"(최장 공격 {longest}수)")
+    print(f"위협 공간 탐색: {elapsed / max(quiet, 1) * 1e3:.2f}ms/국면, "
+          f"평균 {nodes / max(quiet, 1):.1f}노드/국면")
+
+    attacks = deep_positions(args.deep, 2)
+    mean_nodes, max_nodes, per_position, longest = bench_deep(attacks)
+    print(f"깊은 강제 승리 확인 완료 ({len(attacks)}개 국면, 공격 3-{longest}수): "
+          f"{per_position:.2f}ms/국면, 평균 {mean_nodes:.1f}노드, 최대 {max_nodes}노드")
+
+    defences = deep_positions(args.deep, 1)
+    for budget, (defended, mean_used, max_used) in verify_defence(defences, (20, 200, args.nodes)).items():
+        print(f"상대의 깊은 강제 승리 막기 (예산 {budget}노드): {len(defences)}개 국면 중 {defended}개 막음, "
+              f"막는 수 확인 포함 평균 {mean_used:.1f}노드, 최대 {max_used}노드")
+
+
+if __name__ == "__main__":
+    main()
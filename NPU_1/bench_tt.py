@@ -0,0 +1,124 @@
+"""
+치환표(Transposition Table) 효과 측정 벤치마크
+같은 중반 국면들에서 AI끼리 몇 수를 두게 하여 치환표 없음/수마다 비움/계속 유지
+세 가지 설정의 수당 시간과 적중률, 저장된 항목 수를 비교합니다.
+
+사용법:
+    python3 bench_tt.py [--positions 2] [--moves 4] [--depth 4]
+
+깊이 3에서는 같은 국면이 리프(깊이 0)에서만 다시 나타나므로 치환표 적중이 거의 없습니다.
+"""
+import argparse
+import math
+import time
+
+from ai_player import AIPlayer
+from bench_board import build_board, make_positions
+from board import Board
+from transposition import EXACT, LOWER_BOUND, WIN_SCORE, TranspositionTable
+
+
+def verify_hash(positions):
+    """
+    증분으로 갱신한 해시가 돌들로부터 새로 계산한 해시와 같은지 확인합니다.
+    """
+    for position in positions:
+        board = build_board(Board, position)
+        expected = 0
+        for row, col, player in position:
+            expected ^= board.zobrist[player][row * board.size + col]
+        assert board.hash == expected
+        assert board.copy().hash == expected
+        for row, col, _ in reversed(position):
+            board.remove_stone(row, col)
+        assert board.hash == 0
+
+
+def verify_win_distance():
+    """
+    승리 점수가 저장한 노드로부터의 거리로 저장되어, 다른 깊이에서 찾아도 거리가 맞는지 확인합니다.
+    """
+    table = TranspositionTable(1)
+    # 남은 깊이 3인 노드에서 2수 뒤 승리 (승리한 노드의 남은 깊이 1)
+    table.store(1, 3, WIN_SCORE + 1, EXACT)
+    assert table.probe(1, 3, -math.inf, math.inf) == WIN_SCORE + 1
+    # 같은 국면을 남은 깊이 2에서 만나면 2수 뒤 승리한 노드의 남은 깊이는 0
+    assert table.probe(1, 2, -math.inf, math.inf) == WIN_SCORE
+    # 패배 점수와 하한도 같은 방식
+    table.store(2, 4, -WIN_SCORE - 3, EXACT)
+    assert table.probe(2, 1, -math.inf, math.inf) == -WIN_SCORE
+    table.store(3, 2, WIN_SCORE + 2, LOWER_BOUND)
+    assert table.probe(3, 1, -math.inf, WIN_SCORE) == WIN_SCORE + 1
+    # 평가 점수는 바꾸지 않음
+    table.store(4, 3, 4321, EXACT)
+    assert table.probe(4, 1, -math.inf, math.inf) == 4321
+
+
+def play_out(positions, moves, depth, **options):
+    """
+    각 국면에서 같은 설정의 AI 둘이 번갈아 moves 수를 둡니다.
+
+    Returns:
+        tuple: (둔 수들의 목록, 수당 평균 시간, 치환표 통계 목록)
+    """
+    # 치환표 효과만 보도록 위협 공간 탐색은 끔 (켜면 대부분의 수가 탐색 없이 정해짐)
+    options.setdefault('threat_nodes', 0)
+    players = {1: AIPlayer(1, depth, **options), 2: AIPlayer(2, depth, **options)}
+    played = []
+    stats = []
+    elapsed = 0.0
+    for position in positions:
+        board = build_board(Board, position)
+        player = 1 if len(position) % 2 == 0 else 2
+        for _ in range(moves):
+            start = time.perf_counter()
+            move = players[player].get_best_move(board)
+            elapsed += time.perf_counter() - start
+            played.append(move)
+            table = players[player].transposition_table
+            if table is not None:
+                stats.append(table.get_stats())
+            board.place_stone(move[0], move[1], player)
+            if board.check_winner(move[0], move[1], player):
+                break
+            player = 3 - player
+    return played, elapsed / len(played), stats
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--positions", type=int, default=2)
+    parser.add_argument("--stones", type=int, default=12)
+    parser.add_argument("--moves", type=int, default=4)
+    parser.add_argument("--depth", type=int, default=4)
+    args = parser.parse_args()
+
+    positions = make_positions(args.positions, args.stones)
+    verify_hash(positions)
+    verify_win_distance()
+
+    configs = [
+        ("치환표 없음", {'tt_memory_mb': None}),
+        ("수마다 비움", {'tt_memory_mb': 16}),
+        ("계속 유지  ", {'tt_memory_mb': 16, 'keep_tt': True}),
+    ]
+    baseline_moves = None
+    for name, options in configs:
+        played, per_move, stats = play_out(positions, args.moves, args.depth, **options)
+        line = f"{name}: {per_move:.3f}s/수"
+        if stats:
+            probes = sum(s['probes'] for s in stats)
+            hits = sum(s['hits'] for s in stats)
+            entries = max(s['entries'] for s in stats)
+            line += f", 적중률 {hits / max(1, probes):.1%} ({hits}/{probes}), 최대 저장 항목 {entries}"
+        print(line)
+
+        if baseline_moves is None:
+            baseline_moves = played
+        elif not options.get('keep_tt'):
+            # 한 수 안에서는 치환표가 탐색 결과를 바꾸지 않아야 합니다
+            assert played == baseline_moves
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,327 @@
+"""
+비트보드 기반의 Board 구현
+플레이어마다 네 방향(가로/세로/대각선 두 개)의 줄별 작은 정수(비트보드)로 돌의 위치를 관리하고,
+칸 단위 격자 사본은 두지 않습니다.
+
+- 줄마다 정수 하나에 그 줄의 칸들이 연속된 비트로 들어 있습니다. (앞에 win_length - 1 개의 빈 패딩 비트)
+  플레이어마다 가로 줄들, 세로 줄들, 우하향 대각선 줄들, 우상향 대각선 줄들을 리스트 하나에 이어 둡니다.
+  돌을 놓고 되돌릴 때는 네 방향의 줄 정수에서 그 칸의 비트만 뒤집습니다.
+- 승리 확인은 방향마다 놓은 칸을 가운데로 한 2 * win_length - 1 칸 구간을 잘라내고,
+  네 구간을 빈 비트 하나씩을 사이에 두고 한 정수로 이어 붙인 뒤 시프트/AND 한 번으로 연속을 찾습니다.
+- 판 전체 승자 검사와 빈칸 목록은 가로 줄 정수들을 판 전체 정수 하나로 이어 붙여 시프트/AND 로 처리합니다.
+"""
+from board import Board
+from zobrist import get_zobrist_table
+
+# (판 크기, 승리 길이)별 비트 배치 표 캐시
+_layout_cache = {}
+
+
+def get_layout(size, win_length):
+    """
+    방향별 줄 비트보드의 배치 표를 반환합니다.
+
+    Args:
+        size (int): 바둑판 크기
+        win_length (int): 승리에 필요한 연속 돌 수
+
+    Returns:
+        tuple: (칸 번호별 방향마다 (줄 번호, 구간 시작 비트 번호)를 이어 붙인 8개 튜플,
+                칸 번호별 방향마다 (줄 번호, 칸의 비트)를 이어 붙인 8개 튜플)
+                줄 번호는 가로, 세로, 우하향, 우상향 줄들을 이어 둔 리스트의 인덱스
+    """
+    if (size, win_length) not in _layout_cache:
+        pad = win_length - 1
+        diagonals = 2 * size - 1
+        slots = []
+        toggles = []
+        for row in range(size):
+            for col in range(size):
+                # (줄 번호, 줄 안의 위치): 가로, 세로, 우하향 대각선, 우상향 대각선
+                lines = ((row, col), (size + col, row),
+                         (2 * size + row - col + size - 1, col), (2 * size + diagonals + row + col, col))
+                slots.append(tuple(value for line in lines for value in line))
+                toggles.append(tuple(value for line, along in lines for value in (line, 1 << (along + pad))))
+        _layout_cache[size, win_length] = (slots, toggles)
+    return _layout_cache[size, win_length]
+
+
+class BitBoard(Board):
+    def __init__(self, size=20, win_length=4):
+        """
+        비트보드 바둑판을 초기화합니다. (기본값: 20x20)
+
+        Args:
+            size (int): 바둑판의 크기 (명세서 조건: 20x20)
+            win_length (int): 승리에 필요한 연속 돌 수 (명세서 조건: 4)
+        """
+        self.size = size
+        self.win_length = win_length
+        self.EMPTY = 0
+        self.PLAYER1 = 1  # 흑돌
+        self.PLAYER2 = 2  # 백돌
+        self._slots, self._toggles = get_layout(size, win_length)
+        # 플레이어 번호로 인덱싱 (0번은 사용하지 않음),
+        # 가로 줄 size 개, 세로 줄 size 개, 우하향/우상향 대각선 줄 2 * size - 1 개씩의 정수 리스트
+        self.lines = [None] + [[0] * (2 * size + 2 * (2 * size - 1)) for _ in range(2)]
+
+        # Zobrist 해시 (place_stone/remove_stone 에서 증분으로 갱신)
+        self.zobrist = get_zobrist_table(size)
+        self.hash = 0
+        self.stones = {}  # {칸 번호: 플레이어}, Board.stones 와 같음
+        self.move_stack = []  # 탐색용 수 스택 (Board 와 같음)
+        self.listeners = []  # make_move/unmake_move 때 함께 갱신할 증분 상태들
+
+        pad = win_length - 1
+        self._pad = pad
+        self.stride = size + pad  # 판 전체 정수에서 한 행의 비트 수
+        # 판 전체 정수에서 가로, 세로, 대각선(우하향), 대각선(우상향) 방향의 비트 이동량 (find_winner)
+        self._shifts = (1, self.stride, self.stride + 1, self.stride - 1)
+
+        # win_length 연속을 구할 때 쓰는 이동 칸 수 (1, 2, 4, ... 로 두 배씩 늘린 뒤 나머지)
+        # 4목이면 (1, 2): b & (b >> d) 로 2연속, 다시 >> 2d 와 AND 하여 4연속
+        steps = []
+        length = 1
+        while length * 2 <= win_length:
+            steps.append(length)
+            length *= 2
+        if length < win_length:
+            steps.append(win_length - length)
+        self._run_steps = tuple(steps)
+        # 시작 비트를 거꾸로 같은 칸 수만큼 펼치면 줄 전체 (0 ~ win_length-1 칸)를 덮음
+        self._spread_steps = tuple(reversed(steps))
+
+        # 승리 확인 구간: 놓은 칸을 가운데(pad 번 비트)로 한 2 * win_length - 1 칸
+        # (이 구간 안의 win_length 연속은 모두 가운데 칸을 지남)
+        # 네 방향의 구간을 lane 비트 간격으로 이어 붙이고, 구간 사이의 빈 비트가 연속을 끊음
+        self._segment_mask = (1 << (2 * win_length - 1)) - 1
+        self._lane = 2 * win_length
+        self._centers = sum(1 << (pad + k * self._lane) for k in range(4))
+
+        # 가로 줄 하나에서 실제 칸에 해당하는 비트 마스크 (패딩 제외)
+        self._row_mask = ((1 << size) - 1) << pad
+        self.full_mask = 0
+        for row in range(size):
+            self.full_mask |= self._row_mask << (row * self.stride)
+
+        # 판 전체 정수의 비트 인덱스 -> (row, col) 변환표 (패딩은 None)
+        self._cells = [None] * (size * self.stride)
+        for row in range(size):
+            for col in range(size):
+                self._cells[row * self.stride + pad + col] = (row, col)
+
+    @property
+    def board(self):
+        """
+        칸 단위 격자 board[row][col] 를 놓인 돌들로 새로 만들어 반환합니다.
+        (배열 변환용, 화면 출력은 row_values, 탐색 중에는 stones 나 비트보드를 사용)
+        """
+        size = self.size
+        grid = [[0] * size for _ in range(size)]
+        for cell, player in self.stones.items():
+            grid[cell // size][cell % size] = player
+        return grid
+
+    def row_values(self, row):
+        """
+        row 행의 칸 값(0: 빈칸, 1: 흑돌, 2: 백돌) 목록을 그 행의 가로 줄 정수 두 개에서 만들어 반환합니다.
+        (격자 전체를 만드는 board 와 달리 한 행의 칸 수에 비례하는 비용)
+        """
+        black = self.lines[1][row] >> self._pad
+        white = self.lines[2][row] >> self._pad
+        return [(black >> col & 1) | (white >> col & 1) << 1 for col in range(self.size)]
+
+    def _joined(self, player):
+        """
+        player 의 가로 줄 정수들을 행 순서로 이어 붙인 판 전체 정수를 반환합니다.
+        """
+        stride = self.stride
+        joined = 0
+        for row, bits in enumerate(self.lines[player][:self.size]):
+            joined |= bits << (row * stride)
+        return joined
+
+    def is_valid_move(self, row, col):
+        """
+        주어진 위치에 돌을 놓을 수 있는지 확인합니다.
+
+        Args:
+            row (int): 행 번호
+            col (int): 열 번호
+
+        Returns:
+            bool: 유효한 위치이면 True, 아니면 False
+        """
+        return (0 <= row < self.size and
+                0 <= col < self.size and
+                not ((self.lines[1][row] | self.lines[2][row]) >> (col + self._pad)) & 1)
+
+    def _toggle(self, cell, player):
+        """
+        칸 번호 cell 의 player 비트를 네 방향의 줄 정수에서 뒤집습니다.
+        """
+        line0, bit0, line1, bit1, line2, bit2, line3, bit3 = self._toggles[cell]
+        lines = self.lines[player]
+        lines[line0] ^= bit0
+        lines[line1] ^= bit1
+        lines[line2] ^= bit2
+        lines[line3] ^= bit3
+
+    def place_stone(self, row, col, player):
+        """
+        지정된 위치에 돌을 놓습니다.
+
+        Args:
+            row (int): 행 번호
+            col (int): 열 번호
+            player (int): 플레이어 번호 (1 또는 2)
+
+        Returns:
+            bool: 성공적으로 돌을 놓았으면 True, 실패하면 False
+        """
+        if self.is_valid_move(row, col):
+            cell = row * self.size + col
+            self._toggle(cell, player)
+            self.hash ^= self.zobrist[player][cell]
+            self.stones[cell] = player
+            return True
+        return False
+
+    def remove_stone(self, row, col):
+        """
+        지정된 위치의 돌을 제거합니다. (탐색 중 수 되돌리기용)
+
+        Args:
+            row (int): 행 번호
+            col (int): 열 번호
+        """
+        cell = row * self.size + col
+        player = self.stones.pop(cell)
+        self._toggle(cell, player)
+        self.hash ^= self.zobrist[player][cell]
+
+    def make_move(self, row, col, player):
+        """
+        탐색 중 돌을 놓습니다. (Board.make_move 와 같고 줄 비트보드도 갱신)
+        """
+        cell = row * self.size + col
+        # _toggle 을 펼쳐 씀 (탐색 노드마다 불리므로 호출 비용을 줄임)
+        line0, bit0, line1, bit1, line2, bit2, line3, bit3 = self._toggles[cell]
+        lines = self.lines[player]
+        lines[line0] ^= bit0
+        lines[line1] ^= bit1
+        lines[line2] ^= bit2
+        lines[line3] ^= bit3
+        self.hash ^= self.zobrist[player][cell]
+        self.stones[cell] = player
+        self.move_stack.append(cell)
+        for listener in self.listeners:
+            listener.make(row, col, player)
+
+    def unmake_move(self):
+        """
+        make_move 로 마지막에 놓은 돌을 되돌립니다.
+        """
+        cell = self.move_stack.pop()
+        row = cell // self.size
+        col = cell - row * self.size
+        player = self.stones.pop(cell)
+        line0, bit0, line1, bit1, line2, bit2, line3, bit3 = self._toggles[cell]
+        lines = self.lines[player]
+        lines[line0] ^= bit0
+        lines[line1] ^= bit1
+        lines[line2] ^= bit2
+        lines[line3] ^= bit3
+        self.hash ^= self.zobrist[player][cell]
+        for listener in self.listeners:
+            listener.unmake(row, col, player)
+
+    def check_winner(self, row, col, player):
+        """
+        최근에 놓은 돌을 기준으로 승리 조건(win_length 목, 기본 4목)을 확인합니다.
+
+        네 방향마다 (row, col)을 가운데로 한 구간을 줄 정수에서 잘라내 한 정수로 이어 붙이고,
+        4목이면 s & (s >> 1) 과 다시 >> 2 를 AND 하여 연속의 시작 비트가 남는지 확인합니다.
+
+        Args:
+            row (int): 최근에 놓은 돌의 행 번호
+            col (int): 최근에 놓은 돌의 열 번호
+            player (int): 플레이어 번호
+
+        Returns:
+            bool: 승리 조건을 만족하면 True, 아니면 False
+        """
+        line0, start0, line1, start1, line2, start2, line3, start3 = self._slots[row * self.size + col]
+        lines = self.lines[player]
+        mask = self._segment_mask
+        lane = self._lane
+        # 기존 구현처럼 현재 위치는 항상 포함 (_centers)
+        runs = ((lines[line0] >> start0 & mask) |
+                (lines[line1] >> start1 & mask) << lane |
+                (lines[line2] >> start2 & mask) << 2 * lane |
+                (lines[line3] >> start3 & mask) << 3 * lane |
+                self._centers)
+        for step in self._run_steps:
+            runs &= runs >> step
+        return runs != 0
+
+    def find_winner(self):
+        """
+        바둑판 전체에서 승리 조건을 완성한 플레이어를 찾습니다.
+        플레이어마다 가로 줄들을 이어 붙인 판 전체 정수의 네 방향 시프트/AND 연산으로 한 번에 검사합니다.
+
+        Returns:
+            int: 승리한 플레이어 번호, 없으면 None
+        """
+        winner = None
+        first_index = None
+
+        steps = self._run_steps
+        reversed_steps = self._spread_steps
+        for player in (self.PLAYER1, self.PLAYER2):
+            stones = self._joined(player)
+            members = 0  # 승리 줄에 속한 돌들의 비트
+            for shift in self._shifts:
+                runs = stones
+                for step in steps:
+                    runs &= runs >> (step * shift)
+                if runs:
+                    for step in reversed_steps:
+                        runs |= runs << (step * shift)
+                    members |= runs
+
+            if members:
+                # 기존 구현과 같이 행 우선 순서로 먼저 나오는 돌의 플레이어를 승자로 판단
+                index = (members & -members).bit_length()
+                if first_index is None or index < first_index:
+                    first_index = index
+                    winner = player
+
+        return winner
+
+    def get_empty_positions(self):
+        """
+        비어있는 위치들의 리스트를 반환합니다. (행 우선 순서)
+
+        Returns:
+            list: (row, col) 튜플들의 리스트
+        """
+        empty = self.full_mask & ~(self._joined(1) | self._joined(2))
+        cells = self._cells
+        # bin() 문자열을 뒤집으면 i번째 문자가 i번째 비트가 됩니다
+        return [cells[i] for i, bit in enumerate(bin(empty)[:1:-1]) if bit == '1']
+
+    def copy(self):
+        """
+        현재 보드의 복사본을 만듭니다. (줄 비트보드 리스트 복사)
+
+        Returns:
+            BitBoard: 현재 보드의 복사본
+        """
+        new_board = self.__class__.__new__(self.__class__)
+        new_board.__dict__.update(self.__dict__)
+        new_board.lines = [None, list(self.lines[1]), list(self.lines[2])]
+        new_board.stones = dict(self.stones)
+        new_board.move_stack = list(self.move_stack)
+        new_board.listeners = []  # 증분 상태는 원래 보드에만 붙어 있음
+        return new_board
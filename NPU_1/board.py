@@ -1,63 +1,55 @@
 """
 4목 게임의 바둑판을 관리하는 Board 클래스
 20x20 크기의 바둑판에서 돌을 놓고 승리 조건을 확인하는 기능을 제공합니다.
+(판 크기와 승리에 필요한 연속 돌 수는 바꿀 수 있음)
 """
+import sys
+
+from renderer import render_board
+from zobrist import get_zobrist_table
+
 class Board:
-    def __init__(self, size=20):
+    def __init__(self, size=20, win_length=4):
         """
         바둑판을 초기화합니다. (기본값: 20x20)
         
         Args:
             size (int): 바둑판의 크기 (명세서 조건: 20x20)
+            win_length (int): 승리에 필요한 연속 돌 수 (명세서 조건: 4)
         """
         self.size = size
+        self.win_length = win_length
         self.board = [[0 for _ in range(size)] for _ in range(size)]
         self.EMPTY = 0
         self.PLAYER1 = 1  # 흑돌
         self.PLAYER2 = 2  # 백돌
+        
+        # Zobrist 해시 (place_stone/remove_stone 에서 증분으로 갱신)
+        self.zobrist = get_zobrist_table(size)
+        self.hash = 0
+        
+        # 놓인 돌 {칸 번호(row * size + col): 플레이어}, 놓은 순서대로
+        # 돌 수에 비례하는 비용으로 판을 훑을 수 있도록 유지 (넓은 판에서 빈칸까지 훑지 않음)
+        self.stones = {}
+        
+        # 탐색용 수 스택: make_move 로 둔 칸 번호를 쌓고 unmake_move 로 하나씩 되돌림
+        self.move_stack = []
+        # make_move/unmake_move 때 함께 갱신할 증분 상태들 (평가기, 후보 수 생성기, 대칭 해시 등)
+        self.listeners = []
     
     def display_board(self):
         """
         현재 바둑판 상태를 콘솔에 출력합니다. (바둑판 스타일 - 교차점에 돌 배치)
+        칸마다 print 를 부르지 않고 바둑판 전체를 문자열 하나로 만들어 한 번에 출력합니다.
         """
-        # 상단 열 번호 출력
-        print("   ", end="")
-        for i in range(self.size):
-            print(f"{i:2}", end=" ")
-        print()
-        
-        # 바둑판 격자 출력
-        for i in range(self.size):
-            # 행 번호 출력
-            print(f"{i:2}:", end="")
-            
-            # 각 교차점과 선 출력
-            for j in range(self.size):
-                # 돌이 있는 경우 돌을 출력
-                if self.board[i][j] == self.PLAYER1:
-                    print(" ●", end="")
-                elif self.board[i][j] == self.PLAYER2:
-                    print(" ○", end="")
-                else:
-                    # 빈 교차점은 공백으로 표시
-                    print("  ", end="")
-                
-                # 가로선 출력 (마지막 열이 아닌 경우)
-                if j < self.size - 1:
-                    print("─", end="")
-            
-            print()  # 줄바꿈
-            
-            # 세로선 출력 (마지막 행이 아닌 경우)
-            if i < self.size - 1:
-                print("   ", end="")
-                for j in range(self.size):
-                    print(" │", end="")
-                    if j < self.size - 1:
-                        print(" ", end="")
-                print()
-        
-        print()
+        sys.stdout.write(render_board(self))
+        sys.stdout.flush()
+    
+    def row_values(self, row):
+        """
+        row 행의 칸 값(0: 빈칸, 1: 흑돌, 2: 백돌) 목록을 반환합니다. (화면 출력용, 수정하지 말 것)
+        """
+        return self.board[row]
     
     def is_valid_move(self, row, col):
         """
@@ -87,13 +79,86 @@ class Board:
             bool: 성공적으로 돌을 놓았으면 True, 실패하면 False
         """
         if self.is_valid_move(row, col):
+            cell = row * self.size + col
             self.board[row][col] = player
+            self.hash ^= self.zobrist[player][cell]
+            self.stones[cell] = player
             return True
         return False
     
+    def remove_stone(self, row, col):
+        """
+        지정된 위치의 돌을 제거합니다. (탐색 중 수 되돌리기용)
+        
+        Args:
+            row (int): 행 번호
+            col (int): 열 번호
+        """
+        cell = row * self.size + col
+        player = self.board[row][col]
+        self.hash ^= self.zobrist[player][cell]
+        self.board[row][col] = self.EMPTY
+        del self.stones[cell]
+    
+    def attach(self, listener):
+        """
+        make_move/unmake_move 때 함께 갱신할 증분 상태를 붙입니다.
+        
+        Args:
+            listener: make(row, col, player), unmake(row, col, player) 메서드를 가진 객체
+        """
+        self.listeners.append(listener)
+    
+    def detach(self, listener):
+        """
+        attach 로 붙인 증분 상태를 뗍니다.
+        """
+        self.listeners.remove(listener)
+    
+    def make_move(self, row, col, player):
+        """
+        탐색 중 돌을 놓습니다. (빈칸인지 확인하지 않으므로 후보 수에만 사용)
+        수 스택에 쌓고 Zobrist 해시와 붙어 있는 증분 상태들을 함께 갱신합니다.
+        
+        Args:
+            row (int): 행 번호
+            col (int): 열 번호
+            player (int): 플레이어 번호 (1 또는 2)
+        """
+        cell = row * self.size + col
+        self.board[row][col] = player
+        self.hash ^= self.zobrist[player][cell]
+        self.stones[cell] = player
+        self.move_stack.append(cell)
+        for listener in self.listeners:
+            listener.make(row, col, player)
+    
+    def unmake_move(self):
+        """
+        make_move 로 마지막에 놓은 돌을 되돌립니다.
+        """
+        cell = self.move_stack.pop()
+        row = cell // self.size
+        col = cell - row * self.size
+        player = self.stones.pop(cell)
+        self.board[row][col] = self.EMPTY
+        self.hash ^= self.zobrist[player][cell]
+        for listener in self.listeners:
+            listener.unmake(row, col, player)
+    
+    def undo_to(self, count):
+        """
+        수 스택에 count 개의 수만 남을 때까지 되돌립니다. (탐색이 중간에 멈췄을 때 정리용)
+        
+        Args:
+            count (int): 남길 수의 개수
+        """
+        while len(self.move_stack) > count:
+            self.unmake_move()
+    
     def check_winner(self, row, col, player):
         """
-        최근에 놓은 돌을 기준으로 승리 조건(4목)을 확인합니다.
+        최근에 놓은 돌을 기준으로 승리 조건(win_length 목, 기본 4목)을 확인합니다.
         
         Args:
             row (int): 최근에 놓은 돌의 행 번호
@@ -129,12 +194,27 @@ class Board:
                 count += 1
                 r, c = r - dr, c - dc
             
-            # 4개 이상 연속이면 승리
-            if count >= 4:
+            # win_length 개 이상 연속이면 승리
+            if count >= self.win_length:
                 return True
         
         return False
     
+    def find_winner(self):
+        """
+        바둑판 전체에서 승리 조건을 완성한 플레이어를 찾습니다.
+        (행 우선 순서로 가장 먼저 만나는 승리 돌의 플레이어, 빈칸은 훑지 않고 놓인 돌만 확인)
+        
+        Returns:
+            int: 승리한 플레이어 번호, 없으면 None
+        """
+        for cell in sorted(self.stones):
+            row, col = divmod(cell, self.size)
+            player = self.stones[cell]
+            if self.check_winner(row, col, player):
+                return player
+        return None
+    
     def is_board_full(self):
         """
         바둑판이 가득 찼는지 확인합니다.
@@ -142,10 +222,7 @@ class Board:
         Returns:
             bool: 바둑판이 가득 찼으면 True, 아니면 False
         """
-        for row in self.board:
-            if self.EMPTY in row:
-                return False
-        return True
+        return len(self.stones) == self.size * self.size
     
     def get_empty_positions(self):
         """
@@ -168,8 +245,11 @@ class Board:
         Returns:
             Board: 현재 보드의 복사본
         """
-        new_board = Board(self.size)
-        for i in range(self.size):
-            for j in range(self.size):
-                new_board.board[i][j] = self.board[i][j]
+        # 빈 판을 새로 만들지 않고 속성을 그대로 가져온 뒤 바뀌는 것만 복사
+        new_board = self.__class__.__new__(self.__class__)
+        new_board.__dict__.update(self.__dict__)
+        new_board.board = [row[:] for row in self.board]
+        new_board.stones = dict(self.stones)
+        new_board.move_stack = list(self.move_stack)
+        new_board.listeners = []  # 증분 상태는 원래 보드에만 붙어 있음
         return new_board
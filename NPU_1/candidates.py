@@ -0,0 +1,269 @@
+"""
+돌 주변의 빈칸만 후보 수로 관리하는 후보 수 생성기
+돌에서 거리 2 이내(5x5 범위)의 빈칸 목록과 칸별 영향도, 그리고 승리 길이 윈도우별 흑/백 돌 개수를
+증분으로 유지하고, 열린 줄(한쪽 색 돌만 있는 윈도우)의 위협 점수가 높은 순서로 후보 수를 돌려줍니다.
+"""
+from itertools import islice
+
+from evaluator import get_cell_windows, window_scores
+from threats import get_window_cells
+
+RADIUS = 2
+
+# 돌과의 상대 위치별 영향도: 같은 줄(가로/세로/대각선) 위의 칸에 더 큰 가중치
+ALIGNED_WEIGHTS = {1: 4, 2: 2}  # 같은 줄 위 거리 1, 2
+OFF_LINE_WEIGHT = 1             # 같은 줄이 아닌 칸 (나이트 위치)
+
+# 영향도는 위협 점수 1보다 작은 자리에 더함 (영향도 최댓값: 8 * 4 + 8 * 2 + 8 * 1 = 56)
+INFLUENCE_RANGE = 64
+
+# 판 크기별 (칸 -> [(이웃 칸, 가중치), ...]) 표 캐시
+_neighbor_cache = {}
+
+# 판 크기별 (칸 -> [(이웃 칸, 정렬 값 단위의 가중치), ...]) 표 캐시
+_ranked_neighbor_cache = {}
+
+# 판 크기별 (칸 번호 -> (row, col)) 표 캐시
+_cells_cache = {}
+
+# 판 크기/윈도우 길이별 (칸 -> [(윈도우 번호, 윈도우의 칸 번호들), ...]) 표 캐시
+_cell_lines_cache = {}
+
+
+def get_neighbors(size):
+    """
+    각 칸에서 거리 2 이내에 있는 이웃 칸들과 영향도 가중치를 반환합니다.
+
+    Args:
+        size (int): 바둑판 크기
+
+    Returns:
+        list: row * size + col 로 인덱싱한 ((이웃 칸 번호, 가중치), ...) 튜플들의 리스트
+    """
+    if size not in _neighbor_cache:
+        neighbors = []
+        for row in range(size):
+            for col in range(size):
+                cell_neighbors = []
+                for dr in range(-RADIUS, RADIUS + 1):
+                    for dc in range(-RADIUS, RADIUS + 1):
+                        r, c = row + dr, col + dc
+                        if (dr, dc) == (0, 0) or not (0 <= r < size and 0 <= c < size):
+                            continue
+                        if dr == 0 or dc == 0 or abs(dr) == abs(dc):
+                            weight = ALIGNED_WEIGHTS[max(abs(dr), abs(dc))]
+                        else:
+                            weight = OFF_LINE_WEIGHT
+                        cell_neighbors.append((r * size + c, weight))
+                neighbors.append(tuple(cell_neighbors))
+        _neighbor_cache[size] = neighbors
+    return _neighbor_cache[size]
+
+
+def get_ranked_neighbors(size):
+    """
+    get_neighbors 의 가중치를 정렬 값 단위(칸 수 배)로 바꾼 표를 반환합니다.
+    """
+    if size not in _ranked_neighbor_cache:
+        unit = size * size
+        _ranked_neighbor_cache[size] = [tuple((neighbor, weight * unit) for neighbor, weight in neighbors)
+                                        for neighbors in get_neighbors(size)]
+    return _ranked_neighbor_cache[size]
+
+
+def get_cells(size):
+    """
+    칸 번호(row * size + col)별 (row, col) 튜플 목록을 반환합니다.
+    """
+    if size not in _cells_cache:
+        _cells_cache[size] = [divmod(i, size) for i in range(size * size)]
+    return _cells_cache[size]
+
+
+def get_cell_lines(size, length):
+    """
+    각 칸을 지나는 윈도우들의 (윈도우 번호, 윈도우의 칸 번호들) 목록을 반환합니다.
+
+    Args:
+        size (int): 바둑판 크기
+        length (int): 윈도우 길이
+
+    Returns:
+        list: row * size + col 로 인덱싱한 ((윈도우 번호, 칸 번호 튜플), ...) 튜플들의 리스트
+    """
+    if (size, length) not in _cell_lines_cache:
+        cell_windows = get_cell_windows(size, length)[0]
+        window_cells = get_window_cells(size, length)
+        _cell_lines_cache[size, length] = [tuple((window, window_cells[window]) for window in windows)
+                                           for windows in cell_windows]
+    return _cell_lines_cache[size, length]
+
+
+def line_scores(length, unit):
+    """
+    윈도우 상태(흑 돌 개수 * (length + 1) + 백 돌 개수)별 위협 점수를 unit 배로 만든 표를 반환합니다.
+
+    한쪽 색 돌만 2개 이상 있는 열린 줄은 그 색의 돌 개수에 따라 evaluator.window_scores 점수를 받고
+    (흑/백 모두 같은 표를 쓰므로 자기 줄을 늘리는 칸과 상대 줄을 막는 칸이 함께 앞으로 옴),
+    두 색이 섞여 막힌 윈도우는 0점입니다. 돌 하나뿐인 윈도우는 영향도가 이미 반영하므로 0점으로 두어,
+    대부분의 수에서 점수가 바뀌는 윈도우가 적게 합니다.
+    """
+    base = length + 1
+    scores = window_scores(length)
+    table = [0] * (base * base)
+    for count in range(2, length + 1):
+        table[count * base] = table[count] = scores.get(count, 0) * unit
+    return table
+
+
+class CandidateGenerator:
+    def __init__(self, board):
+        """
+        현재 보드 상태로부터 후보 칸 목록과 영향도, 윈도우별 돌 개수를 계산합니다.
+
+        칸별 정렬 값 rank 는 (위협 점수 * INFLUENCE_RANGE + 영향도) * 칸 수 + (칸 수 - 1 - 칸 번호) 로
+        유지합니다. 위협 점수는 그 칸을 지나는 열린 줄들의 점수 합(흑/백 각각), 영향도는 거리 가중치 합이며,
+        마지막 항은 같은 점수일 때 행 우선 순서를 위한 것이라 값이 모두 달라 정렬 결과가 하나로 정해집니다.
+
+        Args:
+            board: 게임 보드 (Board 또는 BitBoard)
+        """
+        self.board = board
+        self.size = size = board.size
+        cell_count = size * size
+        self.neighbors = get_ranked_neighbors(size)
+        self.cells = get_cells(size)
+        self.cell_lines = get_cell_lines(size, board.win_length)
+        self.window_states = [0] * len(get_window_cells(size, board.win_length))
+
+        # 플레이어별 (윈도우 상태 -> 돌을 놓을 때/뺄 때 그 윈도우 칸들의 정렬 값 변화) 표
+        scores = line_scores(board.win_length, INFLUENCE_RANGE * cell_count)
+        steps = (None, board.win_length + 1, 1)
+        self.steps = steps
+        self.gains = [None] + [[scores[state + step] - scores[state] if state + step < len(scores) else 0
+                                for state in range(len(scores))] for step in steps[1:]]
+        self.losses = [None] + [[scores[state - step] - scores[state] if state >= step else 0
+                                 for state in range(len(scores))] for step in steps[1:]]
+
+        self.unit = cell_count  # 영향도 1 의 정렬 값 (rank // unit 이 칸 번호를 뺀 순서 값)
+        self.influence = [0] * cell_count  # 영향도 (정렬 값 단위, 0보다 크면 후보)
+        self.rank = [cell_count - 1 - cell for cell in range(cell_count)]
+        self.occupied = [False] * cell_count
+        # 후보 칸 목록 (영향도가 0보다 큰 빈칸), 직전 get_moves 의 순서를 유지하여 다음 정렬이 거의 정렬된
+        # 목록에서 시작 (둘 때마다 바뀌는 칸은 일부뿐이므로 Timsort 가 이미 정렬된 구간을 그대로 씀)
+        self.candidates = []
+        # 놓였지만 아직 반영하지 않은 칸들 (get_moves 를 부르기 전에 되돌린 수는 아무 계산도 하지 않음)
+        self.pending = []
+
+        # 놓인 돌만 반영 (판이 넓어도 돌 수에 비례하는 비용)
+        for cell, player in board.stones.items():
+            self.place(cell, player)
+
+    def make(self, row, col, player=None):
+        """
+        (row, col)에 돌이 놓였음을 기록합니다.
+
+        후보 목록과 정렬 값은 다음 get_moves 에서 반영합니다. 탐색의 리프 노드처럼 두고 바로 되돌리는 수는
+        unmake 가 기록만 지우므로, 후보 수를 묻는 노드에서만 윈도우들을 갱신합니다.
+        """
+        self.pending.append(row * self.size + col)
+
+    def unmake(self, row, col, player):
+        """
+        (row, col)에 있던 player 의 돌이 제거되었음을 반영합니다. (마지막으로 놓인 돌부터 되돌림)
+        """
+        if self.pending:
+            self.pending.pop()
+        else:
+            self.remove(row * self.size + col, player)
+
+    def flush(self):
+        """
+        기록만 해 둔 수들을 놓인 순서대로 후보 목록과 정렬 값에 반영합니다.
+        """
+        stones = self.board.stones
+        for cell in self.pending:
+            self.place(cell, stones[cell])
+        self.pending.clear()
+
+    def place(self, cell, player):
+        """
+        cell 에 player 의 돌이 놓였음을 후보 목록, 영향도, 윈도우별 돌 개수와 정렬 값에 반영합니다.
+        """
+        influence = self.influence
+        occupied = self.occupied
+        candidates = self.candidates
+        rank = self.rank
+
+        occupied[cell] = True
+        if influence[cell] > 0:
+            candidates.remove(cell)
+        for neighbor, weight in self.neighbors[cell]:
+            if not influence[neighbor] and not occupied[neighbor]:
+                candidates.append(neighbor)
+            influence[neighbor] += weight
+            rank[neighbor] += weight
+
+        # 열린 줄의 점수가 바뀐 윈도우의 칸들만 정렬 값을 고침
+        step = self.steps[player]
+        gain = self.gains[player]
+        states = self.window_states
+        for window, cells in self.cell_lines[cell]:
+            state = states[window]
+            states[window] = state + step
+            delta = gain[state]
+            if delta:
+                for other in cells:
+                    rank[other] += delta
+
+    def remove(self, cell, player):
+        """
+        cell 에 있던 player 의 돌이 제거되었음을 반영합니다. (place 의 반대)
+        """
+        influence = self.influence
+        occupied = self.occupied
+        candidates = self.candidates
+        rank = self.rank
+
+        occupied[cell] = False
+        if influence[cell] > 0:
+            candidates.append(cell)
+        for neighbor, weight in self.neighbors[cell]:
+            influence[neighbor] -= weight
+            rank[neighbor] -= weight
+            if not influence[neighbor] and not occupied[neighbor]:
+                candidates.remove(neighbor)
+
+        step = self.steps[player]
+        loss = self.losses[player]
+        states = self.window_states
+        for window, cells in self.cell_lines[cell]:
+            state = states[window]
+            states[window] = state - step
+            delta = loss[state]
+            if delta:
+                for other in cells:
+                    rank[other] += delta
+
+    def get_moves(self, limit=None, out=None):
+        """
+        후보 수를 위협 점수가 높은 순서로 반환합니다. (같으면 영향도가 높은 순서, 그다음 행 우선 순서)
+        탐색 노드마다 새 목록을 만들지 않도록, out 이 주어지면 그 목록을 비우고 채워서 반환합니다.
+
+        Args:
+            limit (int): 반환할 최대 후보 수 (None이면 전부)
+            out (list): 결과를 채울 목록 (None이면 새 목록)
+
+        Returns:
+            list: (row, col) 튜플들의 리스트
+        """
+        if self.pending:
+            self.flush()
+        candidates = self.candidates
+        candidates.sort(key=self.rank.__getitem__, reverse=True)
+        if out is None:
+            out = []
+        else:
+            out.clear()
+        out.extend(map(self.cells.__getitem__, islice(candidates, limit)))
+        return out
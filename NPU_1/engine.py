@@ -0,0 +1,223 @@
+"""
+AIPlayer 의 비동기 탐색 인터페이스
+탐색을 백그라운드 스레드에서 실행하고, 결과를 기다리거나(asyncio 에서는 await),
+탐색을 취소하거나, 일찍 멈추고 그때까지 찾은 최선의 수를 받을 수 있습니다.
+
+- 시간 제한이 있으면 반복 심화 탐색이므로 멈추면 마지막으로 끝까지 탐색한 깊이의 수를 돌려주고,
+  없으면 AIPlayer.get_best_move 와 같은 고정 깊이 탐색 (멈추면 깊이 1 탐색의 수)입니다.
+- 예측 탐색(pondering): AI 가 둔 뒤 주 변화(PV)로 예측한 상대의 응수를 미리 두고
+  사람이 수를 입력하는 동안 그 다음 수를 탐색합니다. 예측이 맞으면 이어서 탐색한 결과를 사용합니다.
+- 입력 대기(input)는 GIL 을 놓으므로 사람이 입력하는 동안에도 탐색 스레드가 진행됩니다.
+"""
+import asyncio
+import math
+import threading
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+
+
+class SearchHandle:
+    def __init__(self, ai, future, board):
+        """
+        백그라운드에서 진행 중인 탐색 하나를 나타냅니다. (AsyncEngine.start 가 만듦)
+
+        Args:
+            ai: 탐색하는 AIPlayer
+            future: 탐색 결과 (수, last_search_info) 의 concurrent.futures.Future
+            board: 탐색하는 보드 (복사본)
+        """
+        self.ai = ai
+        self.future = future
+        self.board = board
+        self.cancelled = False
+
+    def done(self):
+        """
+        탐색이 끝났는지 확인합니다.
+        """
+        return self.future.done()
+
+    def result(self, timeout=None):
+        """
+        탐색이 끝날 때까지 기다려 최선의 수를 반환합니다.
+
+        Args:
+            timeout (float): 최대 대기 시간 (초), 지나면 concurrent.futures.TimeoutError
+
+        Returns:
+            tuple: (row, col), 취소된 탐색이면 None
+        """
+        if self.cancelled:
+            return None
+        return self.future.result(timeout)[0]
+
+    @property
+    def info(self):
+        """
+        끝난 탐색의 last_search_info (깊이, 노드 수, 시간, 주 변화)
+        """
+        return self.future.result()[1]
+
+    def stop(self):
+        """
+        탐색을 일찍 멈추고 그때까지 찾은 최선의 수를 반환합니다.
+
+        Returns:
+            tuple: (row, col)
+        """
+        if not self.future.done():
+            self.ai.request_stop()
+        return self.result()
+
+    def cancel(self):
+        """
+        탐색을 멈추고 결과를 버립니다.
+        """
+        self.cancelled = True
+        if not self.future.cancel() and not self.future.done():
+            self.ai.request_stop()
+            try:
+                self.future.result()
+            except CancelledError:
+                pass
+
+    async def _wait(self):
+        move, _ = await asyncio.wrap_future(self.future)
+        return None if self.cancelled else move
+
+    def __await__(self):
+        # asyncio 이벤트 루프에서 탐색 스레드를 기다림 (await handle 은 최선의 수)
+        return self._wait().__await__()
+
+
+class AsyncEngine:
+    def __init__(self, ai, executor=None):
+        """
+        AIPlayer 를 백그라운드 스레드에서 실행하는 엔진을 만듭니다.
+
+        Args:
+            ai: 사용할 AIPlayer (엔진이 탐색하는 동안 직접 호출하지 않아야 함)
+            executor: 탐색을 실행할 Executor, None이면 스레드 하나짜리 풀을 만듦
+        """
+        self.ai = ai
+        self.executor = executor or ThreadPoolExecutor(max_workers=1)
+        self._own_executor = executor is None
+        self.current = None  # 진행 중이거나 마지막으로 시작한 탐색
+        self.ponder_move = None  # 예측 탐색에서 예측한 상대의 수
+        self.ponder_hits = 0
+        self.ponder_misses = 0
+        self._timer = None  # respond 가 예측 탐색을 멈추려고 건 타이머
+
+    def _run(self, board, time_limit, max_depth):
+        """
+        탐색 스레드에서 실행되는 함수입니다.
+        """
+        move = self.ai.get_best_move(board, time_limit=time_limit, max_depth=max_depth)
+        return move, dict(self.ai.last_search_info)
+
+    def start(self, board, time_limit=None, max_depth=None):
+        """
+        백그라운드 탐색을 시작합니다. (진행 중인 탐색이 있으면 취소)
+
+        Args:
+            board: 게임 보드 (복사해서 사용하므로 시작 후 바꾸어도 됨)
+            time_limit (float): 수당 시간 제한 (초), None이면 AI 난이도 깊이로 고정 탐색
+                                (math.inf 이면 멈출 때까지 또는 max_depth 까지 반복 심화 탐색)
+            max_depth (int): 반복 심화 탐색의 최대 깊이
+
+        Returns:
+            SearchHandle: 진행 중인 탐색
+        """
+        self.cancel()
+        self.ai.stop_requested = False
+        board = board.copy()
+        future = self.executor.submit(self._run, board, time_limit, max_depth)
+        self.current = SearchHandle(self.ai, future, board)
+        return self.current
+
+    async def search(self, board, time_limit=None, max_depth=None):
+        """
+        탐색을 시작하고 끝날 때까지 기다립니다. (asyncio 용)
+
+        Returns:
+            tuple: (row, col) 최선의 수
+        """
+        return await self.start(board, time_limit, max_depth)
+
+    def cancel(self):
+        """
+        진행 중인 탐색(예측 탐색 포함)을 취소합니다.
+        """
+        self._cancel_timer()
+        if self.current is not None and not self.current.done():
+            self.current.cancel()
+        self.ponder_move = None
+
+    def ponder(self, board, pv=None, time_limit=None):
+        """
+        상대의 응수를 예측하여 두고 그 다음 AI 의 수를 미리 탐색합니다.
+
+        Args:
+            board: AI 가 방금 수를 둔 보드
+            pv: AI 가 둔 수부터 시작하는 주 변화, None이면 마지막 탐색의 주 변화
+            time_limit (float): 게임의 수당 시간 제한, None이면 AI 난이도 깊이로 고정 탐색
+                                (respond 가 새로 탐색할 때와 같은 수를 고름, 주어지면
+                                respond 가 멈출 때까지 계속 깊이 반복 심화 탐색)
+
+        Returns:
+            bool: 예측 탐색을 시작했으면 True (주 변화에 상대의 응수가 없으면 False)
+        """
+        if pv is None:
+            pv = self.ai.last_search_info.get('pv', [])
+        if len(pv) < 2 or not board.is_valid_move(*pv[1]):
+            return False
+        board = board.copy()
+        board.place_stone(pv[1][0], pv[1][1], self.ai.opponent)
+        self.start(board, time_limit=None if time_limit is None else math.inf)
+        self.ponder_move = tuple(pv[1])
+        return True
+
+    def respond(self, board, opponent_move, time_limit=None):
+        """
+        상대가 수를 둔 뒤 AI 의 수를 탐색합니다.
+
+        예측 탐색 중이고 상대의 수가 예측과 같으면 예측 탐색을 이어서 사용합니다.
+        (time_limit 이 있으면 지금부터 time_limit 초 뒤에 멈추고 그때까지의 최선의 수를 사용)
+        예측이 틀렸으면 예측 탐색을 버리고 새로 탐색합니다.
+
+        Args:
+            board: 상대가 수를 둔 보드
+            opponent_move (tuple): 상대가 둔 (row, col)
+            time_limit (float): 수당 시간 제한 (초), None이면 AI 난이도 깊이로 탐색
+
+        Returns:
+            SearchHandle: AI 의 수를 탐색하는 핸들
+        """
+        if self.ponder_move is not None and tuple(opponent_move) == self.ponder_move:
+            self.ponder_hits += 1
+            self.ponder_move = None
+            handle = self.current
+            if time_limit is not None and not handle.done():
+                timer = threading.Timer(time_limit,
+                                        lambda: handle.done() or handle.ai.request_stop())
+                timer.daemon = True
+                timer.start()
+                self._timer = timer
+                # 탐색이 먼저 끝나면 타이머도 정리 (다음 탐색을 멈추지 않도록)
+                handle.future.add_done_callback(lambda _: timer.cancel())
+            return handle
+        if self.ponder_move is not None:
+            self.ponder_misses += 1
+        return self.start(board, time_limit)
+
+    def _cancel_timer(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def close(self):
+        """
+        진행 중인 탐색을 취소하고 스레드 풀을 종료합니다.
+        """
+        self.cancel()
+        if self._own_executor:
+            self.executor.shutdown()
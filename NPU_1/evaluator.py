@@ -0,0 +1,154 @@
+"""
+AIPlayer.evaluate_board 와 같은 점수를 증분 방식으로 계산하는 평가기
+돌이 놓이거나 제거될 때 그 돌을 포함하는 윈도우들만 갱신하여
+리프 노드 평가를 판 전체 순회(O(판 크기))에서 O(1)로 줄입니다.
+윈도우 길이는 보드의 승리 조건(board.win_length, 기본 4)과 같습니다.
+"""
+
+WINDOW_LENGTH = 4  # 기본 윈도우 길이 (4목)
+DIRECTIONS = [(0, 1), (1, 0), (1, 1), (1, -1)]  # 가로, 세로, 대각선
+
+# 판 크기/윈도우 길이별 (칸 -> 그 칸을 포함하는 윈도우 번호들) 표 캐시
+_cell_windows_cache = {}
+
+# 판 크기별 중앙 위치 보너스 표 캐시
+_center_bonus_cache = {}
+
+
+def window_scores(length=WINDOW_LENGTH):
+    """
+    윈도우 안의 같은 색 돌 개수에 따른 evaluate_window 점수를 반환합니다. (상대 돌이 없을 때)
+    length 개(승리)는 1000, 하나 모자라면 100, 둘 모자라면 10, 셋 모자라면 1 입니다.
+
+    Args:
+        length (int): 윈도우 길이 (승리에 필요한 연속 돌 수)
+
+    Returns:
+        dict: {돌 개수: 점수}
+    """
+    return {count: 10 ** (3 - (length - count))
+            for count in range(max(1, length - 3), length + 1)}
+
+
+# 4목 윈도우 점수
+WINDOW_SCORES = window_scores(WINDOW_LENGTH)
+
+
+def get_cell_windows(size, length=WINDOW_LENGTH):
+    """
+    각 칸을 포함하는 길이 length 윈도우들의 번호 목록을 반환합니다.
+
+    Args:
+        size (int): 바둑판 크기
+        length (int): 윈도우 길이
+
+    Returns:
+        tuple: (칸별 윈도우 번호 리스트의 리스트(row * size + col 로 인덱싱), 윈도우 개수)
+    """
+    if (size, length) not in _cell_windows_cache:
+        cell_windows = [[] for _ in range(size * size)]
+        window_count = 0
+        for dr, dc in DIRECTIONS:
+            for row in range(size):
+                for col in range(size):
+                    end_row = row + dr * (length - 1)
+                    end_col = col + dc * (length - 1)
+                    if not (0 <= end_row < size and 0 <= end_col < size):
+                        continue
+                    for i in range(length):
+                        cell = (row + dr * i) * size + (col + dc * i)
+                        cell_windows[cell].append(window_count)
+                    window_count += 1
+        _cell_windows_cache[size, length] = ([tuple(windows) for windows in cell_windows],
+                                             window_count)
+    return _cell_windows_cache[size, length]
+
+
+def get_center_bonus(size):
+    """
+    칸 번호별 중앙 위치 보너스 max(0, 10 - 중앙까지의 맨해튼 거리)를 반환합니다.
+    """
+    if size not in _center_bonus_cache:
+        center = size // 2
+        _center_bonus_cache[size] = [max(0, 10 - (abs(row - center) + abs(col - center)))
+                                     for row in range(size) for col in range(size)]
+    return _center_bonus_cache[size]
+
+
+class IncrementalEvaluator:
+    def __init__(self, board, player, weights=None):
+        """
+        현재 보드 상태로부터 윈도우별 돌 개수와 전체 점수를 계산합니다.
+
+        윈도우 상태는 (AI 돌 개수) * (윈도우 길이 + 1) + (상대 돌 개수) 로 저장하고
+        (4목이면 AI 돌 개수 * 5 + 상대 돌 개수), 상태별 점수 기여도는 미리 계산한 표에서 찾습니다.
+        빈 윈도우는 0점이므로 놓인 돌만 반영하면 되어 판이 넓어도 돌 수에 비례하는 비용이 듭니다.
+
+        Args:
+            board: 게임 보드 (Board 또는 BitBoard)
+            player (int): 점수를 계산할 AI 플레이어 번호
+            weights: 윈도우 상태 점수와 중앙 보너스 가중치 (learned_eval.PatternWeights),
+                     None 이면 evaluate_board 와 같은 손으로 정한 점수
+        """
+        self.board = board
+        self.player = player
+        self.size = board.size
+        length = board.win_length
+        self.cell_windows, window_count = get_cell_windows(board.size, length)
+        self.window_states = [0] * window_count
+        self.base = base = length + 1
+
+        # 윈도우 상태 -> 점수 기여도
+        # 같은 색 돌 k개만 있는 윈도우는 돌마다 한 번씩, 즉 k번 점수가 더해집니다
+        if weights is None:
+            self.state_scores = [0] * (base * base)
+            for count, window_score in window_scores(length).items():
+                self.state_scores[count * base] = count * window_score
+                self.state_scores[count] = -count * window_score
+        else:
+            if weights.win_length != length:
+                raise ValueError(f"가중치의 윈도우 길이 {weights.win_length} 가 "
+                                 f"보드의 승리 길이 {length} 와 다릅니다")
+            self.state_scores = weights.state_scores(base)
+
+        # 중앙 위치 보너스 (AI 돌에만 적용)
+        self.center_bonus = (get_center_bonus(board.size) if weights is None
+                             else weights.center_scores(board.size))
+
+        self.score = 0
+        for cell, stone in board.stones.items():
+            self.make(*divmod(cell, board.size), stone)
+
+    def make(self, row, col, player):
+        """
+        (row, col)에 player의 돌이 놓였음을 반영합니다.
+        """
+        cell = row * self.size + col
+        step = self.base if player == self.player else 1
+        states = self.window_states
+        state_scores = self.state_scores
+        delta = 0
+        for window in self.cell_windows[cell]:
+            state = states[window]
+            states[window] = state + step
+            delta += state_scores[state + step] - state_scores[state]
+        if player == self.player:
+            delta += self.center_bonus[cell]
+        self.score += delta
+
+    def unmake(self, row, col, player):
+        """
+        (row, col)에 있던 player의 돌이 제거되었음을 반영합니다.
+        """
+        cell = row * self.size + col
+        step = self.base if player == self.player else 1
+        states = self.window_states
+        state_scores = self.state_scores
+        delta = 0
+        for window in self.cell_windows[cell]:
+            state = states[window]
+            states[window] = state - step
+            delta += state_scores[state - step] - state_scores[state]
+        if player == self.player:
+            delta -= self.center_bonus[cell]
+        self.score += delta
@@ -4,16 +4,26 @@
 """
 
 from board import Board
+from game_record import GameRecordWriter, game_result
+from renderer import BoardRenderer
 
 class Game:
-    def __init__(self):
+    def __init__(self, record_path=None, size=20, win_length=4, ansi=False):
         """
-        게임을 초기화합니다. (20x20 바둑판)
+        게임을 초기화합니다. (기본 20x20 바둑판)
+        
+        Args:
+            record_path (str): 주어지면 두는 수를 이 기보 파일에 덧붙여 기록 (game_record.py)
+            size (int): 바둑판 크기 (명세서 기본값 20)
+            win_length (int): 승리에 필요한 연속 돌 수 (기본값 4)
+            ansi (bool): True 이면 바둑판을 다시 그릴 때 바뀐 줄만 ANSI 커서 이동으로 고쳐 씀
         """
-        self.board = Board(20)  # 명세서 조건: 20x20
+        self.board = Board(size, win_length)  # 명세서 조건: 20x20, 4목
         self.current_player = self.board.PLAYER1  # 흑돌부터 시작
         self.game_over = False
         self.winner = None
+        self.recorder = GameRecordWriter(record_path) if record_path else None
+        self.renderer = BoardRenderer(ansi=ansi)
         self.player_names = {
             self.board.PLAYER1: "플레이어 1 (●)",
             self.board.PLAYER2: "플레이어 2 (○)"
@@ -101,46 +111,57 @@ class Game:
         
         # 돌 놓기
         self.board.place_stone(row, col, self.current_player)
+        if self.recorder is not None:
+            self.recorder.add_move(row, col, self.board.size, self.board.win_length)
         
         # 승리 조건 확인
         if self.board.check_winner(row, col, self.current_player):
             self.game_over = True
             self.winner = self.current_player
+            self.finish_record()
             return True
         
         # 무승부 확인
         if self.board.is_board_full():
             self.game_over = True
+            self.finish_record()
             return True
         
         # 플레이어 교체
         self.switch_player()
         return True
     
+    def finish_record(self):
+        """
+        기보를 기록 중이면 지금 대국의 결과를 쓰고 끝냅니다. (중단한 대국은 결과 0)
+        """
+        if self.recorder is not None:
+            self.recorder.finish(game_result(self.winner, self.game_over))
+    
     def display_game_state(self):
         """
         현재 게임 상태를 화면에 출력합니다.
         """
-        print("\n" + "="*50)
-        print("          4목 게임 (Connect Four)")
-        print("="*50)
-        self.board.display_board()
+        header = ["", "="*50, "          4목 게임 (Connect Four)", "="*50]
         
         if not self.game_over:
-            print(f"현재 차례: {self.get_current_player_name()}")
+            status = f"현재 차례: {self.get_current_player_name()}"
         else:
             winner_name = self.get_winner_name()
             if winner_name == "무승부":
-                print("게임이 무승부로 끝났습니다!")
+                status = "게임이 무승부로 끝났습니다!"
             else:
-                print(f"🎉 {winner_name}이(가) 승리했습니다! 🎉")
+                status = f"🎉 {winner_name}이(가) 승리했습니다! 🎉"
+        
+        # 바둑판과 상태를 한 프레임으로 만들어 한 번에 출력
+        self.renderer.draw(self.board, header, [status])
     
     def play(self):
         """
         게임을 시작하고 진행합니다.
         """
         print("4목 게임을 시작합니다!")
-        print("격자의 교차점에 4개의 돌을 연속으로 놓으면 승리합니다.")
+        print(f"격자의 교차점에 {self.board.win_length}개의 돌을 연속으로 놓으면 승리합니다.")
         print("좌표는 '행 열' 형식으로 입력하세요 (예: 10 15)")
         print("게임을 종료하려면 'quit'을 입력하세요.")
         
@@ -170,7 +191,8 @@ class Game:
         """
         게임을 초기 상태로 재설정합니다.
         """
-        self.board = Board(20)  # 명세서 조건: 20x20
+        self.finish_record()
+        self.board = Board(self.board.size, self.board.win_length)
         self.current_player = self.board.PLAYER1
         self.game_over = False
         self.winner = None
@@ -0,0 +1,228 @@
+"""
+압축 기보(게임 기록) 파일 형식과 빠른 재생
+대국을 둔 순서대로 좌표마다 1바이트(행, 열)로 기록하고, 메모리 매핑(mmap)으로 읽어
+n번째 대국의 k번째 수까지 둔 국면을 처음부터 다시 두지 않고 바로 만듭니다.
+
+- 파일 형식: 매직 'GRC2' 뒤에 대국들이 이어집니다.
+  대국마다 헤더(판 크기, 승리 길이, 결과, 수의 개수) 5바이트 + 수마다 (행, 열) 2바이트
+  (흑이 먼저 두고 번갈아 두므로 돌 색은 기록하지 않음)
+- 결과: 0 = 진행 중/중단, 1 = 흑 승, 2 = 백 승, 3 = 무승부
+- GameRecordWriter 는 수를 둘 때마다 덧붙이고 헤더의 수 개수를 고쳐 쓰므로
+  대국 도중에 프로그램이 끝나도 그때까지의 수가 남습니다. (파일 하나에 기록하는 쪽은 하나만)
+"""
+import mmap
+import os
+import struct
+from array import array
+
+from board import Board
+
+RECORD_MAGIC = b'GRC2'
+GAME_HEADER = struct.Struct('<BBBH')  # 판 크기, 승리 길이, 결과, 수의 개수
+MOVE_SIZE = 2  # 수마다 (행, 열) 1바이트씩
+
+RESULT_UNFINISHED = 0
+RESULT_PLAYER1 = 1
+RESULT_PLAYER2 = 2
+RESULT_DRAW = 3
+
+
+def game_result(winner, game_over):
+    """
+    Game/GameWithAI 의 winner, game_over 를 기보 결과 값으로 바꿉니다.
+    """
+    if winner:
+        return winner
+    return RESULT_DRAW if game_over else RESULT_UNFINISHED
+
+
+class GameRecordWriter:
+    def __init__(self, path):
+        """
+        기보 파일을 엽니다. (없으면 만들고, 있으면 끝에 이어서 기록)
+
+        Args:
+            path (str): 기보 파일 경로
+        """
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            self.file = open(path, 'r+b')
+            if self.file.read(len(RECORD_MAGIC)) != RECORD_MAGIC:
+                self.file.close()
+                raise ValueError(f"기보 파일이 아닙니다: {path}")
+        else:
+            self.file = open(path, 'w+b')
+            self.file.write(RECORD_MAGIC)
+        self._header_offset = None  # 기록 중인 대국의 헤더 위치
+        self._size = 0
+        self._win_length = 0
+        self._count = 0
+
+    def begin(self, size=20, win_length=4):
+        """
+        새 대국 기록을 시작합니다. (기록 중인 대국이 있으면 결과 없이 끝냄)
+        """
+        if self._header_offset is not None:
+            self.finish()
+        self.file.seek(0, os.SEEK_END)
+        self._header_offset = self.file.tell()
+        self._size = size
+        self._win_length = win_length
+        self._count = 0
+        self.file.write(GAME_HEADER.pack(size, win_length, RESULT_UNFINISHED, 0))
+        self.file.flush()
+
+    def add_move(self, row, col, size=20, win_length=4):
+        """
+        기록 중인 대국에 수를 덧붙입니다. (기록 중인 대국이 없으면 새로 시작)
+        """
+        if self._header_offset is None:
+            self.begin(size, win_length)
+        self._count += 1
+        self.file.seek(0, os.SEEK_END)
+        self.file.write(bytes((row, col)))
+        self._write_header(RESULT_UNFINISHED)
+
+    def finish(self, result=RESULT_UNFINISHED):
+        """
+        기록 중인 대국의 결과를 쓰고 끝냅니다.
+        """
+        if self._header_offset is None:
+            return
+        self._write_header(result)
+        self._header_offset = None
+
+    def write_game(self, moves, result, size=20, win_length=4):
+        """
+        끝난 대국 하나를 한 번에 기록합니다.
+
+        Args:
+            moves: 둔 순서대로 (row, col) 목록
+            result (int): 대국 결과 (RESULT_*)
+            size (int): 바둑판 크기
+            win_length (int): 승리에 필요한 연속 돌 수
+        """
+        self.finish()
+        data = bytearray(GAME_HEADER.pack(size, win_length, result, len(moves)))
+        for row, col in moves:
+            data += bytes((row, col))
+        self.file.seek(0, os.SEEK_END)
+        self.file.write(data)
+
+    def _write_header(self, result):
+        self.file.seek(self._header_offset)
+        self.file.write(GAME_HEADER.pack(self._size, self._win_length, result, self._count))
+        self.file.flush()
+
+    def close(self):
+        """
+        기록 중인 대국을 끝내고 파일을 닫습니다.
+        """
+        self.finish()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class GameRecordReader:
+    def __init__(self, path):
+        """
+        기보 파일을 메모리 매핑으로 열고 대국들의 시작 위치 색인을 만듭니다.
+
+        Args:
+            path (str): 기보 파일 경로
+        """
+        self.file = open(path, 'rb')
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.map[:len(RECORD_MAGIC)] != RECORD_MAGIC:
+            self.close()
+            raise ValueError(f"기보 파일이 아닙니다: {path}")
+
+        # 헤더만 따라가며 대국마다 헤더 위치를 기록 (수는 읽지 않음)
+        self.offsets = array('Q')
+        offset = len(RECORD_MAGIC)
+        end = len(self.map) - GAME_HEADER.size
+        unpack_from = GAME_HEADER.unpack_from
+        while offset <= end:
+            self.offsets.append(offset)
+            offset += GAME_HEADER.size + unpack_from(self.map, offset)[3] * MOVE_SIZE
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def header(self, n):
+        """
+        n번째 대국의 (판 크기, 승리 길이, 결과, 수의 개수)를 반환합니다.
+        """
+        return GAME_HEADER.unpack_from(self.map, self.offsets[n])
+
+    def moves(self, n, k=None):
+        """
+        n번째 대국의 처음 k개 수를 (행, 열) 바이트가 번갈아 나오는 bytes 로 반환합니다.
+        (k가 None이면 모든 수)
+        """
+        offset = self.offsets[n]
+        count = GAME_HEADER.unpack_from(self.map, offset)[3]
+        if k is None or k > count:
+            k = count
+        start = offset + GAME_HEADER.size
+        return self.map[start:start + k * MOVE_SIZE]
+
+    def move_list(self, n, k=None):
+        """
+        n번째 대국의 처음 k개 수를 (row, col) 튜플 목록으로 반환합니다.
+        """
+        data = self.moves(n, k)
+        return list(zip(data[0::2], data[1::2]))
+
+    def cells(self, n, k=None):
+        """
+        n번째 대국에서 k개의 수를 둔 국면을 칸마다 1바이트(0/1/2)인 bytearray 로 만듭니다.
+
+        Returns:
+            bytearray: 행 우선 순서의 size * size 칸
+        """
+        size = self.header(n)[0]
+        data = self.moves(n, k)
+        cells = bytearray(size * size)
+        rows, cols = data[0::2], data[1::2]
+        # 흑은 짝수 번째, 백은 홀수 번째 수
+        for row, col in zip(rows[0::2], cols[0::2]):
+            cells[row * size + col] = 1
+        for row, col in zip(rows[1::2], cols[1::2]):
+            cells[row * size + col] = 2
+        return cells
+
+    def board(self, n, k=None, board_class=Board):
+        """
+        n번째 대국에서 k개의 수를 둔 국면을 보드로 만듭니다. (Zobrist 해시 포함, 기록된 승리 길이 사용)
+        """
+        size, win_length = self.header(n)[:2]
+        board = board_class(size, win_length)
+        for i, (row, col) in enumerate(self.move_list(n, k)):
+            board.place_stone(row, col, 1 if i % 2 == 0 else 2)
+        return board
+
+    def __iter__(self):
+        """
+        대국마다 (판 크기, 승리 길이, 결과, 수 bytes)를 차례로 반환합니다.
+        """
+        for n in range(len(self.offsets)):
+            size, win_length, result, _ = self.header(n)
+            yield size, win_length, result, self.moves(n)
+
+    def close(self):
+        """
+        메모리 매핑과 파일을 닫습니다.
+        """
+        self.map.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -5,23 +5,48 @@ AI가 포함된 4목 게임 클래스
 
 from board import Board
 from ai_player import AIPlayer
+from engine import AsyncEngine
+from game_record import GameRecordWriter, game_result
+from renderer import BoardRenderer
+from opening_book import load_default_book
 import time
 
 class GameWithAI:
-    def __init__(self):
+    def __init__(self, persistent_tt=False, time_limit=None, use_opening_book=False, ponder=False,
+                 record_path=None, size=20, win_length=4, ansi=False):
         """
-        AI가 포함된 게임을 초기화합니다. (20x20 바둑판, 기본 난이도)
+        AI가 포함된 게임을 초기화합니다. (기본 20x20 바둑판, 기본 난이도)
+        
+        Args:
+            persistent_tt (bool): AI의 치환표를 수와 수 사이에 유지할지 여부
+            time_limit (float): AI의 수당 시간 제한 (초)
+                                주어지면 고정 깊이 대신 반복 심화 탐색을 사용합니다
+            use_opening_book (bool): 기본 정석 파일(opening_book.bin)이 있고 판 크기/승리 길이가 맞으면
+                                     초반 수에 사용할지 여부 (기본값은 사용 안 함)
+            ponder (bool): 사람이 수를 입력하는 동안 예측한 응수에 대한 AI 의 다음 수를 미리 탐색할지 여부
+            record_path (str): 주어지면 두는 수를 이 기보 파일에 덧붙여 기록 (game_record.py)
+            size (int): 바둑판 크기 (명세서 기본값 20)
+            win_length (int): 승리에 필요한 연속 돌 수 (기본값 4)
+            ansi (bool): True 이면 바둑판을 다시 그릴 때 바뀐 줄만 ANSI 커서 이동으로 고쳐 씀
         """
-        self.board = Board(20)  # 명세서 조건: 20x20
+        self.board = Board(size, win_length)  # 명세서 조건: 20x20, 4목
         self.current_player = self.board.PLAYER1  # 사람이 먼저 시작
         self.game_over = False
         self.winner = None
-        self.ai_player = AIPlayer(self.board.PLAYER2, 3)  # AI는 플레이어 2, 기본 난이도
+        self.ai_player = AIPlayer(self.board.PLAYER2, 3,  # AI는 플레이어 2, 기본 난이도
+                                  keep_tt=persistent_tt,
+                                  opening_book=load_default_book(size, win_length) if use_opening_book else None)
         self.player_names = {
             self.board.PLAYER1: "플레이어 (●)",
             self.board.PLAYER2: "컴퓨터 (○)"
         }
-        self.thinking_time = 1.0  # AI 사고 시간 (시각적 효과)
+        self.thinking_time = 1.0  # AI 사고 시간 (시각적 효과, 시간 제한이 없을 때만 사용)
+        self.time_limit = time_limit
+        self.engine = AsyncEngine(self.ai_player)  # AI 탐색은 백그라운드 스레드에서 실행
+        self.ponder = ponder
+        self.last_move = None  # 마지막으로 놓인 돌의 위치
+        self.recorder = GameRecordWriter(record_path) if record_path else None
+        self.renderer = BoardRenderer(ansi=ansi)
     
     def get_current_player_name(self):
         """
@@ -106,14 +131,31 @@ class GameWithAI:
         """
         print(f"\n{self.get_current_player_name()}이 생각 중입니다...")
         
-        # 시각적 효과를 위한 대기
-        for i in range(3):
-            print(".", end="", flush=True)
-            time.sleep(self.thinking_time / 3)
-        print(" 완료!")
+        # 백그라운드에서 탐색 시작 (예측 탐색이 맞았으면 그 탐색을 이어서 사용)
+        if self.last_move is not None:
+            handle = self.engine.respond(self.board, self.last_move, self.time_limit)
+        else:
+            handle = self.engine.start(self.board, self.time_limit)
+        
+        if self.time_limit is None:
+            # 시각적 효과를 위한 대기 (탐색은 그동안 백그라운드에서 진행)
+            for i in range(3):
+                print(".", end="", flush=True)
+                time.sleep(self.thinking_time / 3)
+            print(" 완료!")
         
         # AI의 최적 수 계산
-        move = self.ai_player.get_best_move(self.board)
+        move = handle.result()
+        if self.time_limit is not None:
+            info = handle.info
+            print(f"탐색 깊이 {info['depth']}, 노드 {info['nodes']}개, {info['time']:.2f}초")
+        
+        if move and self.ponder:
+            # 사람이 입력하는 동안 예측한 응수에 대한 다음 수를 미리 탐색
+            after = self.board.copy()
+            after.place_stone(move[0], move[1], self.board.PLAYER2)
+            if not after.check_winner(move[0], move[1], self.board.PLAYER2):
+                self.engine.ponder(after, handle.info['pv'], self.time_limit)
         
         if move:
             row, col = move
@@ -141,50 +183,71 @@ class GameWithAI:
         
         # 돌 놓기
         self.board.place_stone(row, col, self.current_player)
+        self.last_move = (row, col)
+        if self.recorder is not None:
+            self.recorder.add_move(row, col, self.board.size, self.board.win_length)
         
         # 승리 조건 확인
         if self.board.check_winner(row, col, self.current_player):
             self.game_over = True
             self.winner = self.current_player
+            self.finish_record()
             return True
         
         # 무승부 확인
         if self.board.is_board_full():
             self.game_over = True
+            self.finish_record()
             return True
         
         # 플레이어 교체
         self.switch_player()
         return True
     
+    def finish_record(self):
+        """
+        기보를 기록 중이면 지금 대국의 결과를 쓰고 끝냅니다. (중단한 대국은 결과 0)
+        """
+        if self.recorder is not None:
+            self.recorder.finish(game_result(self.winner, self.game_over))
+    
     def display_game_state(self):
         """
         현재 게임 상태를 화면에 출력합니다.
         """
-        print("\n" + "="*50)
-        print("       4목 게임 (사람 vs 컴퓨터)")
-        print("="*50)
-        self.board.display_board()
+        header = ["", "="*50, "       4목 게임 (사람 vs 컴퓨터)", "="*50]
         
         if not self.game_over:
-            print(f"현재 차례: {self.get_current_player_name()}")
+            status = f"현재 차례: {self.get_current_player_name()}"
         else:
             winner_name = self.get_winner_name()
             if winner_name == "무승부":
-                print("게임이 무승부로 끝났습니다!")
+                status = "게임이 무승부로 끝났습니다!"
             else:
-                print(f"🎉 {winner_name}이(가) 승리했습니다! 🎉")
+                status = f"🎉 {winner_name}이(가) 승리했습니다! 🎉"
+        
+        # 바둑판과 상태를 한 프레임으로 만들어 한 번에 출력
+        self.renderer.draw(self.board, header, [status])
     
     def play(self):
         """
         게임을 시작하고 진행합니다.
         """
         print("4목 게임을 시작합니다! (사람 vs 컴퓨터)")
-        print("격자의 교차점에 4개의 돌을 연속으로 놓으면 승리합니다.")
+        print(f"격자의 교차점에 {self.board.win_length}개의 돌을 연속으로 놓으면 승리합니다.")
         print("좌표는 '행 열' 형식으로 입력하세요 (예: 10 15)")
         print("게임을 종료하려면 'quit'을 입력하세요.")
         print("플레이어가 흑돌(●), 컴퓨터가 백돌(○)입니다.")
         
+        try:
+            self.play_loop()
+        finally:
+            self.engine.cancel()  # 진행 중인 예측 탐색 정리
+    
+    def play_loop(self):
+        """
+        게임이 끝나거나 종료할 때까지 차례를 진행합니다.
+        """
         while not self.game_over:
             self.display_game_state()
             
@@ -223,7 +286,10 @@ class GameWithAI:
         """
         게임을 초기 상태로 재설정합니다.
         """
-        self.board = Board(20)  # 명세서 조건: 20x20
+        self.finish_record()
+        self.engine.cancel()
+        self.board = Board(self.board.size, self.board.win_length)
         self.current_player = self.board.PLAYER1
         self.game_over = False
         self.winner = None
+        self.last_move = None
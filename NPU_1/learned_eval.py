@@ -0,0 +1,473 @@
+"""
+자가 대국 데이터로 학습한 패턴 가중치 평가 함수
+IncrementalEvaluator 의 윈도우 상태별 점수표(같은 색 돌 k개만 있는 윈도우의 점수)와
+중앙 보너스 가중치를 손으로 정한 값 대신 엔진끼리 둔 대국의 승패로 학습합니다.
+
+- 특징: 내 돌만 k개 있는 윈도우 수, 상대 돌만 k개 있는 윈도우 수 (k = 1 .. 승리 길이 - 1),
+  내 돌의 중앙 보너스 합
+  (승리 길이만큼 찬 윈도우는 승리이므로 학습하지 않고 기존 점수를 그대로 사용)
+- 모델: 특징의 선형 결합(로지스틱 회귀)이므로 학습한 가중치를 정수로 바꾸면
+  IncrementalEvaluator 의 상태 점수표에 그대로 들어가 탐색 속도가 기존 평가와 같습니다.
+- 자가 대국: 무작위 개막 뒤 얕은 탐색 AI 끼리 두고(가끔 무작위 후보 수), 압축 기보(game_record)로 저장
+- 학습: 기보의 국면들을 NumPy 로 한 번에 특징 벡터로 바꾸고 두 플레이어 관점으로 늘린 뒤
+  L2 정규화한 로지스틱 회귀를 뉴턴 방법으로 학습
+
+NumPy 는 자가 대국 데이터 학습과 벡터화 평가(evaluate_boards)에만 필요하고,
+학습한 가중치 파일을 읽어 탐색에 쓰는 데는 필요하지 않습니다.
+
+사용법:
+    python3 learned_eval.py selfplay --games 2000 --output selfplay.grc [--workers 4]
+    python3 learned_eval.py train selfplay.grc [--output learned_weights.json]
+"""
+import argparse
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from evaluator import WINDOW_LENGTH, get_center_bonus, window_scores
+
+# 게임과 함께 배포하는 학습된 가중치 파일
+DEFAULT_WEIGHTS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    'learned_weights.json')
+
+# 판 크기별 (중앙 보너스 가중치 -> 칸별 중앙 점수) 표 캐시
+_center_scores_cache = {}
+
+
+class PatternWeights:
+    def __init__(self, win_length=WINDOW_LENGTH, own=None, opp=None, center=1):
+        """
+        윈도우 패턴 가중치를 만듭니다.
+
+        Args:
+            win_length (int): 윈도우 길이 (승리에 필요한 연속 돌 수)
+            own (list): 내 돌만 k개 있는 윈도우의 점수 (길이 win_length + 1, 0번은 0)
+            opp (list): 상대 돌만 k개 있는 윈도우의 점수 (길이 win_length + 1, 0번은 0)
+            center (int): 내 돌의 중앙 보너스에 곱하는 가중치
+        """
+        self.win_length = win_length
+        heuristic = window_scores(win_length)
+        if own is None:
+            own = [count * heuristic.get(count, 0) for count in range(win_length + 1)]
+        if opp is None:
+            opp = [-count * heuristic.get(count, 0) for count in range(win_length + 1)]
+        if len(own) != win_length + 1 or len(opp) != win_length + 1:
+            raise ValueError(f"가중치 길이가 윈도우 길이 {win_length} + 1 과 다릅니다")
+        self.own = [int(value) for value in own]
+        self.opp = [int(value) for value in opp]
+        self.center = int(center)
+
+    @classmethod
+    def heuristic(cls, win_length=WINDOW_LENGTH):
+        """
+        AIPlayer.evaluate_board 와 같은 점수를 내는 (손으로 정한) 가중치를 반환합니다.
+        """
+        return cls(win_length)
+
+    def state_scores(self, base):
+        """
+        IncrementalEvaluator 의 윈도우 상태(AI 돌 개수 * base + 상대 돌 개수)별 점수표를 만듭니다.
+        """
+        scores = [0] * (base * base)
+        for count in range(1, self.win_length + 1):
+            scores[count * base] = self.own[count]
+            scores[count] = self.opp[count]
+        return scores
+
+    def center_scores(self, size):
+        """
+        칸 번호별 중앙 점수 (중앙 보너스 * center 가중치)를 반환합니다.
+        """
+        if self.center == 1:
+            return get_center_bonus(size)
+        key = (size, self.center)
+        if key not in _center_scores_cache:
+            _center_scores_cache[key] = [bonus * self.center for bonus in get_center_bonus(size)]
+        return _center_scores_cache[key]
+
+    def evaluate(self, board, player):
+        """
+        보드를 평가합니다. (증분 평가기를 새로 만들어 놓인 돌만 반영)
+
+        Args:
+            board: 게임 보드
+            player (int): 점수를 계산할 AI 플레이어 번호
+
+        Returns:
+            int: 보드의 점수
+        """
+        from evaluator import IncrementalEvaluator
+        return IncrementalEvaluator(board, player, self).score
+
+    def to_dict(self):
+        return {'win_length': self.win_length, 'own': self.own, 'opp': self.opp,
+                'center': self.center}
+
+    def save(self, path, **info):
+        """
+        가중치를 JSON 파일로 저장합니다. (info 는 학습 정보로 함께 저장)
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({**self.to_dict(), **info}, f, ensure_ascii=False, indent=2)
+
+    @classmethod
+    def load(cls, path=DEFAULT_WEIGHTS_PATH):
+        """
+        save 로 저장한 가중치 파일을 읽습니다.
+        """
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        return cls(data['win_length'], data['own'], data['opp'], data['center'])
+
+    def __eq__(self, other):
+        return isinstance(other, PatternWeights) and self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        return (f"PatternWeights(win_length={self.win_length}, own={self.own}, "
+                f"opp={self.opp}, center={self.center})")
+
+
+def get_weights(weights, win_length=WINDOW_LENGTH):
+    """
+    AIPlayer 의 eval_weights 인자를 win_length 에 맞는 PatternWeights 로 바꿉니다.
+
+    Args:
+        weights: PatternWeights, 가중치 파일 경로, 또는 None (기본 학습 가중치 파일)
+        win_length (int): 보드의 승리 길이. None 일 때 기본 파일의 윈도우 길이가 다르거나
+                          파일이 없으면 이 길이의 손으로 정한 가중치를 사용
+
+    Raises:
+        ValueError: 직접 넘긴 가중치의 윈도우 길이가 win_length 와 다를 때
+    """
+    if weights is None:
+        if os.path.exists(DEFAULT_WEIGHTS_PATH):
+            default = PatternWeights.load(DEFAULT_WEIGHTS_PATH)
+            if default.win_length == win_length:
+                return default
+        return PatternWeights.heuristic(win_length)
+    if not isinstance(weights, PatternWeights):
+        weights = PatternWeights.load(weights)
+    if weights.win_length != win_length:
+        raise ValueError(f"가중치의 윈도우 길이 {weights.win_length} 가 보드의 승리 길이 {win_length} 와 "
+                         f"다릅니다 (win_length={win_length} 로 학습한 가중치를 넘기거나 "
+                         f"eval_weights=None 으로 기본/손으로 정한 가중치를 사용)")
+    return weights
+
+
+# --- NumPy 특징 추출과 벡터화 평가 ---
+
+def feature_names(win_length=WINDOW_LENGTH):
+    return ([f"own{count}" for count in range(1, win_length)]
+            + [f"opp{count}" for count in range(1, win_length)] + ['center'])
+
+
+def code_features(player, length=WINDOW_LENGTH):
+    """
+    윈도우 코드(3진수)별 특징 번호 표를 만듭니다.
+    내 돌 k개만 있으면 k - 1, 상대 돌 k개만 있으면 length - 1 + k - 1,
+    그 밖(빈 윈도우, 섞인 윈도우, 가득 찬 윈도우)은 버리는 번호 2 * (length - 1) 입니다.
+    """
+    import numpy as np
+
+    opponent = 2 if player == 1 else 1
+    unused = 2 * (length - 1)
+    table = np.full(3 ** length, unused, dtype=np.int64)
+    for code in range(3 ** length):
+        cells = [(code // 3 ** i) % 3 for i in range(length)]
+        own, other = cells.count(player), cells.count(opponent)
+        if 0 < own < length and not other:
+            table[code] = own - 1
+        elif 0 < other < length and not own:
+            table[code] = length - 1 + other - 1
+    return table
+
+
+def extract_features(boards, player, win_length=WINDOW_LENGTH):
+    """
+    (N, size, size) 보드들을 (N, 2 * (win_length - 1) + 1) 특징 행렬로 바꿉니다.
+    (feature_names 순서: 내 돌 k개 윈도우 수, 상대 돌 k개 윈도우 수, 내 돌의 중앙 보너스 합)
+    """
+    import numpy as np
+    from numpy_eval import make_center_weights, window_codes
+
+    boards = np.asarray(boards, dtype=np.int8)
+    count, size = boards.shape[0], boards.shape[-1]
+    flat = boards.reshape(count, size * size)
+    columns = 2 * (win_length - 1) + 1  # 마지막 열: 버리는 번호로 센 뒤 중앙 보너스 합으로 덮어씀
+    indices = code_features(player, win_length)[window_codes(flat, win_length)]
+    indices += np.arange(count)[:, None] * columns
+    counts = np.bincount(indices.ravel(), minlength=count * columns).reshape(count, columns)
+    features = counts.astype(np.float64)
+    features[:, -1] = (flat == player) @ make_center_weights(size)
+    return features
+
+
+def evaluate_boards(boards, player, weights):
+    """
+    보드들을 학습한 가중치로 한 번에 평가합니다. (IncrementalEvaluator 와 같은 점수)
+
+    Args:
+        boards (numpy.ndarray): 0/1/2 로 이루어진 보드 배열 (N, size, size)
+        player (int): 점수를 계산할 AI 플레이어 번호
+        weights (PatternWeights): 평가 가중치
+
+    Returns:
+        numpy.ndarray: (N,) 모양의 점수 배열
+    """
+    import numpy as np
+    from numpy_eval import make_center_weights, window_codes
+
+    length = weights.win_length
+    boards = np.asarray(boards, dtype=np.int8)
+    count, size = boards.shape[0], boards.shape[-1]
+    flat = boards.reshape(count, size * size)
+    opponent = 2 if player == 1 else 1
+    table = np.zeros(3 ** length, dtype=np.int64)
+    for code in range(3 ** length):
+        cells = [(code // 3 ** i) % 3 for i in range(length)]
+        own, other = cells.count(player), cells.count(opponent)
+        if not other:
+            table[code] = weights.own[own]
+        elif not own:
+            table[code] = weights.opp[other]
+    line_scores = table[window_codes(flat, length)].sum(axis=1)
+    center_scores = (flat == player).astype(np.int64) @ (make_center_weights(size) * weights.center)
+    return line_scores + center_scores
+
+
+# --- 자가 대국 ---
+
+def play_self_game(seed, difficulty=3, epsilon=0.15, opening_stones=2, size=20,
+                   max_moves=150, win_length=WINDOW_LENGTH):
+    """
+    얕은 탐색 AI 끼리 한 판을 둡니다. (작업자 프로세스에서 실행)
+    epsilon 확률로 탐색 대신 돌 주변 후보 수 중 하나를 무작위로 두어 국면을 다양하게 만듭니다.
+
+    Returns:
+        tuple: ((row, col) 수 목록, 기보 결과)
+    """
+    from ai_player import AIPlayer
+    from board import Board
+    from candidates import CandidateGenerator
+    from game_record import game_result
+    from tournament import make_opening
+
+    rng = random.Random(seed)
+    board = Board(size, win_length)
+    moves = []
+    for row, col, player in make_opening(seed, opening_stones, size):
+        board.place_stone(row, col, player)
+        moves.append((row, col))
+    players = {1: AIPlayer(1, difficulty), 2: AIPlayer(2, difficulty)}
+    current = 1 if len(moves) % 2 == 0 else 2
+    winner = None
+    while len(moves) < max_moves and not board.is_board_full():
+        if rng.random() < epsilon:
+            move = rng.choice(CandidateGenerator(board).get_moves(10))
+        else:
+            move = players[current].get_best_move(board)
+        row, col = move
+        board.place_stone(row, col, current)
+        moves.append(move)
+        if board.check_winner(row, col, current):
+            winner = current
+            break
+        current = 2 if current == 1 else 1
+    return moves, game_result(winner, winner is not None or board.is_board_full())
+
+
+def self_play(path, games, workers=1, seed=0, difficulty=3, epsilon=0.15, opening_stones=2,
+              size=20, win_length=WINDOW_LENGTH, verbose=False):
+    """
+    자가 대국을 games 판 두고 압축 기보 파일에 덧붙입니다. (판 크기와 승리 길이도 기록)
+
+    Returns:
+        list: 판별 기보 결과
+    """
+    from game_record import GameRecordWriter
+
+    jobs = [(seed + game, difficulty, epsilon, opening_stones, size, 150, win_length)
+            for game in range(games)]
+    results = []
+    start = time.perf_counter()
+    with GameRecordWriter(path) as writer, ProcessPoolExecutor(max_workers=workers) as executor:
+        for moves, result in executor.map(play_self_game, *zip(*jobs)):
+            writer.write_game(moves, result, size, win_length)
+            results.append(result)
+            if verbose and len(results) % 100 == 0:
+                print(f"{len(results)}/{games}판 ({time.perf_counter() - start:.0f}s)")
+    return results
+
+
+# --- 학습 ---
+
+def load_positions(path, min_stones=4, stride=1, win_length=None):
+    """
+    기보 파일에서 승패가 난 대국들의 국면과 결과를 읽습니다.
+
+    Args:
+        path (str): 압축 기보 파일 경로
+        min_stones (int): 이보다 돌이 적은 초반 국면은 건너뜀
+        stride (int): 대국마다 몇 수 간격으로 국면을 고를지
+        win_length (int): 이 승리 길이로 둔 대국만 읽음 (None이면 전부)
+
+    Returns:
+        tuple: ((N, size, size) 보드 배열, (N,) 흑 승리 여부 배열, 대국 수)
+    """
+    import numpy as np
+    from game_record import RESULT_PLAYER1, RESULT_PLAYER2, GameRecordReader
+
+    boards, labels, games = [], [], 0
+    with GameRecordReader(path) as reader:
+        for n in range(len(reader)):
+            size, length, result, count = reader.header(n)
+            if result not in (RESULT_PLAYER1, RESULT_PLAYER2):
+                continue
+            if win_length is not None and length != win_length:
+                continue
+            games += 1
+            # 마지막 국면(승리 수가 놓인 국면)은 승리 판정으로 처리되므로 제외
+            for k in range(min_stones, count, stride):
+                boards.append(np.frombuffer(reader.cells(n, k), dtype=np.int8)
+                              .reshape(size, size))
+                labels.append(result == RESULT_PLAYER1)
+    return np.stack(boards), np.array(labels, dtype=np.float64), games
+
+
+def fit_logistic(features, labels, l2=1e-3, iterations=50):
+    """
+    L2 정규화한 로지스틱 회귀를 뉴턴 방법으로 학습합니다. (절편 없음)
+
+    특징 수가 작으므로(4목이면 7개) 매 반복 헤세 행렬을 직접 풀고,
+    특징을 열마다 표준편차로 나누어 학습한 뒤 원래 특징 단위의 가중치로 되돌려 반환합니다.
+
+    Returns:
+        numpy.ndarray: 특징별 가중치
+    """
+    import numpy as np
+
+    scale = features.std(axis=0)
+    scale[scale == 0] = 1.0
+    x = features / scale
+    w = np.zeros(x.shape[1])
+    regularizer = l2 * np.eye(x.shape[1])
+    for _ in range(iterations):
+        p = 1.0 / (1.0 + np.exp(-(x @ w)))
+        gradient = x.T @ (p - labels) / len(labels) + l2 * w
+        hessian = (x * (p * (1 - p))[:, None]).T @ x / len(labels) + regularizer
+        step = np.linalg.solve(hessian, gradient)
+        w -= step
+        if np.abs(step).max() < 1e-8:
+            break
+    return w / scale
+
+
+def log_loss(features, labels, w):
+    import numpy as np
+
+    p = np.clip(1.0 / (1.0 + np.exp(-(features @ w))), 1e-12, 1 - 1e-12)
+    return float(-np.mean(labels * np.log(p) + (1 - labels) * np.log(1 - p)))
+
+
+def to_pattern_weights(w, win_length=WINDOW_LENGTH):
+    """
+    학습한 실수 가중치를 정수 PatternWeights 로 바꿉니다.
+    가장 큰 윈도우 가중치가 손으로 정한 (승리 길이 - 1)개 윈도우 점수와 같아지도록 배율을 정하고,
+    승리 길이만큼 찬 윈도우 점수는 손으로 정한 값을 그대로 씁니다.
+    """
+    heuristic = PatternWeights.heuristic(win_length)
+    pattern = w[:-1]
+    factor = heuristic.own[win_length - 1] / max(abs(float(value)) for value in pattern)
+    own = [0] + [round(float(value) * factor) for value in pattern[:win_length - 1]]
+    opp = [0] + [round(float(value) * factor) for value in pattern[win_length - 1:]]
+    own.append(heuristic.own[win_length])
+    opp.append(heuristic.opp[win_length])
+    return PatternWeights(win_length, own, opp, max(0, round(float(w[-1]) * factor)))
+
+
+def train(path, win_length=WINDOW_LENGTH, l2=1e-3, iterations=50, seed=0, verbose=False):
+    """
+    기보 파일에서 승리 길이가 win_length 인 대국들의 국면으로 가중치를 학습합니다.
+    두 플레이어 관점의 특징을 모두 넣고, 대국 단위로 나눈 검증 세트의 로그 손실을 함께 계산합니다.
+
+    Returns:
+        tuple: (PatternWeights, 학습 정보 사전)
+    """
+    import numpy as np
+
+    boards, labels, games = load_positions(path, win_length=win_length)
+    if not games:
+        raise ValueError(f"{path} 에 승리 길이 {win_length} 로 승패가 난 대국이 없습니다")
+    features = np.concatenate([extract_features(boards, 1, win_length),
+                               extract_features(boards, 2, win_length)])
+    targets = np.concatenate([labels, 1.0 - labels])
+
+    # 국면 순서를 섞어 10%를 검증 세트로 사용 (같은 국면의 두 관점은 같은 쪽에 둠)
+    order = np.random.default_rng(seed).permutation(len(labels))
+    held = order[:len(order) // 10]
+    held = np.concatenate([held, held + len(labels)])
+    mask = np.ones(len(targets), dtype=bool)
+    mask[held] = False
+
+    w = fit_logistic(features[mask], targets[mask], l2, iterations)
+    weights = to_pattern_weights(w, win_length)
+    heuristic = PatternWeights.heuristic(win_length)
+    # 손으로 정한 가중치도 같은 방식으로 배율만 맞춰 검증 손실을 비교
+    heuristic_w = np.array(heuristic.own[1:win_length] + heuristic.opp[1:win_length]
+                           + [heuristic.center], dtype=np.float64)
+    heuristic_w *= float(fit_logistic(features[mask] @ heuristic_w[:, None],
+                                      targets[mask], l2, iterations)[0])
+    info = {
+        'games': games,
+        'positions': int(len(labels)),
+        'features': feature_names(win_length),
+        'raw_weights': [round(float(value), 6) for value in w],
+        'held_out_log_loss': round(log_loss(features[held], targets[held], w), 4),
+        'heuristic_held_out_log_loss': round(log_loss(features[held], targets[held],
+                                                      heuristic_w), 4),
+    }
+    if verbose:
+        print(f"대국 {games}판, 국면 {len(labels)}개")
+        print(f"검증 로그 손실: 학습 {info['held_out_log_loss']}, "
+              f"손으로 정한 가중치 {info['heuristic_held_out_log_loss']}")
+        print(weights)
+    return weights, info
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    commands = parser.add_subparsers(dest='command', required=True)
+    play = commands.add_parser('selfplay', help="자가 대국 기보 만들기")
+    play.add_argument("--games", type=int, default=2000)
+    play.add_argument("--workers", type=int, default=1)
+    play.add_argument("--seed", type=int, default=0)
+    play.add_argument("--difficulty", type=int, default=3)
+    play.add_argument("--epsilon", type=float, default=0.15)
+    play.add_argument("--size", type=int, default=20)
+    play.add_argument("--win-length", type=int, default=WINDOW_LENGTH)
+    play.add_argument("--output", default='selfplay.grc')
+    fit = commands.add_parser('train', help="기보로 가중치 학습")
+    fit.add_argument("records")
+    fit.add_argument("--l2", type=float, default=1e-3)
+    fit.add_argument("--iterations", type=int, default=50)
+    fit.add_argument("--win-length", type=int, default=WINDOW_LENGTH)
+    fit.add_argument("--output", default=DEFAULT_WEIGHTS_PATH)
+    args = parser.parse_args()
+
+    if args.command == 'selfplay':
+        results = self_play(args.output, args.games, args.workers, args.seed,
+                            args.difficulty, args.epsilon, size=args.size,
+                            win_length=args.win_length, verbose=True)
+        print(f"{args.output}: {len(results)}판 "
+              f"(흑 승 {results.count(1)}, 백 승 {results.count(2)}, 그 밖 {len(results) - results.count(1) - results.count(2)})")
+    else:
+        weights, info = train(args.records, args.win_length, l2=args.l2, iterations=args.iterations,
+                              verbose=True)
+        weights.save(args.output, training=info)
+        print(f"가중치 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""
+4목 게임 서버(server.py) 부하 생성기
+여러 연결에서 많은 사람 vs AI 대국을 동시에 열고, 사람 쪽 수를 무작위로(돌 근처에) 두며
+초당 처리한 수와 수 요청의 지연 시간 백분위수(AI 사고 시간과 대기 시간 포함)를 보고합니다.
+
+잘못된 요청들(JSON 객체가 아닌 줄, 범위를 벗어난 판 크기/승리 길이/난이도 등)에도
+서버가 오류 응답을 보내는지 먼저 확인합니다.
+
+사용법:
+    python3 server.py --port 8765 &
+    python3 load_client.py [--port 8765] [--connections 4] [--sessions 50] [--moves 10]
+    python3 load_client.py --spawn [--workers 4]    # 빈 포트로 서버를 같은 프로세스에서 띄워 측정
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import time
+
+from tournament import percentile
+
+SIZE = 20
+
+
+class Connection:
+    def __init__(self, reader, writer):
+        """
+        서버 연결 하나 (요청에 id 를 붙여 여러 요청을 동시에 보내고 응답을 짝지음)
+        """
+        self.reader = reader
+        self.writer = writer
+        self.waiting = {}
+        self._ids = itertools.count(1)
+        self._reader_task = asyncio.get_running_loop().create_task(self._read())
+
+    @classmethod
+    async def open(cls, host, port):
+        reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def _read(self):
+        while True:
+            line = await self.reader.readline()
+            if not line:
+                break
+            response = json.loads(line)
+            future = self.waiting.pop(response.get('id'), None)
+            if future is not None:
+                future.set_result(response)
+        for future in self.waiting.values():
+            future.set_exception(ConnectionError('서버 연결이 끊어졌습니다'))
+
+    async def request(self, **request):
+        """
+        요청 하나를 보내고 응답 사전을 기다립니다.
+        """
+        request['id'] = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self.waiting[request['id']] = future
+        self.writer.write(json.dumps(request).encode() + b'\n')
+        await self.writer.drain()
+        return await future
+
+    async def send_line(self, line):
+        """
+        id 를 붙일 수 없는 줄(JSON 객체가 아닌 요청 등)을 그대로 보내고 응답을 기다립니다.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self.waiting[None] = future
+        self.writer.write(line + b'\n')
+        await self.writer.drain()
+        return await asyncio.wait_for(future, 5.0)
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+        await self._reader_task
+
+
+async def check_errors(host, port):
+    """
+    잘못된 요청마다 서버가 ok=false 인 오류 응답을 보내는지 확인합니다.
+
+    Returns:
+        int: 확인한 요청 수
+    """
+    connection = await Connection.open(host, port)
+    lines = [b'[1, 2]', b'"new"', b'42', b'{not json', b'\xff\xfe']
+    requests = [
+        {'cmd': 'new', 'size': 300},
+        {'cmd': 'new', 'size': 0},
+        {'cmd': 'new', 'size': 9, 'win_length': 10},
+        {'cmd': 'new', 'win_length': 1},
+        {'cmd': 'new', 'difficulty': 99},
+        {'cmd': 'new', 'move_time': -1},
+        {'cmd': 'new', 'budget': 'nan'},
+        {'cmd': 'new', 'size': [20]},
+        {'cmd': 'move', 'session': 12345, 'row': 0, 'col': 0},
+        {'cmd': 'move'},
+        {'cmd': 'unknown'},
+        {},
+    ]
+    try:
+        for line in lines:
+            response = await connection.send_line(line)
+            assert response['ok'] is False, (line, response)
+        for request in requests:
+            response = await connection.request(**request)
+            assert response['ok'] is False, (request, response)
+        # 오류 뒤에도 같은 연결에서 정상 요청을 처리함
+        response = await connection.request(cmd='new', ai=False, size=5)
+        assert response['ok']
+    finally:
+        await connection.close()
+    return len(lines) + len(requests)
+
+
+async def play_session(connection, rng, moves, latencies, options):
+    """
+    대국 하나를 열고 사람 쪽 수를 moves 번(또는 게임이 끝날 때까지) 둡니다.
+
+    Returns:
+        int: 서버가 처리한 수 (사람 + AI)
+    """
+    response = await connection.request(cmd='new', ai=True, **options)
+    session = response['session']
+    stones = set()
+    played = 0
+    for _ in range(moves):
+        # 기존 돌 근처(없으면 중앙 근처)의 빈칸을 무작위로 고름
+        while True:
+            if stones:
+                row, col = rng.choice(sorted(stones))
+                row += rng.randint(-2, 2)
+                col += rng.randint(-2, 2)
+            else:
+                row, col = SIZE // 2 + rng.randint(-2, 2), SIZE // 2 + rng.randint(-2, 2)
+            if 0 <= row < SIZE and 0 <= col < SIZE and (row, col) not in stones:
+                break
+        start = time.perf_counter()
+        response = await connection.request(cmd='move', session=session, row=row, col=col)
+        latencies.append(time.perf_counter() - start)
+        if not response['ok']:
+            raise RuntimeError(response['error'])
+        stones.add((row, col))
+        played += 1
+        if response['ai_move'] is not None:
+            stones.add(tuple(response['ai_move']))
+            played += 1
+        if response['game_over']:
+            break
+    await connection.request(cmd='close', session=session)
+    return played
+
+
+async def run_load(host, port, connections, sessions, moves, seed=0, **options):
+    """
+    connections 개의 연결에서 각각 sessions 개의 대국을 동시에 진행합니다.
+
+    Returns:
+        dict: 처리한 수, 초당 수, 지연 시간 백분위수(ms), 서버 통계
+    """
+    opened = [await Connection.open(host, port) for _ in range(connections)]
+    latencies = []
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    counts = await asyncio.gather(*(
+        play_session(connection, random.Random(rng.random()), moves, latencies, options)
+        for connection in opened for _ in range(sessions)))
+    elapsed = time.perf_counter() - start
+    server_stats = await opened[0].request(cmd='stats')
+    for connection in opened:
+        await connection.close()
+    return {
+        'sessions': connections * sessions,
+        'moves': sum(counts),
+        'requests': len(latencies),
+        'elapsed': elapsed,
+        'moves_per_sec': sum(counts) / elapsed,
+        'latency_ms': {f'p{p}': percentile(latencies, p / 100) * 1e3
+                       for p in (50, 90, 95, 99)},
+        'server': server_stats,
+    }
+
+
+async def run_with_server(workers, **kwargs):
+    """
+    빈 포트로 서버를 같은 프로세스에서 띄우고 부하를 건 뒤 종료합니다.
+    """
+    from server import GameServer
+
+    server = GameServer(workers)
+    await server.start('127.0.0.1', 0)
+    port = server.server.sockets[0].getsockname()[1]
+    try:
+        await check_errors('127.0.0.1', port)
+        return await run_load('127.0.0.1', port, **kwargs)
+    finally:
+        await server.close()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--spawn", action="store_true", help="서버를 직접 띄워서 측정")
+    parser.add_argument("--workers", type=int, default=None, help="--spawn 일 때 작업자 수")
+    parser.add_argument("--connections", type=int, default=4)
+    parser.add_argument("--sessions", type=int, default=50, help="연결당 대국 수")
+    parser.add_argument("--moves", type=int, default=10, help="대국당 사람 수")
+    parser.add_argument("--difficulty", type=int, default=2)
+    parser.add_argument("--move-time", type=float, default=0.2)
+    parser.add_argument("--budget", type=float, default=5.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    kwargs = dict(connections=args.connections, sessions=args.sessions, moves=args.moves,
+                  seed=args.seed, difficulty=args.difficulty, move_time=args.move_time,
+                  budget=args.budget)
+    if args.spawn:
+        result = asyncio.run(run_with_server(args.workers, **kwargs))
+    else:
+        asyncio.run(check_errors(args.host, args.port))
+        result = asyncio.run(run_load(args.host, args.port, **kwargs))
+    print("잘못된 요청에 대한 오류 응답 확인 완료")
+
+    latency = result['latency_ms']
+    print(f"대국 {result['sessions']}개, 수 {result['moves']}개, {result['elapsed']:.2f}초")
+    print(f"초당 수: {result['moves_per_sec']:.1f} moves/s "
+          f"(서버 AI 작업자 {result['server']['workers']}개)")
+    print(f"지연 시간: p50 {latency['p50']:.1f}ms, p90 {latency['p90']:.1f}ms, "
+          f"p95 {latency['p95']:.1f}ms, p99 {latency['p99']:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
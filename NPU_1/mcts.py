@@ -0,0 +1,463 @@
+"""
+몬테카를로 트리 탐색(MCTS) AI 플레이어
+깊이를 정해 두고 모든 수를 읽는 알파-베타 대신, 시간(또는 플레이아웃 수) 예산 안에서
+유망한 수순을 더 많이 두어 보며 트리를 키우는 언제든 멈출 수 있는(anytime) 탐색입니다.
+AIPlayer 와 같은 get_best_move(board, time_limit) 인터페이스를 가집니다.
+
+- 선택: UCT (승률 + exploration * sqrt(ln 부모 방문 수 / 방문 수))
+- 확장: 둘 차례의 즉시 승리 칸이 있으면 그 수만, 상대의 즉시 승리 칸이 있으면 막는 수만,
+  없으면 돌 주변 후보 수(CandidateGenerator) 상위 max_children 개를 영향도 순서로 펼침
+- 플레이아웃: 놓인 돌에서 거리 2 이내의 빈칸 중 무작위로 번갈아 두고, 승패가 나거나
+  rollout_moves 수를 두면 끝 (승패가 나지 않으면 무승부 0.5)
+- 트리 재사용: 다음 get_best_move 에서 이전 루트 뒤에 놓인 두 수(AI 의 수, 상대의 응수)를 따라
+  내려간 노드를 새 루트로 삼아 이전 방문 통계를 이어서 사용
+- 병렬 플레이아웃: workers > 1 이면 작업자 프로세스마다 같은 국면에서 트리를 따로 키우고
+  (루트 병렬화) 루트 수별 방문 수를 합쳐 가장 많이 방문한 수를 고름
+  작업자마다 전용 프로세스 하나가 MCTSPlayer 하나를 계속 유지하므로 작업자별 트리도 수와 수 사이에 재사용되고,
+  중단 요청은 공유 플래그로 작업자들에게 전달됨
+- 보드를 복사하지 않고 make_move/unmake_move 수 스택으로 두고 되돌림
+"""
+import math
+import multiprocessing
+import random
+import time
+
+from ai_player import AIPlayer
+from candidates import CandidateGenerator, get_neighbors
+from threats import ThreatSolver
+
+class Node:
+    __slots__ = ('move', 'player', 'parent', 'children', 'untried', 'visits', 'wins', 'winner')
+
+    def __init__(self, move, player, parent=None):
+        """
+        트리 노드를 만듭니다.
+
+        Args:
+            move (int): 이 노드로 오는 수의 칸 번호 (루트는 None)
+            player (int): move 를 둔 플레이어 (루트는 직전에 둔 플레이어, 즉 AI 의 상대)
+            parent (Node): 부모 노드
+        """
+        self.move = move
+        self.player = player
+        self.parent = parent
+        self.children = []
+        self.untried = None  # 아직 펼치지 않은 수들 (처음 방문할 때 만듦, 끝에서부터 펼침)
+        self.visits = 0
+        self.wins = 0.0  # player 관점의 승리 수 (무승부는 0.5)
+        self.winner = None  # move 로 승리했으면 player
+
+    def select_child(self, exploration):
+        """
+        UCT 값이 가장 큰 자식을 반환합니다.
+        """
+        log_visits = math.log(self.visits)
+        best, best_value = None, -math.inf
+        for child in self.children:
+            value = (child.wins / child.visits
+                     + exploration * math.sqrt(log_visits / child.visits))
+            if value > best_value:
+                best, best_value = child, value
+        return best
+
+    def count(self):
+        """
+        이 노드를 루트로 하는 트리의 노드 수를 반환합니다.
+        """
+        total, stack = 0, [self]
+        while stack:
+            node = stack.pop()
+            total += 1
+            stack.extend(node.children)
+        return total
+
+
+def _search_worker(player, board_class, size, win_length, stones, time_limit, playouts):
+    """
+    작업자 프로세스에서 자기 트리를 키우고 루트 수별 통계를 반환합니다.
+
+    Returns:
+        tuple: ({칸 번호: (방문 수, 승리 수)}, 이번 플레이아웃 수, 재사용한 방문 수, 트리 최대 깊이)
+    """
+    board = board_class(size, win_length)
+    for row, col, stone in stones:
+        board.place_stone(row, col, stone)
+    root, reused = player.prepare_root(board)
+    count, depth = player.grow(board, root, time_limit, playouts)
+    stats = {child.move: (child.visits, child.wins) for child in root.children}
+    return stats, count, reused, depth
+
+
+def _worker_main(connection, index, shared_stop, config):
+    """
+    작업자 프로세스의 본체입니다. MCTSPlayer 하나(트리 하나)를 계속 유지하며
+    탐색 요청을 받을 때마다 트리를 키워 루트 통계를 돌려보내고, None 을 받으면 끝냅니다.
+
+    Args:
+        connection: 주 프로세스와 연결된 Pipe 끝
+        index (int): 작업자 번호 (시드를 작업자마다 다르게 함)
+        shared_stop: 프로세스 간 공유되는 중단 요청 플래그 (multiprocessing.Value)
+        config (dict): MCTSPlayer 생성 인자
+    """
+    config = dict(config, workers=1)
+    if config.get('seed') is not None:
+        config['seed'] += index
+    player = MCTSPlayer(**config)
+    player.stop_flag = shared_stop
+    while True:
+        request = connection.recv()
+        if request is None:
+            break
+        connection.send(_search_worker(player, *request))
+    connection.close()
+
+
+class MCTSPlayer:
+    def __init__(self, player_number, time_limit=1.0, playouts=None, exploration=1.0,
+                 max_children=15, rollout_moves=40, workers=1, reuse_tree=True,
+                 threat_nodes=20000, seed=None, solved_cache=None):
+        """
+        MCTS 플레이어를 초기화합니다.
+
+        Args:
+            player_number (int): AI 플레이어 번호 (1 또는 2)
+            time_limit (float): 수당 기본 시간 예산 (초), None 이면 playouts 만 사용
+            playouts (int): 수당 플레이아웃 수 예산 (None 이면 시간만 사용, 둘 다 주면 먼저 닿는 쪽)
+                            time_limit 과 playouts 가 모두 None 이면 끝나지 않으므로 ValueError
+            exploration (float): UCT 탐험 상수
+            max_children (int): 노드마다 펼칠 최대 후보 수
+            rollout_moves (int): 플레이아웃 한 번에 둘 최대 수
+            workers (int): 플레이아웃을 나누어 실행할 작업자 프로세스 수 (1이면 현재 프로세스)
+            reuse_tree (bool): get_best_move 호출 사이에 트리를 재사용할지 여부
+            threat_nodes (int): 탐색 전에 실행하는 위협 공간 탐색의 노드 예산 (0이면 사용 안 함)
+            seed (int): 플레이아웃 난수 시드 (None 이면 매번 다름)
+            solved_cache: 위협 공간 탐색 결과 캐시 (AIPlayer 의 solved_cache 와 같음)
+        """
+        if time_limit is None and playouts is None:
+            raise ValueError("time_limit 과 playouts 중 하나는 주어야 합니다")
+        self.player = player_number
+        self.opponent = 2 if player_number == 1 else 1
+        self.time_limit = time_limit
+        self.playouts = playouts
+        self.exploration = exploration
+        self.max_children = max_children
+        self.rollout_moves = rollout_moves
+        self.reuse_tree = reuse_tree
+        self.rng = random.Random(seed)
+
+        # 즉시 승리/차단과 위협 공간 탐색은 AIPlayer 와 같은 방법을 사용
+        self._tactics = AIPlayer(player_number, tt_memory_mb=None, threat_nodes=threat_nodes,
+                                 solved_cache=solved_cache)
+        self.threat_nodes = threat_nodes
+
+        self._root = None  # 재사용할 트리의 루트 (AI 가 둘 차례인 국면)
+        self._root_stones = None  # 루트 국면의 {칸 번호: 플레이어}
+        self._root_shape = None  # 루트 국면의 (판 크기, 승리 길이)
+        self.nodes = 0  # 이번 get_best_move 의 플레이아웃 수
+        self.last_search_info = {}
+        self.stop_requested = False
+        self.stop_flag = None  # 다른 프로세스가 세우는 중단 플래그 (작업자 프로세스, multiprocessing.Value)
+
+        self.workers = workers
+        self._workers = None  # 작업자별 (프로세스, Pipe 끝) 목록 (처음 병렬 탐색할 때 시작)
+        self._shared_stop = None
+        self._config = {
+            'player_number': player_number, 'exploration': exploration,
+            'max_children': max_children, 'rollout_moves': rollout_moves,
+            'reuse_tree': reuse_tree, 'threat_nodes': threat_nodes, 'seed': seed,
+        }
+
+    # --- 트리 ---
+
+    def prepare_root(self, board):
+        """
+        이전 트리에서 현재 국면의 노드를 찾아 루트로 삼고, 없으면 새 루트를 만듭니다.
+
+        Returns:
+            tuple: (루트 노드, 재사용한 루트 방문 수)
+        """
+        root = self._find_reusable(board) if self.reuse_tree else None
+        if root is None:
+            root = Node(None, self.opponent)
+        root.parent = None
+        self._root = root
+        self._root_stones = dict(board.stones)
+        self._root_shape = (board.size, board.win_length)
+        return root, root.visits
+
+    def _find_reusable(self, board):
+        """
+        이전 루트 국면 뒤에 놓인 돌들을 따라 트리를 내려가 현재 국면의 노드를 찾습니다.
+        """
+        if self._root is None or self._root_shape != (board.size, board.win_length):
+            return None
+        stones = board.stones
+        old = self._root_stones
+        if len(stones) < len(old) or any(stones.get(cell) != player for cell, player in old.items()):
+            return None
+        added = {cell: player for cell, player in stones.items() if cell not in old}
+        node = self._root
+        while added:
+            for child in node.children:
+                if added.get(child.move) == child.player:
+                    del added[child.move]
+                    node = child
+                    break
+            else:
+                return None
+        # AI 가 둘 차례인 국면이어야 함 (직전 수를 상대가 둠)
+        return node if node.player == self.opponent and node.winner is None else None
+
+    def expand_moves(self, board, player):
+        """
+        노드를 처음 방문할 때 펼칠 수들을 정합니다. (리스트 끝에서부터 펼침)
+
+        Args:
+            board: 노드 국면의 보드
+            player: 둘 차례인 플레이어
+
+        Returns:
+            list: 칸 번호 리스트
+        """
+        threats = ThreatSolver(board)
+        wins = threats.winning_cells(player)
+        if wins:
+            return [min(wins)]
+        blocks = threats.winning_cells(3 - player)
+        if blocks:
+            return sorted(blocks, reverse=True)
+        size = board.size
+        moves = CandidateGenerator(board).get_moves(self.max_children)
+        return [row * size + col for row, col in reversed(moves)]
+
+    def rollout(self, board, player):
+        """
+        놓인 돌 주변의 빈칸에 무작위로 번갈아 두어 승자를 정합니다. (둔 수는 호출한 쪽이 되돌림)
+
+        Args:
+            board: 플레이아웃을 시작할 보드
+            player: 처음 둘 플레이어
+
+        Returns:
+            int: 승자 (rollout_moves 수 안에 승패가 나지 않으면 None)
+        """
+        size = board.size
+        stones = board.stones
+        neighbors = get_neighbors(size)
+        randrange = self.rng.randrange
+        # 돌이 많은 곳 근처의 칸은 여러 번 들어가므로 더 자주 골라짐
+        frontier = [cell for stone in stones for cell, _ in neighbors[stone]]
+        for _ in range(self.rollout_moves):
+            while frontier:
+                index = randrange(len(frontier))
+                cell = frontier[index]
+                frontier[index] = frontier[-1]
+                frontier.pop()
+                if cell not in stones:
+                    row, col = divmod(cell, size)
+                    break
+            else:
+                return None
+            board.make_move(row, col, player)
+            if board.check_winner(row, col, player):
+                return player
+            frontier.extend(cell for cell, _ in neighbors[cell])
+            player = 3 - player
+        return None
+
+    def playout(self, board, root):
+        """
+        선택, 확장, 플레이아웃, 역전파를 한 번 실행합니다.
+
+        Returns:
+            int: 이번 플레이아웃에서 내려간 트리 깊이
+        """
+        base = len(board.move_stack)
+        size = board.size
+        exploration = self.exploration
+        node = root
+        depth = 0
+
+        # 선택: 모든 수를 펼친 노드에서 UCT 로 내려감
+        while node.winner is None and node.untried is not None and not node.untried and node.children:
+            node = node.select_child(exploration)
+            row, col = divmod(node.move, size)
+            board.make_move(row, col, node.player)
+            depth += 1
+
+        # 확장
+        if node.winner is None:
+            player = 3 - node.player
+            if node.untried is None:
+                node.untried = self.expand_moves(board, player)
+            if node.untried:
+                cell = node.untried.pop()
+                row, col = divmod(cell, size)
+                board.make_move(row, col, player)
+                child = Node(cell, player, node)
+                if board.check_winner(row, col, player):
+                    child.winner = player
+                node.children.append(child)
+                node = child
+                depth += 1
+
+        # 플레이아웃
+        if node.winner is not None:
+            winner = node.winner
+        elif node.untried == [] and not node.children:
+            winner = None  # 둘 곳이 없음 (무승부)
+        else:
+            winner = self.rollout(board, 3 - node.player)
+        board.undo_to(base)
+
+        # 역전파
+        while node is not None:
+            node.visits += 1
+            if winner is None:
+                node.wins += 0.5
+            elif winner == node.player:
+                node.wins += 1.0
+            node = node.parent
+        return depth
+
+    def grow(self, board, root, time_limit, playouts):
+        """
+        예산이 다하거나 중단을 요청받을 때까지 플레이아웃을 반복합니다.
+
+        Returns:
+            tuple: (이번에 실행한 플레이아웃 수, 트리 최대 깊이)
+        """
+        deadline = None if time_limit is None else time.perf_counter() + time_limit
+        count = max_depth = 0
+        while playouts is None or count < playouts:
+            max_depth = max(max_depth, self.playout(board, root))
+            count += 1
+            # 시간 확인은 16번마다
+            if not count & 15 and (self.stop_requested or
+                                   (self.stop_flag is not None and self.stop_flag.value) or
+                                   (deadline is not None and time.perf_counter() > deadline)):
+                break
+        return count, max_depth
+
+    # --- AIPlayer 와 같은 인터페이스 ---
+
+    def get_best_move(self, board, time_limit=None, max_depth=None):
+        """
+        현재 보드 상태에서 가장 많이 방문한 수를 반환합니다.
+
+        Args:
+            board: 게임 보드 (탐색 뒤 원래 상태로 되돌아감)
+            time_limit (float): 시간 예산 (초), None 이면 생성할 때 준 time_limit
+            max_depth: AIPlayer 와 인터페이스를 맞추기 위한 인자 (사용하지 않음)
+
+        Returns:
+            tuple: (row, col) 위치
+        """
+        start = time.perf_counter()
+        # 이전 탐색에 보낸 중단 요청은 지움
+        self.stop_requested = False
+        if self._shared_stop is not None:
+            self._shared_stop.value = 0
+        if time_limit is None:
+            time_limit = self.time_limit
+        if time_limit is not None and math.isinf(time_limit):
+            time_limit = None  # request_stop 까지 탐색 (playouts 가 있으면 그 수까지)
+        self.nodes = 0
+        self.last_search_info = {'depth': 0, 'nodes': 0, 'time': 0.0, 'playouts': 0,
+                                 'reused': 0, 'tree_nodes': 0}
+
+        # 즉시 승리/차단, 강제 승리 수순은 탐색 없이 둠
+        move = self._tactics.find_immediate_win_or_block(board)
+        if move is None and self.threat_nodes and board.stones:
+            move = self._tactics.find_threat_move(board)
+        if move is not None:
+            return move
+        if len(board.stones) == board.size * board.size:
+            return None
+        if not board.stones:
+            center = board.size // 2
+            return (center, center)
+
+        if self.workers > 1:
+            stats, count, reused, depth = self._search_parallel(board, time_limit)
+            tree_nodes = None
+        else:
+            root, reused = self.prepare_root(board)
+            count, depth = self.grow(board, root, time_limit, self.playouts)
+            stats = {child.move: (child.visits, child.wins) for child in root.children}
+            tree_nodes = root.count()
+
+        cell = max(stats, key=lambda move: (stats[move][0], stats[move][1]))
+        visits, wins = stats[cell]
+        self.nodes = count
+        self.last_search_info = {
+            'depth': depth, 'nodes': count, 'time': time.perf_counter() - start,
+            'playouts': count, 'reused': reused, 'tree_nodes': tree_nodes,
+            'win_rate': wins / visits if visits else 0.0,
+            'pv': [divmod(cell, board.size)],
+        }
+        return divmod(cell, board.size)
+
+    def start_workers(self):
+        """
+        작업자 프로세스들을 시작합니다. (이미 시작했으면 아무것도 하지 않음)
+        """
+        if self._workers is not None:
+            return
+        self._shared_stop = multiprocessing.Value('b', 0)
+        self._workers = []
+        for index in range(self.workers):
+            connection, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_worker_main, daemon=True,
+                                              args=(child, index, self._shared_stop, self._config))
+            process.start()
+            child.close()
+            self._workers.append((process, connection))
+
+    def _search_parallel(self, board, time_limit):
+        """
+        작업자 프로세스들이 같은 국면에서 각자 트리를 키우고 루트 통계를 합칩니다.
+        """
+        self.start_workers()
+        stones = [divmod(cell, board.size) + (player,) for cell, player in board.stones.items()]
+        playouts = None if self.playouts is None else -(-self.playouts // self.workers)
+        request = (type(board), board.size, board.win_length, stones, time_limit, playouts)
+        for _, connection in self._workers:
+            connection.send(request)
+        stats, count, reused, depth = {}, 0, 0, 0
+        for _, connection in self._workers:
+            worker_stats, worker_count, worker_reused, worker_depth = connection.recv()
+            for cell, (visits, wins) in worker_stats.items():
+                total_visits, total_wins = stats.get(cell, (0, 0.0))
+                stats[cell] = (total_visits + visits, total_wins + wins)
+            count += worker_count
+            reused += worker_reused
+            depth = max(depth, worker_depth)
+        return stats, count, reused, depth
+
+    def request_stop(self):
+        """
+        진행 중인 탐색을 멈추도록 요청합니다. (다른 스레드에서 호출 가능, 작업자 프로세스에도 전달)
+        중단 요청은 다음 get_best_move 를 시작할 때 지워집니다.
+        """
+        self.stop_requested = True
+        if self._shared_stop is not None:
+            self._shared_stop.value = 1
+
+    def reset(self):
+        """
+        재사용할 트리를 버립니다. (새 게임)
+        """
+        self._root = None
+        self._root_stones = None
+
+    def close(self):
+        """
+        작업자 프로세스를 종료합니다.
+        """
+        if self._workers is not None:
+            for process, connection in self._workers:
+                connection.send(None)
+                connection.close()
+                process.join()
+            self._workers = None
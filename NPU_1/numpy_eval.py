@@ -0,0 +1,219 @@
+"""
+NumPy 로 벡터화한 보드 평가기와 여러 보드 일괄 처리 API
+판의 가로/세로/두 대각선 방향 길이 4(승리 조건 길이) 윈도우 전체를 한 번에 모아서
+evaluate_window 와 같은 1000/100/10/1 규칙으로 분류하고 AIPlayer.evaluate_board 와 같은 점수를 계산합니다.
+(N, size, size) 모양으로 쌓은 보드들의 점수와 승자도 한 번에 계산할 수 있습니다.
+
+NumPy 가 필요합니다. (AIPlayer(evaluator='numpy') 를 사용할 때만 불러옵니다)
+"""
+import numpy as np
+
+from evaluator import DIRECTIONS, WINDOW_LENGTH, window_scores
+
+# 윈도우 하나를 3진수 코드(칸 값 * 3^i 의 합)로 나타낼 때 가능한 코드 개수 (4목)
+WINDOW_CODES = 3 ** WINDOW_LENGTH
+
+# 한 번에 처리할 보드 수 (중간 배열이 너무 커지지 않도록 나누어 처리)
+DEFAULT_CHUNK_SIZE = 2048
+
+# 판 크기/윈도우 길이별 윈도우 칸 번호 배열 캐시
+_window_index_cache = {}
+
+# 플레이어/윈도우 길이별 (윈도우 코드 -> 점수 기여도) 표 캐시
+_code_score_cache = {}
+
+
+def get_window_indices(size, length=WINDOW_LENGTH):
+    """
+    판 안에 들어가는 모든 길이 length 윈도우의 칸 번호(row * size + col)를 반환합니다.
+
+    Args:
+        size (int): 바둑판 크기
+        length (int): 윈도우 길이
+
+    Returns:
+        numpy.ndarray: (윈도우 개수, length) 모양의 정수 배열
+    """
+    if (size, length) not in _window_index_cache:
+        rows, cols = np.meshgrid(np.arange(size), np.arange(size), indexing='ij')
+        steps = np.arange(length)
+        windows = []
+        for dr, dc in DIRECTIONS:
+            # 각 칸을 시작점으로 하는 윈도우의 칸 좌표 (size, size, length)
+            window_rows = rows[..., None] + dr * steps
+            window_cols = cols[..., None] + dc * steps
+            inside = ((window_rows >= 0) & (window_rows < size) &
+                      (window_cols >= 0) & (window_cols < size)).all(axis=-1)
+            windows.append((window_rows * size + window_cols)[inside])
+        _window_index_cache[size, length] = np.concatenate(windows)
+    return _window_index_cache[size, length]
+
+
+def get_code_scores(player, length=WINDOW_LENGTH):
+    """
+    윈도우 코드별 점수 기여도 표를 반환합니다.
+    같은 색 돌 k개만 있는 윈도우는 돌마다 한 번씩, 즉 k번 점수가 더해집니다.
+
+    Args:
+        player (int): 점수를 계산할 AI 플레이어 번호
+        length (int): 윈도우 길이
+
+    Returns:
+        numpy.ndarray: (3 ** length,) 모양의 정수 배열 (4목이면 81개)
+    """
+    if (player, length) not in _code_score_cache:
+        opponent = 2 if player == 1 else 1
+        scores = window_scores(length)
+        table = np.zeros(3 ** length, dtype=np.int32)
+        for code in range(3 ** length):
+            cells = [(code // 3 ** i) % 3 for i in range(length)]
+            own, other = cells.count(player), cells.count(opponent)
+            if own and not other:
+                table[code] = own * scores.get(own, 0)
+            elif other and not own:
+                table[code] = -other * scores.get(other, 0)
+        _code_score_cache[player, length] = table
+    return _code_score_cache[player, length]
+
+
+def make_center_weights(size):
+    """
+    중앙 위치 보너스 max(0, 10 - 중앙까지의 맨해튼 거리)를 칸 번호 순서로 반환합니다.
+    """
+    center = size // 2
+    rows, cols = np.meshgrid(np.arange(size), np.arange(size), indexing='ij')
+    return np.maximum(0, 10 - (np.abs(rows - center) + np.abs(cols - center))).ravel()
+
+
+def board_to_array(board):
+    """
+    Board(또는 BitBoard)를 (size, size) 모양의 int8 배열로 변환합니다.
+    """
+    return np.asarray(board.board, dtype=np.int8)
+
+
+def boards_to_array(boards):
+    """
+    Board 객체들을 (N, size, size) 모양의 int8 배열로 쌓습니다.
+    """
+    return np.stack([board_to_array(board) for board in boards])
+
+
+def window_codes(flat_boards, length=WINDOW_LENGTH):
+    """
+    보드들의 모든 윈도우를 3진수 코드로 변환합니다.
+
+    Args:
+        flat_boards (numpy.ndarray): (N, size * size) 모양의 보드 배열
+        length (int): 윈도우 길이
+
+    Returns:
+        numpy.ndarray: (N, 윈도우 개수) 모양의 코드 배열 (길이 9 이하면 int16)
+    """
+    size = int(round(flat_boards.shape[1] ** 0.5))
+    indices = get_window_indices(size, length)
+    dtype = np.int16 if 3 ** length <= np.iinfo(np.int16).max else np.int32
+    codes = np.zeros((flat_boards.shape[0], indices.shape[0]), dtype=dtype)
+    for i in range(length):
+        codes += flat_boards[:, indices[:, i]].astype(dtype) * (3 ** i)
+    return codes
+
+
+def evaluate_boards(boards, player, chunk_size=DEFAULT_CHUNK_SIZE, win_length=WINDOW_LENGTH):
+    """
+    (N, size, size) 모양으로 쌓은 보드들을 한 번에 평가합니다.
+
+    Args:
+        boards (numpy.ndarray): 0/1/2 로 이루어진 보드 배열 (N, size, size)
+        player (int): 점수를 계산할 AI 플레이어 번호
+        chunk_size (int): 한 번에 처리할 보드 수
+        win_length (int): 승리에 필요한 연속 돌 수 (윈도우 길이)
+
+    Returns:
+        numpy.ndarray: (N,) 모양의 점수 배열 (AIPlayer.evaluate_board 와 같은 값)
+    """
+    boards = np.asarray(boards, dtype=np.int8)
+    count, size = boards.shape[0], boards.shape[-1]
+    flat = boards.reshape(count, size * size)
+    code_scores = get_code_scores(player, win_length)
+    center_weights = make_center_weights(size)
+
+    scores = np.empty(count, dtype=np.int64)
+    for start in range(0, count, chunk_size):
+        chunk = flat[start:start + chunk_size]
+        line_scores = code_scores[window_codes(chunk, win_length)].sum(axis=1, dtype=np.int64)
+        center_scores = (chunk == player).astype(np.int64) @ center_weights
+        scores[start:start + chunk_size] = line_scores + center_scores
+    return scores
+
+
+def check_winners(boards, chunk_size=DEFAULT_CHUNK_SIZE, win_length=WINDOW_LENGTH):
+    """
+    (N, size, size) 모양으로 쌓은 보드들의 승자를 한 번에 찾습니다.
+
+    두 플레이어 모두 4목이 있으면 Board.find_winner 와 같이
+    행 우선 순서로 먼저 나오는 승리 돌의 플레이어를 승자로 판단합니다.
+
+    Args:
+        boards (numpy.ndarray): 0/1/2 로 이루어진 보드 배열 (N, size, size)
+        chunk_size (int): 한 번에 처리할 보드 수
+        win_length (int): 승리에 필요한 연속 돌 수
+
+    Returns:
+        numpy.ndarray: (N,) 모양의 int8 배열 (승자 번호, 승자가 없으면 0)
+    """
+    boards = np.asarray(boards, dtype=np.int8)
+    count, size = boards.shape[0], boards.shape[-1]
+    flat = boards.reshape(count, size * size)
+    first_cells = get_window_indices(size, win_length).min(axis=1)
+    no_win = size * size
+
+    winners = np.zeros(count, dtype=np.int8)
+    for start in range(0, count, chunk_size):
+        codes = window_codes(flat[start:start + chunk_size], win_length)
+        first = []
+        for player in (1, 2):
+            full_code = sum(player * 3 ** i for i in range(win_length))
+            wins = codes == full_code
+            # 이 플레이어의 4목 중 행 우선 순서로 가장 앞선 칸 (없으면 no_win)
+            first.append(np.where(wins, first_cells, no_win).min(axis=1))
+        chunk_winners = np.where(first[0] <= first[1], 1, 2).astype(np.int8)
+        chunk_winners[np.minimum(first[0], first[1]) == no_win] = 0
+        winners[start:start + chunk_size] = chunk_winners
+    return winners
+
+
+class NumpyEvaluator:
+    def __init__(self, player):
+        """
+        벡터화 평가기를 초기화합니다.
+
+        Args:
+            player (int): 점수를 계산할 AI 플레이어 번호
+        """
+        self.player = player
+
+    def evaluate_array(self, grid, win_length=WINDOW_LENGTH):
+        """
+        (size, size) 배열로 주어진 보드를 평가합니다.
+
+        Args:
+            grid (numpy.ndarray): 0/1/2 로 이루어진 보드 배열
+            win_length (int): 승리에 필요한 연속 돌 수
+
+        Returns:
+            int: AIPlayer.evaluate_board 와 같은 점수
+        """
+        return int(evaluate_boards(grid[None], self.player, win_length=win_length)[0])
+
+    def evaluate(self, board):
+        """
+        보드를 평가합니다. (AIPlayer.evaluate_board 와 같은 인터페이스)
+
+        Args:
+            board: 게임 보드
+
+        Returns:
+            int: 보드의 전체 점수
+        """
+        return self.evaluate_array(board_to_array(board), board.win_length)
@@ -0,0 +1,268 @@
+"""
+개막 수 정석(opening book)
+초반 국면마다 미리 깊게 탐색해 둔 최선의 수를 파일에 저장해 두고,
+get_best_move 가 탐색을 시작하기 전에 찾아서 바로 둘 수 있게 합니다.
+
+- 국면은 8가지 대칭(회전/뒤집기) 중 Zobrist 해시가 가장 작은 방향으로 정규화하여 저장하므로
+  대칭인 국면들이 항목 하나를 공유합니다. 수도 정규화한 방향의 좌표로 저장합니다.
+- 파일 형식: 헤더(매직 'OBK2', 판 크기, 승리 길이, 최대 돌 수, 항목 수) 뒤에
+  해시 순으로 정렬한 (64비트 해시, 행, 열) 10바이트 항목들이 이어집니다.
+  정석은 만들 때의 판 크기와 승리 길이에서만 맞으므로 읽을 때와 찾을 때 둘 다 확인합니다.
+
+사용법 (정석 파일 만들기):
+    python3 opening_book.py [--plies 6] [--branching 6] [--depth 4] [--size 20] [--win-length 4]
+                            [--output opening_book.bin]
+"""
+import argparse
+import os
+import struct
+import time
+from array import array
+from bisect import bisect_left
+
+from symmetry import canonical_key, get_symmetries
+
+BOOK_MAGIC = b'OBK2'
+HEADER_FORMAT = '<4sBBBI'  # 매직, 판 크기, 승리 길이, 최대 돌 수, 항목 수
+ENTRY_FORMAT = '<QBB'  # 해시, 행, 열
+
+# 게임과 함께 배포하는 기본 정석 파일
+DEFAULT_BOOK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'opening_book.bin')
+
+
+def board_stones(board, limit=None):
+    """
+    보드에 놓인 돌 목록을 반환합니다.
+
+    Args:
+        board: 게임 보드
+        limit (int): 돌이 이보다 많으면 중간에 멈추고 None 을 반환
+
+    Returns:
+        list: (row, col, player) 튜플들의 리스트
+    """
+    if limit is not None and len(board.stones) > limit:
+        return None
+    return [divmod(cell, board.size) + (stone,)
+            for cell, stone in sorted(board.stones.items())]
+
+
+class OpeningBook:
+    def __init__(self, size=20, max_stones=0, entries=None, win_length=4):
+        """
+        정석을 만듭니다.
+
+        Args:
+            size (int): 바둑판 크기
+            win_length (int): 정석을 탐색해 만든 승리 길이
+            max_stones (int): 정석에 들어 있는 국면의 최대 돌 수 (이보다 많으면 찾지 않음)
+            entries (dict): {정규화 해시: 정규화한 방향의 칸 번호}
+        """
+        self.size = size
+        self.win_length = win_length
+        self.max_stones = max_stones
+        self.entries = dict(entries or {})
+        self._keys = None  # 파일에서 읽은 정렬된 해시 (array)
+        self._moves = None  # 파일에서 읽은 칸 번호 (array)
+        self.hits = 0
+        self.lookups = 0
+
+    def __len__(self):
+        return len(self._keys) if self._keys is not None else len(self.entries)
+
+    def add(self, stones, player, move):
+        """
+        국면과 그 국면의 최선의 수를 정석에 추가합니다.
+
+        Args:
+            stones: (row, col, player) 돌 목록
+            player (int): 둘 차례인 플레이어
+            move (tuple): (row, col) 최선의 수
+        """
+        key, transform = canonical_key(self.size, stones, player)
+        forward, _ = get_symmetries(self.size)
+        self.entries[key] = forward[transform][move[0] * self.size + move[1]]
+        self.max_stones = max(self.max_stones, len(stones))
+
+    def contains(self, stones, player):
+        """
+        국면이 이미 정석에 있는지 확인합니다.
+        """
+        key, _ = canonical_key(self.size, stones, player)
+        return self._find(key) is not None
+
+    def _find(self, key):
+        """
+        정규화 해시에 해당하는 칸 번호를 찾습니다. (없으면 None)
+        """
+        if self._keys is None:
+            return self.entries.get(key)
+        position = bisect_left(self._keys, key)
+        if position < len(self._keys) and self._keys[position] == key:
+            return self._moves[position]
+        return None
+
+    def lookup(self, board, player):
+        """
+        보드에서 player 가 둘 정석 수를 찾습니다.
+
+        Args:
+            board: 게임 보드
+            player (int): 둘 차례인 플레이어 (AI 플레이어 번호)
+
+        Returns:
+            tuple: (row, col) 정석 수, 정석에 없으면 None
+        """
+        if board.size != self.size or board.win_length != self.win_length:
+            return None
+        stones = board_stones(board, self.max_stones)
+        if stones is None:
+            return None
+
+        self.lookups += 1
+        key, transform = canonical_key(self.size, stones, player)
+        index = self._find(key)
+        if index is None:
+            return None
+
+        # 정규화한 방향의 수를 현재 보드 방향으로 되돌림
+        _, inverse = get_symmetries(self.size)
+        row, col = divmod(inverse[transform][index], self.size)
+        if not board.is_valid_move(row, col):
+            return None  # 해시 충돌 대비
+        self.hits += 1
+        return (row, col)
+
+    def save(self, path):
+        """
+        정석을 파일에 저장합니다.
+        """
+        items = sorted(self.entries.items())
+        with open(path, 'wb') as f:
+            f.write(struct.pack(HEADER_FORMAT, BOOK_MAGIC, self.size, self.win_length,
+                                self.max_stones, len(items)))
+            for key, index in items:
+                f.write(struct.pack(ENTRY_FORMAT, key, *divmod(index, self.size)))
+
+    @classmethod
+    def load(cls, path, size=None, win_length=None):
+        """
+        파일에서 정석을 읽습니다. (정렬된 배열로 읽어 이진 탐색으로 찾음)
+
+        Args:
+            path (str): 정석 파일 경로
+            size (int): 주어지면 정석의 판 크기가 이와 같은지 확인
+            win_length (int): 주어지면 정석의 승리 길이가 이와 같은지 확인
+
+        Returns:
+            OpeningBook: 읽은 정석
+
+        Raises:
+            ValueError: 정석 파일 형식이 아니거나 판 크기/승리 길이가 다를 때
+        """
+        with open(path, 'rb') as f:
+            data = f.read()
+        magic, book_size, book_win_length, max_stones, count = struct.unpack_from(HEADER_FORMAT, data)
+        if magic != BOOK_MAGIC:
+            raise ValueError(f"정석 파일 형식이 아닙니다: {path}")
+        if (size is not None and size != book_size) or (win_length is not None and win_length != book_win_length):
+            raise ValueError(f"정석 {path} 는 {book_size}x{book_size} 판, {book_win_length}목용입니다 "
+                             f"(요청: {size}x{size} 판, {win_length}목)")
+
+        size = book_size
+        book = cls(size, max_stones, win_length=book_win_length)
+        book._keys = array('Q')
+        book._moves = array('H')
+        offset = struct.calcsize(HEADER_FORMAT)
+        for key, row, col in struct.iter_unpack(ENTRY_FORMAT, data[offset:]):
+            book._keys.append(key)
+            book._moves.append(row * size + col)
+        assert len(book._keys) == count
+        return book
+
+
+def load_default_book(size=20, win_length=4):
+    """
+    기본 정석 파일을 읽습니다.
+
+    Args:
+        size (int): 정석을 쓸 바둑판 크기
+        win_length (int): 정석을 쓸 승리 길이
+
+    Returns:
+        OpeningBook: 읽은 정석, 파일이 없거나 판 크기/승리 길이가 다르면 None
+    """
+    if not os.path.exists(DEFAULT_BOOK_PATH):
+        return None
+    try:
+        return OpeningBook.load(DEFAULT_BOOK_PATH, size, win_length)
+    except ValueError:
+        return None
+
+
+def build_book(size=20, plies=6, branching=6, depth=4, verbose=False, win_length=4):
+    """
+    빈 판에서 시작하여 초반 국면들을 깊게 탐색하여 정석을 만듭니다.
+
+    각 국면에서 AIPlayer 로 최선의 수를 찾아 저장하고, 그 수와 후보 수 생성기가 고른
+    상위 branching 개의 수를 다음 국면으로 펼칩니다. (대칭인 국면은 한 번만 탐색)
+
+    Args:
+        size (int): 바둑판 크기
+        plies (int): 정석에 넣을 국면의 최대 돌 수 + 1
+        branching (int): 국면마다 펼칠 수의 개수
+        depth (int): 탐색 깊이
+        win_length (int): 승리 길이
+
+    Returns:
+        OpeningBook: 만든 정석
+    """
+    from ai_player import AIPlayer
+    from board import Board
+    from candidates import CandidateGenerator
+
+    book = OpeningBook(size, win_length=win_length)
+    frontier = [[]]
+    for ply in range(plies):
+        next_frontier = []
+        start = time.perf_counter()
+        for stones in frontier:
+            player = 1 if len(stones) % 2 == 0 else 2
+            if book.contains(stones, player):
+                continue
+            board = Board(size, win_length)
+            for row, col, stone in stones:
+                board.place_stone(row, col, stone)
+
+            move = AIPlayer(player, depth).get_best_move(board)
+            if move is None:
+                continue
+            book.add(stones, player, move)
+
+            children = [move] + [pos for pos in CandidateGenerator(board).get_moves(branching)
+                                 if pos != move][:branching - 1]
+            next_frontier.extend(stones + [(row, col, player)] for row, col in children)
+        if verbose:
+            print(f"돌 {ply}개 국면까지: 항목 {len(book)}개 ({time.perf_counter() - start:.1f}s)")
+        frontier = next_frontier
+    return book
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--plies", type=int, default=6)
+    parser.add_argument("--branching", type=int, default=6)
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument("--size", type=int, default=20)
+    parser.add_argument("--win-length", type=int, default=4)
+    parser.add_argument("--output", default=DEFAULT_BOOK_PATH)
+    args = parser.parse_args()
+
+    book = build_book(args.size, args.plies, args.branching, args.depth, verbose=True,
+                      win_length=args.win_length)
+    book.save(args.output)
+    print(f"정석 저장: {args.output} (항목 {len(book)}개, {os.path.getsize(args.output)}바이트)")
+
+
+if __name__ == "__main__":
+    main()
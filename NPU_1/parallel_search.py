@@ -0,0 +1,154 @@
+"""
+AIPlayer 루트 탐색의 프로세스 병렬화
+루트 후보 수들을 ProcessPoolExecutor 작업자들에게 나누어 탐색하고,
+지금까지 찾은 최고 점수(알파 값)를 공유 메모리로 나누어 가지치기에 사용합니다.
+중단 요청(AIPlayer.request_stop)도 공유 플래그로 작업자들에게 전달하여, 탐색 중인 작업자가 바로 멈춥니다.
+
+작업자들은 치환표를 쓰지 않습니다. 작업자마다 루트 수들을 공유 알파에 따라 달라지는 탐색 창으로 이어서
+탐색하므로, 한 루트 수의 창에서 저장한 값을 다른 창의 탐색에서 다시 쓰면 직렬 탐색과 다른 수를 고를 수 있습니다.
+"""
+import math
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# 작업자 프로세스 전역 상태
+_worker_ai = None
+_worker_alpha = None
+_worker_search_id = None
+
+
+def _init_worker(shared_alpha, shared_stop, config):
+    """
+    작업자 프로세스를 초기화합니다. (프로세스마다 AIPlayer 하나를 만들어 재사용)
+
+    Args:
+        shared_alpha: 프로세스 간 공유되는 알파 값 (multiprocessing.Value)
+        shared_stop: 프로세스 간 공유되는 중단 요청 플래그 (multiprocessing.Value)
+        config (dict): AIPlayer 생성 인자
+    """
+    global _worker_ai, _worker_alpha
+    # ai_player 가 이 모듈을 불러오므로 순환 import 를 피하기 위해 여기서 불러옵니다
+    from ai_player import AIPlayer
+
+    _worker_alpha = shared_alpha
+    _worker_ai = AIPlayer(**config)
+    _worker_ai.stop_flag = shared_stop
+
+
+def _search_root_move(board_class, size, win_length, stones, move, depth, search_id, pv, wall_deadline):
+    """
+    작업자 프로세스에서 루트 수 하나를 탐색합니다.
+
+    공유 알파보다 1 작은 값을 탐색 창의 하한으로 사용합니다. 점수는 정수이므로
+    공유 알파 이상인 수는 정확한 점수를, 그보다 나쁜 수는 공유 알파보다 작은 점수를 돌려주어
+    직렬 탐색과 같은 수(동점이면 앞선 후보)를 고를 수 있습니다.
+
+    Returns:
+        tuple: (점수, 주 변화, 노드 수), 시간 초과면 점수는 None
+    """
+    global _worker_search_id
+    from ai_player import SearchTimeout
+
+    ai = _worker_ai
+    if search_id != _worker_search_id:
+        # 새 get_best_move 탐색이면 이전 탐색의 수 순서 정보를 비움
+        _worker_search_id = search_id
+        ai.reset_move_ordering()
+
+    board = board_class(size, win_length)
+    for row, col, player in stones:
+        board.place_stone(row, col, player)
+
+    alpha = _worker_alpha.value
+    if alpha != -math.inf:
+        alpha -= 1
+    deadline = None
+    if wall_deadline is not None:
+        deadline = time.perf_counter() + (wall_deadline - time.time())
+
+    try:
+        score, line = ai.search_move(board, move, depth, alpha, pv, deadline)
+    except SearchTimeout:
+        return None, (), ai.nodes
+
+    with _worker_alpha.get_lock():
+        if score > _worker_alpha.value:
+            _worker_alpha.value = score
+    return score, line, ai.nodes
+
+
+class ParallelRootSearch:
+    def __init__(self, workers, config):
+        """
+        병렬 루트 탐색기를 만듭니다. 작업자 프로세스는 처음 사용할 때 시작합니다.
+
+        Args:
+            workers (int): 작업자 프로세스 수
+            config (dict): 작업자마다 만들 AIPlayer 의 생성 인자 (치환표는 항상 끔)
+        """
+        self.workers = workers
+        self.config = dict(config, tt_memory_mb=None)
+        self.executor = None
+        self.shared_alpha = multiprocessing.Value('d', -math.inf)
+        self.shared_stop = multiprocessing.Value('b', 0)
+        self.search_id = 0
+
+    def start(self):
+        """
+        작업자 프로세스 풀을 시작합니다. (이미 시작했으면 아무것도 하지 않음)
+        """
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                initializer=_init_worker,
+                                                initargs=(self.shared_alpha, self.shared_stop, self.config))
+
+    def new_search(self):
+        """
+        새 get_best_move 탐색의 시작을 알립니다. (작업자들이 수 순서 정보를 비우도록 하고 중단 요청을 지움)
+        """
+        self.search_id += 1
+        self.shared_stop.value = 0
+
+    def request_stop(self):
+        """
+        작업자들에게 진행 중인 탐색을 멈추도록 요청합니다. (다른 스레드에서 호출 가능)
+        마감 시각이 있는 탐색만 멈추며, 멈춘 작업자의 결과는 시간 초과와 같이 점수가 None 입니다.
+        """
+        self.shared_stop.value = 1
+
+    def search(self, board, moves, depth, alpha, pv=(), deadline=None):
+        """
+        루트 수들을 작업자들에게 나누어 탐색합니다.
+
+        Args:
+            board: 현재 보드
+            moves: 탐색할 (row, col) 루트 수 목록
+            depth: 탐색 깊이 (루트 수 포함)
+            alpha: 이미 찾은 최고 점수 (공유 알파의 시작 값)
+            pv: 수 순서 정렬에 사용할 이전 반복의 주 변화
+            deadline: 마감 시각 (time.perf_counter 기준), None이면 제한 없음
+
+        Returns:
+            list: moves 순서대로 (점수, 주 변화, 노드 수) 튜플들의 리스트
+        """
+        self.start()
+        self.shared_alpha.value = alpha
+
+        stones = [divmod(cell, board.size) + (player,) for cell, player in board.stones.items()]
+        wall_deadline = None
+        if deadline is not None:
+            wall_deadline = time.time() + (deadline - time.perf_counter())
+
+        futures = [self.executor.submit(_search_root_move, type(board), board.size,
+                                        board.win_length, stones, move, depth, self.search_id, pv, wall_deadline)
+                   for move in moves]
+        return [future.result() for future in futures]
+
+    def close(self):
+        """
+        작업자 프로세스 풀을 종료합니다.
+        """
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
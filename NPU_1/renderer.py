@@ -0,0 +1,148 @@
+"""
+콘솔 바둑판 렌더러
+칸마다 print 를 부르지 않고 한 화면(프레임)을 문자열 하나로 만들어 write 한 번으로 출력합니다.
+
+- 행마다 그린 문자열을 캐시하고, 마지막으로 그린 뒤 돌이 바뀐 행만 다시 만듭니다.
+- ANSI 모드: 첫 프레임은 화면을 지우고 전체를 그리고, 다음 프레임부터는 이전 프레임과 달라진
+  줄만 커서를 옮겨 다시 씁니다. (돌 기호 ●/○ 의 화면 폭이 터미널마다 1칸 또는 2칸이므로
+  칸 단위가 아니라 줄 단위로 고쳐 씀, 프레임이 터미널 높이보다 크면 매번 전체를 다시 그림)
+"""
+import shutil
+import sys
+
+STONE_MARKS = ("  ", " ●", " ○")  # 빈 교차점, 흑돌, 백돌
+
+CLEAR_SCREEN = "\x1b[H\x1b[2J"
+CLEAR_LINE = "\x1b[K"
+CLEAR_BELOW = "\x1b[J"
+
+
+def move_cursor(line):
+    """
+    커서를 line 번째 줄(1부터)의 처음으로 옮기는 ANSI 문자열을 반환합니다.
+    """
+    return f"\x1b[{line};1H"
+
+
+def render_row(board, row):
+    """
+    바둑판의 row 행을 한 줄 문자열로 만듭니다. (예: " 3: ●─  ─ ○─ ...")
+    """
+    return f"{row:2}:" + "─".join([STONE_MARKS[stone] for stone in board.row_values(row)])
+
+
+def column_header(size):
+    return "   " + "".join(f"{i:2} " for i in range(size))
+
+
+def vertical_line(size):
+    return "   " + " ".join([" │"] * size)
+
+
+def render_board(board):
+    """
+    Board.display_board 가 출력하는 것과 같은 바둑판 문자열을 만듭니다. (마지막 빈 줄 포함)
+    """
+    lines = [column_header(board.size)]
+    between = vertical_line(board.size)
+    for row in range(board.size):
+        if row:
+            lines.append(between)
+        lines.append(render_row(board, row))
+    return "\n".join(lines) + "\n\n"
+
+
+class BoardRenderer:
+    def __init__(self, stream=None, ansi=False, height=None):
+        """
+        렌더러를 만듭니다.
+
+        Args:
+            stream: 출력할 텍스트 스트림 (None 이면 그릴 때의 sys.stdout)
+            ansi (bool): True 이면 이전 프레임과 달라진 줄만 ANSI 커서 이동으로 다시 씀
+            height (int): 터미널 높이 (줄 수), None 이면 그릴 때마다 터미널에서 확인
+        """
+        self.stream = stream
+        self.ansi = ansi
+        self.height = height
+        self._size = None
+        self._rows = []  # 행마다 그린 문자열
+        self._stones = {}  # 행 문자열을 만들 때의 돌 {칸 번호: 플레이어}
+        self._lines = None  # 마지막으로 화면에 그린 프레임의 줄들 (ANSI 모드)
+        self.frames = 0
+        self.bytes_written = 0
+
+    def board_lines(self, board):
+        """
+        바둑판을 그린 줄들을 반환합니다. (마지막 프레임 뒤 돌이 바뀐 행만 다시 만듦)
+        """
+        size = board.size
+        if size != self._size:
+            self._size = size
+            self._header = column_header(size)
+            self._between = vertical_line(size)
+            self._rows = [render_row(board, row) for row in range(size)]
+            self._stones = dict(board.stones)
+        else:
+            stones = board.stones
+            previous = self._stones
+            changed = {cell // size for cell, stone in stones.items() if previous.get(cell) != stone}
+            # 없어진 돌 (되돌리기, 새 게임)
+            changed.update(cell // size for cell in previous if cell not in stones)
+            for row in changed:
+                self._rows[row] = render_row(board, row)
+            if changed:
+                self._stones = dict(stones)
+
+        lines = [self._header]
+        between = self._between
+        for row, line in enumerate(self._rows):
+            if row:
+                lines.append(between)
+            lines.append(line)
+        lines.append("")  # display_board 와 같이 바둑판 아래 빈 줄
+        return lines
+
+    def render(self, board, header=(), footer=()):
+        """
+        한 프레임 전체를 문자열 하나로 만듭니다.
+
+        Args:
+            board: 게임 보드
+            header: 바둑판 위에 출력할 줄들
+            footer: 바둑판 아래에 출력할 줄들
+        """
+        return "\n".join([*header, *self.board_lines(board), *footer]) + "\n"
+
+    def draw(self, board, header=(), footer=()):
+        """
+        프레임을 한 번의 write 로 출력합니다.
+        (ANSI 모드에서는 이전 프레임과 달라진 줄만 다시 쓰고 커서를 프레임 아래로 옮김)
+        """
+        lines = [*header, *self.board_lines(board), *footer]
+        if not self.ansi:
+            text = "\n".join(lines) + "\n"
+        elif (self._lines is None or len(lines) != len(self._lines)
+                or len(lines) >= (self.height or shutil.get_terminal_size().lines)):
+            text = CLEAR_SCREEN + "\n".join(lines) + "\n"
+        else:
+            parts = [move_cursor(number) + line + CLEAR_LINE
+                     for number, (old, line) in enumerate(zip(self._lines, lines), 1)
+                     if old != line]
+            # 프레임 아래에 이전 입력/메시지로 출력된 줄들을 지움
+            parts.append(move_cursor(len(lines) + 1) + CLEAR_BELOW)
+            text = "".join(parts)
+        if self.ansi:
+            self._lines = lines
+
+        stream = self.stream or sys.stdout
+        stream.write(text)
+        stream.flush()
+        self.frames += 1
+        self.bytes_written += len(text)
+
+    def reset(self):
+        """
+        다음 프레임을 처음부터 전체로 다시 그리게 합니다.
+        """
+        self._lines = None
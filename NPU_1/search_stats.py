@@ -0,0 +1,196 @@
+"""
+AIPlayer 탐색 통계 수집기와 프로파일링 도구
+AIPlayer(stats=True) 로 켜면 get_best_move 마다 다음 항목을 모아 사전/JSON 으로 내보냅니다.
+
+- 수순 깊이(ply)별 방문 노드 수, 리프 평가 횟수, 컷오프 수
+- 평가(evaluate), 승리 확인(check_winner), 후보 수 생성(movegen), 위협 탐색(threats)에 쓴 시간
+- 평균 자식 수와 유효 분기 계수(노드 수 ** (1 / 깊이))
+
+끈 상태에서는 AIPlayer 의 메서드를 전혀 바꾸지 않으므로 탐색 비용이 늘지 않습니다.
+켜면 attach 가 AIPlayer 와 탐색용 보드의 메서드를 인스턴스 속성으로 감싸서 측정합니다.
+(병렬 루트 탐색의 작업자 프로세스 안에서 일어나는 탐색은 집계하지 않음)
+"""
+import io
+import json
+import time
+
+# 시간을 나누어 집계하는 항목
+TIME_CATEGORIES = ('evaluate', 'check_winner', 'movegen', 'threats')
+
+
+class SearchStats:
+    def __init__(self, json_path=None):
+        """
+        통계 수집기를 만듭니다.
+
+        Args:
+            json_path (str): 주어지면 수마다 통계를 이 파일에 JSON 한 줄로 덧붙임
+        """
+        self.json_path = json_path
+        self.history = []  # 지금까지의 수별 통계 사전
+        self.last = None  # 마지막 get_best_move 의 통계 사전
+        self.nodes_by_ply = {}
+        self.leaf_evaluations = 0
+        self.times = dict.fromkeys(TIME_CATEGORIES, 0.0)
+        self.calls = dict.fromkeys(TIME_CATEGORIES, 0)
+
+    def reset(self):
+        """
+        한 수의 통계를 비웁니다. (감싼 함수들이 같은 사전을 갱신하므로 사전은 그대로 두고 비움)
+        """
+        self.nodes_by_ply.clear()
+        self.leaf_evaluations = 0
+        for category in TIME_CATEGORIES:
+            self.times[category] = 0.0
+            self.calls[category] = 0
+
+    def timed(self, category, function):
+        """
+        function 의 호출 횟수와 소요 시간을 category 항목에 더하는 함수로 감쌉니다.
+        """
+        times, calls = self.times, self.calls
+        perf_counter = time.perf_counter
+
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                times[category] += perf_counter() - start
+                calls[category] += 1
+        return wrapper
+
+    def attach(self, ai):
+        """
+        AIPlayer 의 메서드들을 측정용 함수로 감쌉니다.
+
+        Args:
+            ai: 통계를 모을 AIPlayer
+        """
+        stats = self
+        minimax = ai.minimax
+        start_search = ai._start_search
+        end_search = ai._end_search
+        get_best_move = ai.get_best_move
+        counts = self.nodes_by_ply
+
+        def counted_minimax(board, depth, alpha, beta, maximizing_player, last_move=None):
+            counts[ai._ply] = counts.get(ai._ply, 0) + 1
+            if depth == 0:
+                stats.leaf_evaluations += 1
+            return minimax(board, depth, alpha, beta, maximizing_player, last_move)
+
+        def instrumented_start_search(board):
+            start_search(board)
+            # 탐색하는 보드와 탐색마다 새로 만드는 증분 평가기/후보 수 생성기를 감쌈
+            board.check_winner = stats.timed('check_winner', board.check_winner)
+            board.find_winner = stats.timed('check_winner', board.find_winner)
+            if ai._evaluator is not None:
+                ai._evaluator.make = stats.timed('evaluate', ai._evaluator.make)
+                ai._evaluator.unmake = stats.timed('evaluate', ai._evaluator.unmake)
+            if ai._candidates is not None:
+                for name in ('make', 'unmake', 'get_moves'):
+                    setattr(ai._candidates, name,
+                            stats.timed('movegen', getattr(ai._candidates, name)))
+
+        def instrumented_end_search():
+            board = ai._board
+            end_search()
+            # 탐색은 게임 보드에서 직접 하므로 감싼 승리 확인 함수를 떼어 원래 메서드로 되돌림
+            if board is not None:
+                board.__dict__.pop('check_winner', None)
+                board.__dict__.pop('find_winner', None)
+
+        def instrumented_get_best_move(board, *args, **kwargs):
+            stats.reset()
+            start = time.perf_counter()
+            move = get_best_move(board, *args, **kwargs)
+            stats.finish(ai, time.perf_counter() - start)
+            return move
+
+        ai.minimax = counted_minimax
+        ai._start_search = instrumented_start_search
+        ai._end_search = instrumented_end_search
+        ai.get_best_move = instrumented_get_best_move
+        ai._evaluate_full = self.timed('evaluate', ai._evaluate_full)
+        ai.center_ordered_moves = self.timed('movegen', ai.center_ordered_moves)
+        ai.order_moves = self.timed('movegen', ai.order_moves)
+        ai.find_immediate_win_or_block = self.timed('threats', ai.find_immediate_win_or_block)
+        ai.find_threat_move = self.timed('threats', ai.find_threat_move)
+
+    def finish(self, ai, elapsed):
+        """
+        한 수의 탐색이 끝났을 때 통계 사전을 만들고 기록합니다.
+        """
+        info = ai.last_search_info
+        nodes = sum(self.nodes_by_ply.values())
+        depth = info.get('depth', 0)
+        self.last = {
+            'depth': depth,
+            'time': elapsed,
+            'nodes': nodes,
+            'nodes_by_ply': {str(ply): count for ply, count in sorted(self.nodes_by_ply.items())},
+            'leaf_evaluations': self.leaf_evaluations,
+            'expanded_nodes': ai.expanded_nodes,
+            'cutoffs': ai.cutoffs,
+            'cutoff_rate': info.get('cutoff_rate', 0.0),
+            'first_move_cutoff_rate': info.get('first_move_cutoff_rate', 0.0),
+            # 루트 자식을 제외한 노드들은 모두 자식을 탐색한 노드에서 나옴
+            'mean_children': ((nodes - self.nodes_by_ply.get(1, 0)) / ai.expanded_nodes
+                              if ai.expanded_nodes else 0.0),
+            'effective_branching_factor': nodes ** (1 / depth) if depth and nodes else 0.0,
+            'times': dict(self.times),
+            'calls': dict(self.calls),
+        }
+        self.history.append(self.last)
+        if self.json_path is not None:
+            with open(self.json_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(self.last) + '\n')
+
+    def to_dict(self):
+        """
+        마지막 수의 통계 사전을 반환합니다.
+        """
+        return self.last
+
+    def to_json(self, **kwargs):
+        """
+        마지막 수의 통계를 JSON 문자열로 반환합니다.
+        """
+        return json.dumps(self.last, **kwargs)
+
+
+def profile_search(ai, board, profiler='cprofile', limit=25, **kwargs):
+    """
+    get_best_move 한 번을 프로파일러로 실행합니다.
+
+    Args:
+        ai: AIPlayer
+        board: 게임 보드
+        profiler (str): 'cprofile' (표준 라이브러리) 또는 'pyinstrument' (설치 필요)
+        limit (int): cProfile 결과에서 출력할 함수 수
+        **kwargs: get_best_move 에 넘길 인자 (time_limit, max_depth)
+
+    Returns:
+        tuple: ((row, col) 수, 프로파일 결과 문자열)
+    """
+    if profiler == 'pyinstrument':
+        # pyinstrument 는 이 프로파일러를 고른 경우에만 필요합니다
+        from pyinstrument import Profiler
+
+        profile = Profiler()
+        profile.start()
+        try:
+            move = ai.get_best_move(board, **kwargs)
+        finally:
+            profile.stop()
+        return move, profile.output_text()
+
+    import cProfile
+    import pstats
+
+    profile = cProfile.Profile()
+    move = profile.runcall(ai.get_best_move, board, **kwargs)
+    output = io.StringIO()
+    pstats.Stats(profile, stream=output).sort_stats('cumulative').print_stats(limit)
+    return move, output.getvalue()
@@ -0,0 +1,499 @@
+"""
+여러 대국을 동시에 진행하는 4목 게임 서버 (asyncio)
+한 줄에 JSON 하나씩 주고받는 프로토콜로 수백 개의 사람 vs 사람 / 사람 vs AI 대국을 호스팅합니다.
+
+- 대국 상태: 칸마다 1바이트인 bytearray 와 수 목록(수마다 2바이트)만 보관 (Board 객체를 대국마다 두지 않음)
+- AI 수 계산: 모든 대국이 프로세스 풀 하나를 공유하고, 작업자 프로세스마다 난이도별 AIPlayer 를 재사용
+- 공정한 스케줄링: 연결(클라이언트)끼리 돌아가며, 한 연결 안에서는 대국끼리 돌아가며 작업을 꺼냄
+  (한 대국은 AI 수 계산을 하나만 기다리므로 많은 대국을 연 클라이언트가 풀을 독차지하지 못함)
+- 대국별 시간 예산: AI 가 한 대국에서 쓸 전체 사고 시간을 정해 두고, 수당 시간을 남은 예산에 맞춰 줄임
+- 강제 수순 캐시: --solved-cache 파일을 주면 모든 작업자가 위협 공간 탐색 결과를 함께 저장하고 찾아 씀
+
+요청 (각 줄은 JSON 객체, "id" 를 넣으면 응답에 그대로 돌려줌):
+    {"cmd": "new", "ai": true, "difficulty": 3, "move_time": 0.5, "budget": 30,
+     "size": 20, "win_length": 4}
+    {"cmd": "move", "session": 1, "row": 10, "col": 10}
+    {"cmd": "state", "session": 1}
+    {"cmd": "close", "session": 1}
+    {"cmd": "stats"}
+응답: {"ok": true, ...} 또는 {"ok": false, "error": "..."}
+
+사용법:
+    python3 server.py [--host 127.0.0.1] [--port 8765] [--workers 4]
+"""
+import argparse
+import asyncio
+import collections
+import itertools
+import json
+import os
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from board import Board
+
+PLAYER1 = 1  # 흑돌 (사람)
+PLAYER2 = 2  # 백돌 (사람 vs AI 대국에서는 AI)
+DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+# 예산이 얼마 남지 않았을 때 남은 수들에 나누어 쓸 것으로 가정하는 수의 개수
+BUDGET_MOVES = 10
+# 수당 최소 사고 시간 (초), 예산을 다 써도 깊이 1 탐색은 항상 끝까지 함
+MIN_MOVE_TIME = 0.01
+# 새 대국 설정의 범위 (칸 번호를 2바이트 array('H')에 저장하므로 판 크기는 255 이하)
+MIN_SIZE = 3
+MAX_SIZE = 255
+MIN_WIN_LENGTH = 2
+MAX_DIFFICULTY = 8
+
+# 작업자 프로세스 전역 상태 (난이도별 AIPlayer, 강제 수순 캐시 파일 경로)
+_worker_ais = {}
+_worker_solved_cache = None
+
+
+def _init_worker(solved_cache):
+    """
+    작업자 프로세스를 초기화합니다. (프로세스마다 캐시 파일에 따로 연결)
+    """
+    global _worker_solved_cache
+    _worker_solved_cache = solved_cache
+
+
+def _ai_move(size, win_length, stones, difficulty, time_limit):
+    """
+    작업자 프로세스에서 AI(백돌)의 수를 계산합니다.
+
+    Args:
+        size (int): 바둑판 크기
+        win_length (int): 승리에 필요한 연속 돌 수
+        stones (array): 지금까지 둔 수의 칸 번호 (흑, 백 차례대로)
+        difficulty (int): AI 난이도 (최대 탐색 깊이)
+        time_limit (float): 수당 시간 제한 (초)
+
+    Returns:
+        tuple: ((row, col), 사고 시간, 탐색 깊이, 노드 수)
+    """
+    # ai_player 는 작업자 프로세스에서만 필요하므로 여기서 불러옵니다
+    from ai_player import AIPlayer
+    from opening_book import load_default_book
+
+    ai = _worker_ais.get(difficulty)
+    if ai is None:
+        ai = _worker_ais[difficulty] = AIPlayer(PLAYER2, difficulty,
+                                                opening_book=load_default_book(),
+                                                solved_cache=_worker_solved_cache)
+    board = Board(size, win_length)
+    for i, cell in enumerate(stones):
+        board.place_stone(*divmod(cell, size), PLAYER1 if i % 2 == 0 else PLAYER2)
+
+    start = time.perf_counter()
+    move = ai.get_best_move(board, time_limit=time_limit, max_depth=difficulty)
+    info = ai.last_search_info
+    return move, time.perf_counter() - start, info['depth'], info['nodes']
+
+
+class Session:
+    def __init__(self, session_id, client_id, size=20, ai=True, difficulty=3,
+                 move_time=0.5, budget=30.0, win_length=4):
+        """
+        대국 하나의 상태를 만듭니다.
+
+        Args:
+            session_id (int): 대국 번호
+            client_id (int): 대국을 만든 연결 번호 (스케줄링 단위)
+            size (int): 바둑판 크기
+            ai (bool): True 이면 사람(흑) vs AI(백), False 이면 사람 vs 사람
+            difficulty (int): AI 난이도
+            move_time (float): AI 수당 최대 사고 시간 (초)
+            budget (float): AI 가 이 대국에서 쓸 수 있는 전체 사고 시간 (초)
+            win_length (int): 승리에 필요한 연속 돌 수
+        """
+        self.session_id = session_id
+        self.client_id = client_id
+        self.size = size
+        self.win_length = win_length
+        self.ai = ai
+        self.difficulty = difficulty
+        self.move_time = move_time
+        self.budget = budget
+        self.cells = bytearray(size * size)  # 칸마다 0(빈칸)/1/2
+        self.moves = array('H')  # 둔 순서대로 칸 번호 (칸마다 2바이트)
+        self.current_player = PLAYER1
+        self.winner = None
+        self.game_over = False
+        self.busy = False  # AI 수를 계산하는 중이면 True
+
+    def is_valid_move(self, row, col):
+        """
+        (row, col)에 돌을 놓을 수 있는지 확인합니다.
+        """
+        return (0 <= row < self.size and 0 <= col < self.size
+                and not self.cells[row * self.size + col])
+
+    def check_winner(self, row, col, player):
+        """
+        (row, col)에 놓은 돌로 win_length 목이 완성되었는지 확인합니다. (Board.check_winner 와 같은 규칙)
+        """
+        cells, size = self.cells, self.size
+        for dr, dc in DIRECTIONS:
+            count = 1
+            for sign in (1, -1):
+                r, c = row + sign * dr, col + sign * dc
+                while 0 <= r < size and 0 <= c < size and cells[r * size + c] == player:
+                    count += 1
+                    r, c = r + sign * dr, c + sign * dc
+            if count >= self.win_length:
+                return True
+        return False
+
+    def place(self, row, col):
+        """
+        현재 플레이어의 돌을 놓고 승패를 확인한 뒤 차례를 넘깁니다.
+        """
+        player = self.current_player
+        cell = row * self.size + col
+        self.cells[cell] = player
+        self.moves.append(cell)
+        if self.check_winner(row, col, player):
+            self.winner = player
+            self.game_over = True
+        elif len(self.moves) == len(self.cells):
+            self.game_over = True
+        self.current_player = PLAYER2 if player == PLAYER1 else PLAYER1
+
+    def undo(self):
+        """
+        마지막 수를 되돌립니다. (AI 수 계산이 실패했을 때 사람의 수를 되돌려 다시 둘 수 있게 함)
+        """
+        cell = self.moves.pop()
+        self.current_player = self.cells[cell]
+        self.cells[cell] = 0
+        self.winner = None
+        self.game_over = False
+
+    def next_move_time(self):
+        """
+        남은 예산에 맞춘 이번 AI 수의 사고 시간을 반환합니다.
+        """
+        return max(MIN_MOVE_TIME, min(self.move_time, self.budget / BUDGET_MOVES))
+
+    def to_dict(self):
+        """
+        대국 상태를 JSON 으로 보낼 사전으로 반환합니다.
+        """
+        return {
+            'session': self.session_id,
+            'board': ''.join('.XO'[cell] for cell in self.cells),
+            'moves': [divmod(cell, self.size) for cell in self.moves],
+            'current_player': self.current_player,
+            'winner': self.winner,
+            'game_over': self.game_over,
+            'budget': round(self.budget, 4),
+        }
+
+
+def parse_new_request(request):
+    """
+    "new" 요청의 대국 설정을 읽고 범위를 확인합니다.
+
+    Returns:
+        dict: Session 의 키워드 인자
+
+    Raises:
+        ValueError: 설정 값이 범위를 벗어날 때
+    """
+    options = {
+        'size': int(request.get('size', 20)),
+        'ai': bool(request.get('ai', True)),
+        'difficulty': int(request.get('difficulty', 3)),
+        'move_time': float(request.get('move_time', 0.5)),
+        'budget': float(request.get('budget', 30.0)),
+        'win_length': int(request.get('win_length', 4)),
+    }
+    size = options['size']
+    if not MIN_SIZE <= size <= MAX_SIZE:
+        raise ValueError(f'size 는 {MIN_SIZE} 이상 {MAX_SIZE} 이하여야 합니다')
+    if not MIN_WIN_LENGTH <= options['win_length'] <= size:
+        raise ValueError(f'win_length 는 {MIN_WIN_LENGTH} 이상 size({size}) 이하여야 합니다')
+    if not 1 <= options['difficulty'] <= MAX_DIFFICULTY:
+        raise ValueError(f'difficulty 는 1 이상 {MAX_DIFFICULTY} 이하여야 합니다')
+    for name in ('move_time', 'budget'):
+        if not 0 <= options[name] < float('inf'):
+            raise ValueError(f'{name} 은 0 이상의 유한한 값이어야 합니다')
+    return options
+
+
+class FairScheduler:
+    def __init__(self, executor, workers):
+        """
+        AI 수 계산 작업을 연결끼리, 대국끼리 번갈아 가며 프로세스 풀에 보냅니다.
+
+        Args:
+            executor: 공유 ProcessPoolExecutor
+            workers (int): 동시에 실행할 작업 수 (작업자 프로세스 수)
+        """
+        self.executor = executor
+        self.queues = collections.OrderedDict()  # 연결 번호 -> 대기 중인 (대국, future) deque
+        self.slots = asyncio.Semaphore(workers)
+        self.wakeup = asyncio.Event()
+        self.pending = 0
+        self.completed = 0
+
+    def submit(self, session):
+        """
+        대국의 AI 수 계산을 대기열에 넣고, 결과를 받을 future 를 반환합니다.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self.queues.setdefault(session.client_id, collections.deque()).append((session, future))
+        self.pending += 1
+        self.wakeup.set()
+        return future
+
+    def _next_job(self):
+        """
+        가장 오래 차례를 기다린 연결의 첫 작업을 꺼내고 그 연결을 맨 뒤로 보냅니다.
+        """
+        client_id, queue = next(iter(self.queues.items()))
+        job = queue.popleft()
+        del self.queues[client_id]
+        if queue:
+            self.queues[client_id] = queue
+        self.pending -= 1
+        return job
+
+    async def run(self):
+        """
+        대기열에서 작업을 꺼내 빈 작업자에게 보내는 루프입니다.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            while not self.queues:
+                self.wakeup.clear()
+                await self.wakeup.wait()
+            await self.slots.acquire()
+            session, future = self._next_job()
+            if future.cancelled():
+                self.slots.release()
+                continue
+            try:
+                job = loop.run_in_executor(self.executor, _ai_move, session.size,
+                                           session.win_length, array('H', session.moves), session.difficulty,
+                                           session.next_move_time())
+            except Exception as e:  # 작업자 풀이 깨진 경우 등: 기다리는 요청에 오류를 전달
+                self.slots.release()
+                future.set_exception(e)
+                continue
+            job.add_done_callback(lambda done, future=future: self._finish(done, future))
+
+    def _finish(self, done, future):
+        self.slots.release()
+        self.completed += 1
+        if future.cancelled():
+            return
+        if done.exception() is not None:
+            future.set_exception(done.exception())
+        else:
+            future.set_result(done.result())
+
+
+class GameServer:
+    def __init__(self, workers=None, max_sessions=1000, solved_cache=None):
+        """
+        대국 서버를 만듭니다.
+
+        Args:
+            workers (int): AI 작업자 프로세스 수, None이면 CPU 코어 수
+            max_sessions (int): 동시에 열 수 있는 최대 대국 수
+            solved_cache (str): 모든 대국과 작업자가 함께 쓰는 강제 수순 캐시(SQLite) 파일 경로
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.max_sessions = max_sessions
+        self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                            initargs=(solved_cache,))
+        self.scheduler = None
+        self.sessions = {}
+        self._session_ids = itertools.count(1)
+        self._client_ids = itertools.count(1)
+        self._clients = {}  # 연결을 처리하는 태스크 -> writer
+        self.ai_moves = 0
+        self.started = time.perf_counter()
+
+    async def start(self, host='127.0.0.1', port=8765):
+        """
+        서버를 시작합니다. (port=0 이면 빈 포트를 골라 server.sockets 에서 확인)
+        """
+        self.scheduler = FairScheduler(self.executor, self.workers)
+        self._scheduler_task = asyncio.get_running_loop().create_task(self.scheduler.run())
+        self.server = await asyncio.start_server(self.handle_client, host, port)
+        return self.server
+
+    async def close(self):
+        """
+        서버를 닫고, 열린 연결들이 정리될 때까지 기다린 뒤 작업자 프로세스를 종료합니다.
+        """
+        self.server.close()
+        for writer in self._clients.values():
+            writer.close()
+        await asyncio.gather(*self._clients, return_exceptions=True)
+        self._scheduler_task.cancel()
+        self.executor.shutdown(cancel_futures=True)
+
+    async def handle_client(self, reader, writer):
+        """
+        연결 하나의 요청 줄들을 읽어 처리합니다. (요청마다 태스크를 만들어 동시에 처리)
+        """
+        client_id = next(self._client_ids)
+        owned = set()
+        tasks = set()
+        self._clients[asyncio.current_task()] = writer
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                task = asyncio.get_running_loop().create_task(
+                    self.respond(client_id, owned, line, writer))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        except ConnectionError:
+            pass
+        finally:
+            for task in tasks:
+                task.cancel()
+            for session_id in owned:
+                self.sessions.pop(session_id, None)
+            del self._clients[asyncio.current_task()]
+            writer.close()
+
+    async def respond(self, client_id, owned, line, writer):
+        """
+        요청 한 줄을 처리하고 응답 한 줄을 보냅니다.
+        (처리 중 어떤 예외가 나도 오류 응답을 보내므로 클라이언트가 응답 없이 기다리지 않음)
+        """
+        request_id = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError('요청은 JSON 객체여야 합니다')
+            request_id = request.get('id')
+            response = await self.dispatch(client_id, owned, request)
+        except KeyError as e:
+            response = {'ok': False, 'error': f'잘못된 요청: {e.args[0]}'}
+        except (ValueError, TypeError, OverflowError) as e:
+            response = {'ok': False, 'error': f'잘못된 요청: {e}'}
+        except Exception as e:
+            response = {'ok': False, 'error': f'서버 오류: {type(e).__name__}: {e}'}
+        if request_id is not None:
+            response['id'] = request_id
+        writer.write(json.dumps(response).encode() + b'\n')
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+
+    def _session(self, owned, request):
+        session = self.sessions.get(request['session'])
+        if session is None or session.session_id not in owned:
+            raise KeyError('없는 대국입니다')
+        return session
+
+    async def dispatch(self, client_id, owned, request):
+        """
+        요청 종류에 따라 처리하고 응답 사전을 반환합니다.
+        """
+        command = request['cmd']
+        if command == 'new':
+            if len(self.sessions) >= self.max_sessions:
+                return {'ok': False, 'error': '대국 수가 최대입니다'}
+            session = Session(next(self._session_ids), client_id, **parse_new_request(request))
+            self.sessions[session.session_id] = session
+            owned.add(session.session_id)
+            return {'ok': True, 'session': session.session_id}
+        if command == 'move':
+            return await self.play_move(self._session(owned, request),
+                                        int(request['row']), int(request['col']))
+        if command == 'state':
+            return {'ok': True, **self._session(owned, request).to_dict()}
+        if command == 'close':
+            session = self._session(owned, request)
+            owned.discard(session.session_id)
+            del self.sessions[session.session_id]
+            return {'ok': True}
+        if command == 'stats':
+            return {'ok': True, **self.stats()}
+        return {'ok': False, 'error': f'알 수 없는 명령: {command}'}
+
+    async def play_move(self, session, row, col):
+        """
+        사람의 수를 두고, AI 대국이면 AI 의 응수까지 계산하여 결과를 반환합니다.
+        """
+        if session.game_over:
+            return {'ok': False, 'error': '게임이 끝났습니다'}
+        if session.busy:
+            return {'ok': False, 'error': 'AI 가 생각 중입니다'}
+        if not session.is_valid_move(row, col):
+            return {'ok': False, 'error': '둘 수 없는 위치입니다'}
+        session.place(row, col)
+        response = {'ok': True, 'ai_move': None}
+        if session.ai and not session.game_over:
+            session.busy = True
+            try:
+                move, elapsed, depth, nodes = await self.scheduler.submit(session)
+            except Exception:
+                session.undo()  # AI 수 계산이 실패하면 사람의 수도 없던 것으로 하고 오류 응답
+                raise
+            finally:
+                session.busy = False
+            session.budget = max(0.0, session.budget - elapsed)
+            session.place(*move)
+            self.ai_moves += 1
+            response.update(ai_move=move, depth=depth, nodes=nodes, think_time=round(elapsed, 4))
+        response.update(winner=session.winner, game_over=session.game_over,
+                        budget=round(session.budget, 4))
+        return response
+
+    def stats(self):
+        """
+        서버 상태(대국 수, 대기 중인 AI 작업 수, 처리한 AI 수)를 반환합니다.
+        """
+        elapsed = time.perf_counter() - self.started
+        return {
+            'sessions': len(self.sessions),
+            'workers': self.workers,
+            'queued': self.scheduler.pending,
+            'ai_moves': self.ai_moves,
+            'ai_moves_per_sec': self.ai_moves / elapsed if elapsed else 0.0,
+        }
+
+
+async def serve(host, port, workers, max_sessions, solved_cache=None):
+    """
+    서버를 시작하고 종료될 때까지 실행합니다.
+    """
+    server = GameServer(workers, max_sessions, solved_cache)
+    await server.start(host, port)
+    print(f"4목 게임 서버 실행 중: {host}:{port} (작업자 {server.workers}개)")
+    try:
+        await server.server.serve_forever()
+    finally:
+        await server.close()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max-sessions", type=int, default=1000)
+    parser.add_argument("--solved-cache", default=None, help="강제 수순 캐시(SQLite) 파일 경로")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, args.max_sessions,
+                          args.solved_cache))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
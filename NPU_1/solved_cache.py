@@ -0,0 +1,196 @@
+"""
+여러 대국이 함께 쓰는 강제 수순(위협 공간 탐색) 결과 캐시
+AIPlayer 가 탐색 전에 실행하는 위협 공간 탐색의 결과(강제 승리 수, 상대의 강제 승리를 막는 수,
+강제 수순 없음)를 정규화한 국면 해시로 SQLite 파일에 저장하여, 서버의 여러 대국이나
+다른 작업자 프로세스에서 같은 국면(대칭 포함)이 나오면 다시 풀지 않고 바로 사용합니다.
+
+- 키: 8가지 대칭 중 Zobrist 해시가 가장 작은 방향의 해시(둘 차례 포함), 판 크기, 승리 길이
+  수는 정규화한 방향의 칸 번호로 저장하고 찾을 때 현재 방향으로 되돌림 (개막 정석과 같은 방식)
+- 결과: WIN(강제 승리, 예산과 관계없이 유효), DEFENDED(상대의 강제 승리를 막는 수),
+  LOST(상대의 강제 승리를 막는 수를 찾지 못함), NONE(양쪽 모두 강제 수순 없음)
+  WIN 이 아닌 결과는 노드 예산 안에서 찾지 못했다는 뜻이므로 저장한 예산 이하로 찾을 때만 사용
+- 크기 제한: 항목마다 마지막 사용 시각을 기록하고, 항목 수가 max_entries 를 넘으면
+  가장 오래 쓰지 않은 항목부터 지움 (LRU, EVICT_INTERVAL 번 저장마다 확인)
+- 동시 접근: WAL 저널 모드와 잠금 대기 시간으로 여러 프로세스가 같은 파일을 읽고 씀
+  (프로세스마다 따로 연결을 열어야 하므로 작업자에는 객체가 아니라 파일 경로를 넘김)
+"""
+import sqlite3
+import time
+
+from symmetry import canonical_key, get_symmetries
+
+OUTCOME_NONE = 0
+OUTCOME_WIN = 1
+OUTCOME_DEFENDED = 2
+OUTCOME_LOST = 3
+
+NO_MOVE = -1  # 수가 없는 결과 (NONE, LOST)
+EVICT_INTERVAL = 32  # 이 횟수만큼 저장할 때마다 항목 수 확인
+EVICT_FRACTION = 0.1  # 넘치면 max_entries 의 이 비율만큼 더 지워 자주 지우지 않게 함
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS solved (
+    key INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    win_length INTEGER NOT NULL,
+    outcome INTEGER NOT NULL,
+    move INTEGER NOT NULL,
+    budget INTEGER NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (key, size, win_length)
+);
+CREATE INDEX IF NOT EXISTS solved_last_used ON solved (last_used);
+"""
+
+
+def to_signed(key):
+    """
+    64비트 부호 없는 해시를 SQLite INTEGER(부호 있는 64비트)로 바꿉니다.
+    """
+    return key - (1 << 64) if key >= 1 << 63 else key
+
+
+class SolvedPositionCache:
+    def __init__(self, path, max_entries=100000, timeout=30.0):
+        """
+        캐시 파일을 엽니다. (없으면 만듦)
+
+        Args:
+            path (str): SQLite 파일 경로
+            max_entries (int): 최대 항목 수 (넘으면 오래 쓰지 않은 항목부터 지움)
+            timeout (float): 다른 프로세스의 잠금을 기다리는 최대 시간 (초)
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.connection = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+        self.lookups = 0
+        self.hits = 0
+        self.stores = 0
+        self.evicted = 0
+
+    def _key(self, board, player):
+        """
+        보드의 정규화 키와 대칭 변환 번호를 반환합니다.
+        """
+        stones = [divmod(cell, board.size) + (stone,) for cell, stone in board.stones.items()]
+        key, transform = canonical_key(board.size, stones, player)
+        return to_signed(key), transform
+
+    def lookup(self, board, player, budget):
+        """
+        player 가 둘 차례인 국면의 저장된 결과를 찾습니다.
+
+        Args:
+            board: 게임 보드
+            player (int): 둘 차례인 플레이어
+            budget (int): 위협 공간 탐색의 노드 예산 (WIN 이 아닌 결과는 저장한 예산 이하일 때만 사용)
+
+        Returns:
+            tuple: (결과, (row, col) 또는 None), 저장된 결과가 없으면 None
+        """
+        self.lookups += 1
+        key, transform = self._key(board, player)
+        row = self.connection.execute(
+            "SELECT outcome, move, budget FROM solved WHERE key = ? AND size = ? AND win_length = ?",
+            (key, board.size, board.win_length)).fetchone()
+        if row is None:
+            return None
+        outcome, move, stored_budget = row
+        if outcome != OUTCOME_WIN and budget > stored_budget:
+            return None
+
+        if move == NO_MOVE:
+            move = None
+        else:
+            _, inverse = get_symmetries(board.size)
+            move = divmod(inverse[transform][move], board.size)
+            if not board.is_valid_move(*move):
+                return None  # 해시 충돌 대비
+        self.connection.execute(
+            "UPDATE solved SET last_used = ? WHERE key = ? AND size = ? AND win_length = ?",
+            (time.time(), key, board.size, board.win_length))
+        self.hits += 1
+        return outcome, move
+
+    def store(self, board, player, outcome, move, budget):
+        """
+        player 가 둘 차례인 국면의 결과를 저장합니다. (같은 국면이 있으면 바꿈)
+
+        Args:
+            board: 게임 보드
+            player (int): 둘 차례인 플레이어
+            outcome (int): OUTCOME_* 결과
+            move: (row, col) 또는 None
+            budget (int): 결과를 얻은 위협 공간 탐색의 노드 예산
+        """
+        key, transform = self._key(board, player)
+        if move is None:
+            cell = NO_MOVE
+        else:
+            forward, _ = get_symmetries(board.size)
+            cell = forward[transform][move[0] * board.size + move[1]]
+        self.connection.execute(
+            "INSERT OR REPLACE INTO solved VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (key, board.size, board.win_length, outcome, cell, budget, time.time()))
+        self.stores += 1
+        if self.stores % EVICT_INTERVAL == 0:
+            self.evict()
+
+    def evict(self):
+        """
+        항목 수가 max_entries 를 넘으면 가장 오래 쓰지 않은 항목들을 지웁니다.
+
+        Returns:
+            int: 지운 항목 수
+        """
+        connection = self.connection
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            count = connection.execute("SELECT COUNT(*) FROM solved").fetchone()[0]
+            excess = count - self.max_entries
+            removed = 0
+            if excess > 0:
+                excess += int(self.max_entries * EVICT_FRACTION)
+                removed = connection.execute(
+                    "DELETE FROM solved WHERE rowid IN "
+                    "(SELECT rowid FROM solved ORDER BY last_used LIMIT ?)", (excess,)).rowcount
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        self.evicted += removed
+        return removed
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM solved").fetchone()[0]
+
+    def get_stats(self):
+        """
+        이 연결의 조회/적중/저장/삭제 횟수를 반환합니다.
+        """
+        return {
+            'lookups': self.lookups,
+            'hits': self.hits,
+            'hit_rate': self.hits / self.lookups if self.lookups else 0.0,
+            'stores': self.stores,
+            'evicted': self.evicted,
+        }
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __getstate__(self):
+        # SQLite 연결은 프로세스 사이에 넘길 수 없으므로 경로와 설정만 넘기고 다시 엶
+        return {'path': self.path, 'max_entries': self.max_entries}
+
+    def __setstate__(self, state):
+        self.__init__(state['path'], state['max_entries'])
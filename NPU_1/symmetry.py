@@ -0,0 +1,174 @@
+"""
+바둑판의 8가지 대칭(회전 4가지 x 뒤집기)을 이용한 국면 정규화
+대칭인 국면들을 하나의 정규화 방향으로 모아서, 탐색 캐시나 개막 정석, 데이터 중복 제거가
+방향과 관계없이 같은 항목을 사용할 수 있게 합니다.
+
+- 정규화 방향: 8가지 방향으로 변환한 국면의 Zobrist 해시 중 가장 작은 값의 방향
+- SymmetricKeys: 8가지 방향의 해시를 돌을 놓고 제거할 때마다 증분으로 유지하므로
+  탐색 노드마다 정규화 해시를 O(1)로 얻을 수 있습니다.
+"""
+from zobrist import SIDE_TO_MOVE_KEY, get_zobrist_table
+
+# 대칭 변환 개수 (항등, 90/180/270도 회전, 가로/주대각선/세로/부대각선 뒤집기)
+SYMMETRY_COUNT = 8
+
+# 판 크기별 대칭 변환 칸 번호 표 캐시
+_symmetry_cache = {}
+
+
+def get_symmetries(size):
+    """
+    8가지 대칭 변환의 칸 번호 표와 그 역변환 표를 반환합니다.
+
+    Args:
+        size (int): 바둑판 크기
+
+    Returns:
+        tuple: (forward, inverse), forward[t][index] 는 변환 t 를 적용한 칸 번호
+    """
+    if size not in _symmetry_cache:
+        last = size - 1
+        transforms = (
+            lambda r, c: (r, c),
+            lambda r, c: (c, last - r),
+            lambda r, c: (last - r, last - c),
+            lambda r, c: (last - c, r),
+            lambda r, c: (r, last - c),
+            lambda r, c: (c, r),
+            lambda r, c: (last - r, c),
+            lambda r, c: (last - c, last - r),
+        )
+        forward, inverse = [], []
+        for transform in transforms:
+            table = [0] * (size * size)
+            back = [0] * (size * size)
+            for r in range(size):
+                for c in range(size):
+                    tr, tc = transform(r, c)
+                    table[r * size + c] = tr * size + tc
+                    back[tr * size + tc] = r * size + c
+            forward.append(table)
+            inverse.append(back)
+        _symmetry_cache[size] = (forward, inverse)
+    return _symmetry_cache[size]
+
+
+def transform_move(move, transform, size):
+    """
+    (row, col) 수에 대칭 변환 transform 을 적용합니다.
+    """
+    forward, _ = get_symmetries(size)
+    return divmod(forward[transform][move[0] * size + move[1]], size)
+
+
+def inverse_move(move, transform, size):
+    """
+    transform 으로 변환된 방향의 (row, col) 수를 원래 방향으로 되돌립니다.
+    """
+    _, inverse = get_symmetries(size)
+    return divmod(inverse[transform][move[0] * size + move[1]], size)
+
+
+def transform_board(board, transform):
+    """
+    보드에 대칭 변환 transform 을 적용한 새 보드를 반환합니다. (같은 보드 클래스)
+    """
+    forward, _ = get_symmetries(board.size)
+    result = type(board)(board.size, board.win_length)
+    for cell, stone in board.stones.items():
+        result.place_stone(*divmod(forward[transform][cell], board.size), stone)
+    return result
+
+
+def canonical_key(size, stones, player):
+    """
+    돌 목록으로 국면의 정규화 해시와 그 방향을 계산합니다.
+
+    Args:
+        size (int): 바둑판 크기
+        stones: (row, col, player) 돌 목록
+        player (int): 둘 차례인 플레이어 (2이면 SIDE_TO_MOVE_KEY 를 더함)
+
+    Returns:
+        tuple: (정규화 해시, 사용한 대칭 변환 번호)
+    """
+    keys = SymmetricKeys(size)
+    for row, col, stone in stones:
+        keys.make(row, col, stone)
+    return keys.canonical(player)
+
+
+def canonicalize(board, player=1):
+    """
+    보드를 정규화 방향으로 변환합니다.
+
+    Args:
+        board: 게임 보드
+        player (int): 둘 차례인 플레이어
+
+    Returns:
+        tuple: (정규화한 새 보드, 사용한 대칭 변환 번호)
+    """
+    _, transform = SymmetricKeys.from_board(board).canonical(player)
+    return transform_board(board, transform), transform
+
+
+class SymmetricKeys:
+    def __init__(self, size):
+        """
+        빈 판의 8가지 방향 Zobrist 해시를 만듭니다.
+
+        Args:
+            size (int): 바둑판 크기
+        """
+        self.size = size
+        self.forward, _ = get_symmetries(size)
+        self.zobrist = get_zobrist_table(size)
+        self.hashes = [0] * SYMMETRY_COUNT
+
+    @classmethod
+    def from_board(cls, board):
+        """
+        보드에 놓인 돌들로 8가지 방향의 해시를 계산합니다.
+        """
+        keys = cls(board.size)
+        for cell, stone in board.stones.items():
+            keys.make(*divmod(cell, board.size), stone)
+        return keys
+
+    def make(self, row, col, player):
+        """
+        (row, col)에 player 의 돌이 놓였을 때 8가지 해시를 갱신합니다.
+        """
+        cell = row * self.size + col
+        keys = self.zobrist[player]
+        hashes = self.hashes
+        for transform, table in enumerate(self.forward):
+            hashes[transform] ^= keys[table[cell]]
+
+    # XOR 이므로 되돌리기도 같은 연산
+    unmake = make
+
+    def key(self):
+        """
+        정규화 해시(8가지 방향 해시 중 가장 작은 값)를 반환합니다.
+        """
+        return min(self.hashes)
+
+    def canonical(self, player=1):
+        """
+        둘 차례를 포함한 정규화 해시와 그 방향을 반환합니다.
+
+        Args:
+            player (int): 둘 차례인 플레이어 (2이면 SIDE_TO_MOVE_KEY 를 더함)
+
+        Returns:
+            tuple: (정규화 해시, 대칭 변환 번호)
+        """
+        side = SIDE_TO_MOVE_KEY if player == 2 else 0
+        best_key, best_transform = None, 0
+        for transform, key in enumerate(self.hashes):
+            key ^= side
+            if best_key is None or key < best_key:
+                best_key, best_transform = key, transform
+        return best_key, best_transform
@@ -0,0 +1,217 @@
+"""
+위협 공간 탐색(threat-space search)
+공격하는 쪽이 매 수마다 "다음 수에 4목(승리 조건)을 만들 수 있는 위협"을 만들어 상대의 응수를 강제하는
+수순만 따라가며 강제 승리(오목의 VCF 와 같은 방식)를 찾습니다.
+응수가 한 칸으로 정해지므로 탐색 나무가 매우 좁아, 일반 미니맥스보다 훨씬 깊은 수순을 볼 수 있습니다.
+
+- 윈도우(길이 4, 승리 조건 길이)별 플레이어의 돌 개수를 증분으로 유지하고,
+  상대 돌 없이 자기 돌이 2개/3개(길이 - 2 / 길이 - 1)인 윈도우 목록으로 위협 수와 승리 칸을 찾습니다.
+  (빈칸 전체가 아니라 이미 놓인 줄에 붙은 칸만 확인)
+- 탐색 노드 수에 예산을 두고, 예산을 넘으면 결과를 알 수 없음(None)으로 처리합니다.
+  예산은 탐색기 하나의 모든 find_win 호출이 함께 쓰므로, 막는 수 후보마다 find_win 을 다시 불러도
+  전체 작업량은 max_nodes 를 넘지 않습니다.
+"""
+from evaluator import WINDOW_LENGTH, get_cell_windows
+from zobrist import get_zobrist_table
+
+# 판 크기/윈도우 길이별 (윈도우 번호 -> 칸 번호들) 표 캐시
+_window_cells_cache = {}
+
+
+class ThreatBudgetExceeded(Exception):
+    """
+    위협 공간 탐색이 노드 예산을 넘었을 때 탐색을 중단하기 위한 예외
+    """
+
+
+def get_window_cells(size, length=WINDOW_LENGTH):
+    """
+    윈도우 번호별로 그 윈도우에 속한 칸 번호들을 반환합니다.
+
+    Args:
+        size (int): 바둑판 크기
+        length (int): 윈도우 길이
+
+    Returns:
+        list: 윈도우 번호로 인덱싱한 칸 번호 튜플들의 리스트
+    """
+    if (size, length) not in _window_cells_cache:
+        cell_windows, window_count = get_cell_windows(size, length)
+        window_cells = [[] for _ in range(window_count)]
+        for cell, windows in enumerate(cell_windows):
+            for window in windows:
+                window_cells[window].append(cell)
+        _window_cells_cache[size, length] = [tuple(cells) for cells in window_cells]
+    return _window_cells_cache[size, length]
+
+
+class ThreatSolver:
+    def __init__(self, board, max_nodes=20000, max_depth=16):
+        """
+        보드의 현재 국면으로 위협 공간 탐색기를 만듭니다. (보드는 변경하지 않음)
+
+        Args:
+            board: 게임 보드 (Board 또는 BitBoard)
+            max_nodes (int): 이 탐색기의 find_win 호출들이 함께 쓰는 전체 탐색 노드 예산
+            max_depth (int): 공격하는 쪽이 둘 수 있는 위협 수의 최대 개수
+        """
+        self.size = board.size
+        self.max_nodes = max_nodes
+        self.max_depth = max_depth
+        self.length = length = board.win_length
+        self.cell_windows, window_count = get_cell_windows(board.size, length)
+        self.window_cells = get_window_cells(board.size, length)
+        self.zobrist = get_zobrist_table(board.size)
+
+        self.cells = [0] * (board.size * board.size)
+        self.counts = [None, [0] * window_count, [0] * window_count]
+        # lines[player][k]: 상대 돌 없이 player 의 돌이 k개(4목이면 2 또는 3)인 윈도우 집합
+        self.low = max(1, length - 2)
+        self.lines = [None] + [{k: set() for k in range(self.low, length)} for _ in range(2)]
+        self.hash = 0
+        self.nodes = 0  # 지금까지 모든 find_win 호출에서 탐색한 노드 수
+        self._failed = {}  # 강제 승리가 없다고 확인한 (해시, 공격자) -> 확인한 최대 깊이
+
+        # 놓인 돌만 반영 (판이 넓어도 돌 수에 비례하는 비용)
+        for cell, stone in board.stones.items():
+            self.place(cell, stone)
+
+    def place(self, cell, player):
+        """
+        칸 번호 cell 에 player 의 돌을 놓고 윈도우 정보를 갱신합니다.
+        """
+        self.cells[cell] = player
+        self.hash ^= self.zobrist[player][cell]
+        self._update(cell, player, 1)
+
+    def remove(self, cell):
+        """
+        칸 번호 cell 의 돌을 제거하고 윈도우 정보를 갱신합니다.
+        """
+        player = self.cells[cell]
+        self.cells[cell] = 0
+        self.hash ^= self.zobrist[player][cell]
+        self._update(cell, player, -1)
+
+    def _update(self, cell, player, delta):
+        counts1, counts2 = self.counts[1], self.counts[2]
+        lines1, lines2 = self.lines[1], self.lines[2]
+        own = self.counts[player]
+        low, length = self.low, self.length
+        for window in self.cell_windows[cell]:
+            first, second = counts1[window], counts2[window]
+            if not second and low <= first < length:
+                lines1[first].discard(window)
+            elif not first and low <= second < length:
+                lines2[second].discard(window)
+
+            own[window] += delta
+            first, second = counts1[window], counts2[window]
+            if not second and low <= first < length:
+                lines1[first].add(window)
+            elif not first and low <= second < length:
+                lines2[second].add(window)
+
+    def winning_cells(self, player):
+        """
+        player 가 두면 바로 4목(승리 조건)이 되는 빈칸들을 반환합니다.
+
+        Returns:
+            set: 칸 번호 집합
+        """
+        cells = self.cells
+        return {cell for window in self.lines[player][self.length - 1]
+                for cell in self.window_cells[window] if not cells[cell]}
+
+    def threat_moves(self, player):
+        """
+        player 가 두면 새 위협(승리 칸)이 생기는 빈칸들을 위협이 많이 생기는 순서로 반환합니다.
+
+        Returns:
+            list: 칸 번호 리스트
+        """
+        cells = self.cells
+        counts = {}
+        for window in self.lines[player][self.low]:
+            for cell in self.window_cells[window]:
+                if not cells[cell]:
+                    counts[cell] = counts.get(cell, 0) + 1
+        return sorted(counts, key=lambda cell: (-counts[cell], cell))
+
+    @property
+    def exhausted(self):
+        """
+        노드 예산을 모두 썼으면 True (이후의 find_win 은 탐색 없이 None)
+        """
+        return self.nodes > self.max_nodes
+
+    def find_win(self, attacker):
+        """
+        attacker 가 둘 차례일 때 위협만으로 이어지는 강제 승리 수순을 찾습니다.
+
+        Args:
+            attacker (int): 공격하는 플레이어 번호
+
+        Returns:
+            list: 강제 승리 수순의 (row, col) 리스트 (공격 수와 강제 응수가 번갈아 나옴),
+                  승리가 없거나 노드 예산을 넘으면 None (예산을 넘었는지는 exhausted 로 확인)
+        """
+        if self.exhausted:
+            return None
+        line = []
+        try:
+            if not self._attack(attacker, self.max_depth, line):
+                return None
+        except ThreatBudgetExceeded:
+            return None
+        return [divmod(cell, self.size) for cell in line]
+
+    def _attack(self, attacker, depth, line):
+        self.nodes += 1
+        if self.nodes > self.max_nodes:
+            raise ThreatBudgetExceeded()
+
+        wins = self.winning_cells(attacker)
+        if wins:
+            line.append(min(wins))
+            return True
+        if depth == 0:
+            return False
+        key = (self.hash, attacker)
+        if self._failed.get(key, -1) >= depth:
+            return False
+
+        defender = 2 if attacker == 1 else 1
+        blocks = self.winning_cells(defender)
+        if len(blocks) > 1:
+            return False  # 상대의 승리 칸을 한 번에 모두 막을 수 없음
+
+        moves = self.threat_moves(attacker)
+        if blocks:
+            # 상대의 위협을 막으면서 위협을 만드는 수만 가능
+            moves = [cell for cell in moves if cell in blocks]
+
+        for move in moves:
+            self.place(move, attacker)
+            threats = self.winning_cells(attacker)
+            if len(threats) >= 2:
+                # 승리 칸이 두 곳이면 상대가 한 곳만 막을 수 있으므로 승리
+                self.remove(move)
+                line.append(move)
+                return True
+
+            reply = threats.pop()  # 하나뿐인 승리 칸은 상대가 반드시 막아야 함
+            self.place(reply, defender)
+            line.extend((move, reply))
+            try:
+                found = self._attack(attacker, depth - 1, line)
+            finally:
+                # 예산 초과로 중단되어도 탐색기 상태를 원래대로 되돌림
+                self.remove(reply)
+                self.remove(move)
+            if found:
+                return True
+            del line[-2:]
+
+        self._failed[key] = depth
+        return False
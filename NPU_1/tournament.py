@@ -0,0 +1,270 @@
+"""
+AIPlayer 끼리 대국시키는 자동 대국(토너먼트) 실행기
+입력 대기나 sleep 없이 두 AI 설정(A, B)을 여러 판 대국시키고,
+판마다 결과, 수당 소요 시간, 탐색 노드 수를 기록하여 승률과 평균/p95 수당 시간을 요약합니다.
+탐색을 바꾼 뒤 실제로 빨라졌는지, 약해지지는 않았는지 확인할 때 사용합니다.
+
+- 판들은 ProcessPoolExecutor 작업자 프로세스들에 나누어 실행합니다.
+- 같은 수순만 반복되지 않도록 시드로 정한 무작위 개막 수를 몇 개 두고 시작하며,
+  두 판씩 같은 개막으로 흑백을 바꾸어 둡니다.
+
+사용법:
+    python3 tournament.py --games 8 --workers 4 \\
+        --engine-a difficulty=3 --engine-b difficulty=2,evaluator=python \\
+        [--time-limit 0.5] [--size 20 --win-length 4] [--output result.json]
+    (engine=mcts 이면 mcts.MCTSPlayer 를 사용, 예: --engine-a engine=mcts,time_limit=0.5)
+"""
+import argparse
+import json
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from ai_player import AIPlayer
+from board import Board
+
+# 개막 수를 두는 범위 (중앙에서 이 거리 이내)
+OPENING_RADIUS = 3
+
+# 플레이어 번호 (Board 의 PLAYER1/PLAYER2 와 같은 값)
+PLAYER1 = 1
+PLAYER2 = 2
+
+
+def parse_engine(text):
+    """
+    "difficulty=3,evaluator=python" 형식의 문자열을 AIPlayer 생성 인자 사전으로 바꿉니다.
+    정수/실수/True/False 로 읽을 수 있는 값은 변환합니다.
+
+    Args:
+        text (str): 쉼표로 구분된 key=value 목록
+
+    Returns:
+        dict: AIPlayer 생성 인자 (time_limit, max_depth 는 get_best_move 인자로 사용)
+    """
+    config = {}
+    for item in filter(None, text.split(',')):
+        key, value = item.split('=', 1)
+        for convert in (int, float):
+            try:
+                value = convert(value)
+                break
+            except ValueError:
+                continue
+        else:
+            value = {'True': True, 'False': False}.get(value, value)
+        config[key.strip()] = value
+    return config
+
+
+def make_opening(seed, stones, size=20):
+    """
+    중앙 근처에 흑백이 번갈아 두는 무작위 개막 수순을 만듭니다.
+
+    Returns:
+        list: (row, col, player) 튜플들의 리스트
+    """
+    rng = random.Random(seed)
+    center = size // 2
+    cells = [(row, col)
+             for row in range(center - OPENING_RADIUS, center + OPENING_RADIUS + 1)
+             for col in range(center - OPENING_RADIUS, center + OPENING_RADIUS + 1)]
+    moves = rng.sample(cells, stones)
+    return [(row, col, PLAYER1 if i % 2 == 0 else PLAYER2)
+            for i, (row, col) in enumerate(moves)]
+
+
+def make_player(player, config):
+    """
+    AI 설정으로 플레이어를 만듭니다. (engine=mcts 이면 MCTSPlayer, 그 밖에는 AIPlayer)
+    """
+    if config.pop('engine', 'alphabeta') == 'mcts':
+        from mcts import MCTSPlayer
+        return MCTSPlayer(player, **config)
+    return AIPlayer(player, **config)
+
+
+def play_game(game_id, engine_a, engine_b, a_first, opening, time_limit=None,
+              max_moves=None, size=20, win_length=4):
+    """
+    한 판을 끝까지 둡니다. (작업자 프로세스에서 실행)
+
+    Args:
+        game_id (int): 판 번호
+        engine_a, engine_b (dict): 두 AI 의 생성 인자
+        a_first (bool): A 가 흑(플레이어 1)이면 True
+        opening (list): 미리 둘 (row, col, player) 개막 수순
+        time_limit (float): 수당 시간 제한 (초), 엔진 설정의 time_limit 이 우선
+        max_moves (int): 최대 수 (넘으면 무승부), None이면 판이 가득 찰 때까지
+        size (int): 바둑판 크기
+        win_length (int): 승리에 필요한 연속 돌 수
+
+    Returns:
+        dict: 판 결과 (winner 는 'A', 'B' 또는 None, 엔진별 수당 시간과 노드 수 목록)
+    """
+    board = Board(size, win_length)
+    for row, col, player in opening:
+        board.place_stone(row, col, player)
+
+    names = {PLAYER1: 'A' if a_first else 'B',
+             PLAYER2: 'B' if a_first else 'A'}
+    configs = {'A': dict(engine_a), 'B': dict(engine_b)}
+    players, limits = {}, {}
+    for player, name in names.items():
+        config = configs[name]
+        limits[name] = (config.pop('time_limit', time_limit), config.pop('max_depth', None))
+        players[name] = make_player(player, config)
+    records = {name: {'times': [], 'nodes': []} for name in configs}
+
+    current = PLAYER1 if len(opening) % 2 == 0 else PLAYER2
+    winner = None
+    moves = len(opening)
+    try:
+        while max_moves is None or moves < max_moves:
+            name = names[current]
+            limit, depth = limits[name]
+            start = time.perf_counter()
+            move = players[name].get_best_move(board, time_limit=limit, max_depth=depth)
+            elapsed = time.perf_counter() - start
+            if move is None:
+                break
+            records[name]['times'].append(elapsed)
+            records[name]['nodes'].append(players[name].last_search_info['nodes'])
+
+            row, col = move
+            board.place_stone(row, col, current)
+            moves += 1
+            if board.check_winner(row, col, current):
+                winner = name
+                break
+            if board.is_board_full():
+                break
+            current = PLAYER2 if current == PLAYER1 else PLAYER1
+    finally:
+        for ai in players.values():
+            ai.close()
+
+    return {
+        'game': game_id,
+        'a_first': a_first,
+        'winner': winner,
+        'moves': moves,
+        'opening': [list(stone) for stone in opening],
+        'records': records,
+    }
+
+
+def percentile(values, fraction):
+    """
+    값 목록의 백분위수(nearest-rank 방식)를 반환합니다.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def summarize(results, wall_time):
+    """
+    판 결과들을 엔진별 승률, 수당 시간, 노드 수로 요약합니다.
+
+    Returns:
+        dict: 요약 정보
+    """
+    games = len(results)
+    summary = {'games': games, 'wall_time': wall_time,
+               'games_per_sec': games / wall_time if wall_time else 0.0,
+               'draws': sum(1 for result in results if result['winner'] is None)}
+    for name in ('A', 'B'):
+        wins = sum(1 for result in results if result['winner'] == name)
+        times = [t for result in results for t in result['records'][name]['times']]
+        nodes = [n for result in results for n in result['records'][name]['nodes']]
+        summary[name] = {
+            'wins': wins,
+            'win_rate': (wins + 0.5 * summary['draws']) / games if games else 0.0,
+            'moves': len(times),
+            'mean_move_time': sum(times) / len(times) if times else 0.0,
+            'p95_move_time': percentile(times, 0.95),
+            'total_nodes': sum(nodes),
+            'nodes_per_sec': sum(nodes) / sum(times) if sum(times) else 0.0,
+        }
+    return summary
+
+
+def run_tournament(engine_a, engine_b, games, workers=1, seed=0, opening_stones=2,
+                   time_limit=None, max_moves=None, size=20, win_length=4):
+    """
+    두 AI 설정을 games 판 대국시킵니다.
+
+    Args:
+        engine_a, engine_b (dict): 두 AI 의 생성 인자
+        games (int): 판 수 (두 판씩 같은 개막으로 흑백을 바꿈)
+        workers (int): 작업자 프로세스 수 (1이면 현재 프로세스에서 실행)
+        seed (int): 개막 수순 시드
+        opening_stones (int): 개막으로 미리 둘 돌 수
+        size (int): 바둑판 크기
+        win_length (int): 승리에 필요한 연속 돌 수
+
+    Returns:
+        tuple: (판 결과 리스트, 요약 사전)
+    """
+    jobs = [(game_id, engine_a, engine_b, game_id % 2 == 0,
+             make_opening(seed + game_id // 2, opening_stones, size),
+             time_limit, max_moves, size, win_length)
+            for game_id in range(games)]
+
+    start = time.perf_counter()
+    if workers <= 1:
+        results = [play_game(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(play_game, *job) for job in jobs]
+            results = [future.result() for future in futures]
+    wall_time = time.perf_counter() - start
+    return results, summarize(results, wall_time)
+
+
+def print_summary(summary, engine_a, engine_b):
+    """
+    요약 정보를 보기 좋게 출력합니다.
+    """
+    print(f"{summary['games']}판, 무승부 {summary['draws']}판, "
+          f"{summary['wall_time']:.1f}s ({summary['games_per_sec']:.2f}판/s)")
+    for name, config in (('A', engine_a), ('B', engine_b)):
+        stats = summary[name]
+        print(f"{name} {config}: {stats['wins']}승 (승률 {stats['win_rate'] * 100:.1f}%), "
+              f"수당 평균 {stats['mean_move_time'] * 1000:.1f}ms / "
+              f"p95 {stats['p95_move_time'] * 1000:.1f}ms, "
+              f"{stats['nodes_per_sec']:,.0f}노드/s")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--engine-a", type=parse_engine, default={})
+    parser.add_argument("--engine-b", type=parse_engine, default={})
+    parser.add_argument("--games", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--opening-stones", type=int, default=2)
+    parser.add_argument("--time-limit", type=float, default=None)
+    parser.add_argument("--max-moves", type=int, default=None)
+    parser.add_argument("--size", type=int, default=20)
+    parser.add_argument("--win-length", type=int, default=4)
+    parser.add_argument("--output", default=None, help="판 결과와 요약을 저장할 JSON 파일")
+    args = parser.parse_args()
+
+    results, summary = run_tournament(args.engine_a, args.engine_b, args.games,
+                                      args.workers, args.seed, args.opening_stones,
+                                      args.time_limit, args.max_moves, args.size, args.win_length)
+    print_summary(summary, args.engine_a, args.engine_b)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'engine_a': args.engine_a, 'engine_b': args.engine_b,
+                       'summary': summary, 'games': results}, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+미니맥스 탐색용 치환표(Transposition Table)
+서로 다른 수순으로 도달한 같은 국면의 탐색 결과를 Zobrist 해시로 찾아 재사용합니다.
+
+승리 점수(WIN_SCORE + 승리한 노드의 남은 깊이)는 탐색 시작 국면 기준이므로 그대로 저장하면
+다른 수순/다른 반복 심화 깊이로 같은 국면에 왔을 때 승리까지의 거리가 틀립니다.
+그래서 저장할 때는 그 노드로부터의 거리(WIN_SCORE - 거리)로 바꾸고, 찾을 때 현재 노드의 남은 깊이를
+더해 다시 탐색 시작 국면 기준으로 되돌립니다.
+"""
+
+# 저장된 점수의 종류
+EXACT = 0        # 정확한 값
+LOWER_BOUND = 1  # 베타 컷오프로 끝난 노드 (실제 값 >= 점수)
+UPPER_BOUND = 2  # 알파를 넘지 못한 노드 (실제 값 <= 점수)
+
+# 승리/패배 점수: 승리한 노드에서 +-(WIN_SCORE + 남은 깊이), 평가 점수와 섞이지 않도록 충분히 큼
+WIN_SCORE = 1000000
+WIN_THRESHOLD = WIN_SCORE - 1000  # 절댓값이 이 이상이면 승리/패배 점수 (거리는 1000 수 미만)
+
+# 슬롯 하나가 차지하는 대략적인 메모리 (키/깊이/점수/종류/세대 리스트 항목과 정수 객체)
+ENTRY_BYTES = 100
+
+
+class TranspositionTable:
+    def __init__(self, memory_mb=16):
+        """
+        주어진 메모리 예산에 맞는 크기의 치환표를 만듭니다.
+
+        항목마다 튜플을 만들지 않도록 슬롯별 값을 나란한 리스트들에 저장하고,
+        해시를 슬롯 개수로 나눈 나머지 위치에 한 항목씩 저장합니다.
+
+        Args:
+            memory_mb (float): 치환표에 사용할 메모리 예산 (MB)
+        """
+        self.capacity = max(1, int(memory_mb * 1024 * 1024) // ENTRY_BYTES)
+        self.keys = [None] * self.capacity
+        self.depths = [0] * self.capacity
+        self.scores = [0] * self.capacity
+        self.flags = [EXACT] * self.capacity
+        self.generations = [0] * self.capacity
+        self.generation = 1
+        self.valid_generation = 1  # 이보다 이전 세대에 저장된 항목은 지워진 것으로 취급
+        self.stored = 0
+        self.reset_stats()
+
+    def clear(self):
+        """
+        모든 항목과 통계를 지웁니다.
+
+        리스트들을 새로 만들거나 덮어쓰지 않고 세대만 올려 이전 항목들을 무효로 만듭니다.
+        (수마다 치환표를 비워도 메모리를 새로 할당하지 않음)
+        """
+        self.generation += 1
+        self.valid_generation = self.generation
+        self.stored = 0
+        self.reset_stats()
+
+    def reset_stats(self):
+        """
+        조회/적중/저장 횟수를 0으로 되돌립니다.
+        """
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+
+    def new_search(self):
+        """
+        새 탐색의 시작을 알립니다. 이전 탐색의 항목은 깊이와 관계없이 교체 대상이 됩니다.
+        """
+        self.generation += 1
+
+    def probe(self, key, depth, alpha, beta):
+        """
+        저장된 결과로 현재 노드의 값을 바로 정할 수 있는지 확인합니다.
+
+        Args:
+            key (int): 국면 해시
+            depth (int): 현재 노드의 남은 탐색 깊이
+            alpha, beta: 현재 탐색 창
+
+        Returns:
+            int: 사용할 수 있는 점수, 없으면 None
+        """
+        self.probes += 1
+        slot = key % self.capacity
+        if (self.keys[slot] != key or self.depths[slot] < depth
+                or self.generations[slot] < self.valid_generation):
+            return None
+
+        score = self.scores[slot]
+        if score >= WIN_THRESHOLD:
+            score += depth
+        elif score <= -WIN_THRESHOLD:
+            score -= depth
+        flag = self.flags[slot]
+        if (flag == EXACT or
+                (flag == LOWER_BOUND and score >= beta) or
+                (flag == UPPER_BOUND and score <= alpha)):
+            self.hits += 1
+            return score
+        return None
+
+    def store(self, key, depth, score, flag):
+        """
+        탐색 결과를 저장합니다. (깊이 우선 교체 정책)
+
+        같은 슬롯에 이번 탐색에서 더 깊게 탐색한 다른 국면이 있으면 저장하지 않습니다.
+
+        Args:
+            key (int): 국면 해시
+            depth (int): 탐색한 깊이
+            score (int): 탐색 결과 점수 (승리 점수는 이 노드로부터의 거리로 바꿔 저장)
+            flag (int): EXACT, LOWER_BOUND, UPPER_BOUND 중 하나
+        """
+        if score >= WIN_THRESHOLD:
+            score -= depth
+        elif score <= -WIN_THRESHOLD:
+            score += depth
+        slot = key % self.capacity
+        stored_key = self.keys[slot]
+        if stored_key is None or self.generations[slot] < self.valid_generation:
+            self.stored += 1
+        elif (stored_key != key and
+              self.generations[slot] == self.generation and
+              self.depths[slot] > depth):
+            return
+
+        self.keys[slot] = key
+        self.depths[slot] = depth
+        self.scores[slot] = score
+        self.flags[slot] = flag
+        self.generations[slot] = self.generation
+        self.stores += 1
+
+    def hit_rate(self):
+        """
+        Returns:
+            float: 조회 대비 적중 비율 (조회가 없으면 0.0)
+        """
+        return self.hits / self.probes if self.probes else 0.0
+
+    def get_stats(self):
+        """
+        치환표 사용 통계를 반환합니다.
+
+        Returns:
+            dict: 조회/적중/저장 횟수, 적중률, 저장된 항목 수, 전체 슬롯 수
+        """
+        return {
+            'probes': self.probes,
+            'hits': self.hits,
+            'hit_rate': self.hit_rate(),
+            'stores': self.stores,
+            'entries': self.stored,
+            'capacity': self.capacity,
+        }
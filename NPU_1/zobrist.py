@@ -0,0 +1,36 @@
+"""
+Zobrist 해시 키 테이블
+칸과 플레이어마다 64비트 난수를 정해 두고, 놓인 돌들의 난수를 XOR 하여 국면의 해시를 만듭니다.
+돌을 놓거나 제거할 때 같은 난수를 한 번 XOR 하면 되므로 해시를 증분으로 유지할 수 있습니다.
+"""
+import random
+
+ZOBRIST_SEED = 20250920
+
+# 탐색에서 두는 차례(최대화 플레이어)를 구분하기 위한 키
+SIDE_TO_MOVE_KEY = random.Random(ZOBRIST_SEED - 1).getrandbits(64)
+
+# 판 크기별 키 테이블 캐시
+_tables = {}
+
+
+def get_zobrist_table(size):
+    """
+    판 크기에 맞는 Zobrist 키 테이블을 반환합니다.
+    같은 크기의 보드들은 같은 테이블을 공유하므로 해시 값을 서로 비교할 수 있습니다.
+
+    Args:
+        size (int): 바둑판 크기
+
+    Returns:
+        list: table[player][row * size + col] 형태의 64비트 정수 테이블 (0번 플레이어는 모두 0)
+    """
+    if size not in _tables:
+        rng = random.Random(ZOBRIST_SEED + size)
+        cells = size * size
+        _tables[size] = [
+            [0] * cells,
+            [rng.getrandbits(64) for _ in range(cells)],
+            [rng.getrandbits(64) for _ in range(cells)],
+        ]
+    return _tables[size]
@@ -5,21 +5,31 @@ import argparse
 import glob
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 class PanoramaStitcher:
-    def __init__(self):
+    def __init__(self, mode="stitcher", detector="orb", tiles=(2, 2), workers=None,
+                 max_features=4000, ratio=0.75, ransac_threshold=5.0):
+        self.mode = mode
+        self.detector = detector
+        self.tiles = tiles
+        self.workers = workers or os.cpu_count() or 1
+        self.max_features = max_features
+        self.ratio = ratio
+        self.ransac_threshold = ransac_threshold
         self.stitcher = cv2.Stitcher.create(cv2.Stitcher_PANORAMA)
+        self.timings = {}
     
     def load_images(self, input_dir, pattern="*.jpg"):
         image_paths = sorted(glob.glob(os.path.join(input_dir, pattern)))
         if len(image_paths) < 2:
             raise ValueError(f"Need at least 2 images, found {len(image_paths)}")
         
-        images = []
-        for path in image_paths:
-            image = cv2.imread(path)
-            if image is not None:
-                images.append(image)
+        # cv2.imread 는 디코딩 중 GIL 을 놓으므로 4000x3000 JPEG 들을 스레드로 동시에 읽음
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            loaded = list(executor.map(cv2.imread, image_paths))
+        images = [image for image in loaded if image is not None]
         
         if len(images) < 2:
             raise ValueError(f"Need at least 2 valid images, found {len(images)}")
@@ -38,13 +48,172 @@ class PanoramaStitcher:
         return processed
     
     def stitch_images(self, images):
+        if self.mode == "pipeline":
+            return self.stitch_pipeline(images)
         status, panorama = self.stitcher.stitch(images)
         return status == cv2.Stitcher_OK, panorama
     
+    def create_detector(self, max_features):
+        if self.detector == "sift":
+            return cv2.SIFT_create(nfeatures=max_features)
+        return cv2.ORB_create(nfeatures=max_features)
+    
+    def tile_regions(self, shape):
+        # (x0, y0, x1, y1) 타일 영역
+        h, w = shape[:2]
+        cols, rows = self.tiles
+        regions = []
+        for r in range(rows):
+            for c in range(cols):
+                regions.append((w * c // cols, h * r // rows, w * (c + 1) // cols, h * (r + 1) // rows))
+        return regions
+    
+    def detect_tile(self, gray, region, max_features, margin=32):
+        # 경계의 특징점도 기술자를 계산할 수 있게 타일을 margin 만큼 넓혀서 검출하고,
+        # 겹치는 margin 에서 찾은 점은 이웃 타일의 것이므로 버림 (중복 없이 이미지 좌표로 옮김)
+        x0, y0, x1, y1 = region
+        h, w = gray.shape
+        px0, py0 = max(x0 - margin, 0), max(y0 - margin, 0)
+        px1, py1 = min(x1 + margin, w), min(y1 + margin, h)
+        detector = self.create_detector(max_features)
+        keypoints, descriptors = detector.detectAndCompute(gray[py0:py1, px0:px1], None)
+        if descriptors is None:
+            return [], None
+        
+        kept, rows = [], []
+        for i, keypoint in enumerate(keypoints):
+            x, y = keypoint.pt[0] + px0, keypoint.pt[1] + py0
+            if x0 <= x < x1 and y0 <= y < y1:
+                kept.append(cv2.KeyPoint(x, y, keypoint.size, keypoint.angle, keypoint.response,
+                                         keypoint.octave, keypoint.class_id))
+                rows.append(i)
+        return kept, descriptors[rows]
+    
+    def detect_features(self, images, executor):
+        # 이미지 x 타일 작업을 한 스레드 풀에 넣음 (OpenCV 검출은 GIL 을 놓으므로 코어 수만큼 동시에 실행)
+        grays = [cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) for image in images]
+        tile_count = self.tiles[0] * self.tiles[1]
+        per_tile = max(self.max_features // tile_count, 1)
+        futures = [[executor.submit(self.detect_tile, gray, region, per_tile)
+                    for region in self.tile_regions(gray.shape)] for gray in grays]
+        
+        features = []
+        for tile_futures in futures:
+            keypoints, descriptors = [], []
+            for future in tile_futures:
+                tile_keypoints, tile_descriptors = future.result()
+                if tile_keypoints:
+                    keypoints.extend(tile_keypoints)
+                    descriptors.append(tile_descriptors)
+            features.append((keypoints, np.vstack(descriptors) if descriptors else None))
+        return features
+    
+    def match_features(self, features_a, features_b):
+        norm = cv2.NORM_L2 if self.detector == "sift" else cv2.NORM_HAMMING
+        matcher = cv2.BFMatcher(norm)
+        pairs = matcher.knnMatch(features_b[1], features_a[1], k=2)
+        # Lowe 비율 검사: 두 번째로 가까운 기술자보다 충분히 가까운 대응만 남김
+        return [pair[0] for pair in pairs if len(pair) == 2 and pair[0].distance < self.ratio * pair[1].distance]
+    
+    def estimate_homography(self, features_a, features_b, matches):
+        # features_b 의 좌표를 features_a 의 좌표로 옮기는 호모그래피
+        if len(matches) < 4:
+            return None, 0
+        source = np.float32([features_b[0][m.queryIdx].pt for m in matches]).reshape(-1, 1, 2)
+        target = np.float32([features_a[0][m.trainIdx].pt for m in matches]).reshape(-1, 1, 2)
+        homography, mask = cv2.findHomography(source, target, cv2.RANSAC, self.ransac_threshold)
+        if homography is None:
+            return None, 0
+        return homography, int(mask.sum())
+    
+    def chain_homographies(self, pair_homographies):
+        # 이웃한 쌍의 호모그래피를 곱해 가운데 이미지 기준 좌표로 모음 (양 끝으로 갈수록 덜 늘어남)
+        count = len(pair_homographies) + 1
+        reference = count // 2
+        homographies = [np.eye(3) for _ in range(count)]
+        for i in range(reference + 1, count):
+            homographies[i] = homographies[i - 1] @ pair_homographies[i - 1]
+        for i in range(reference - 1, -1, -1):
+            homographies[i] = homographies[i + 1] @ np.linalg.inv(pair_homographies[i])
+        return homographies
+    
+    def warp_image(self, image, homography, size):
+        warped = cv2.warpPerspective(image, homography, size)
+        mask = cv2.warpPerspective(np.full(image.shape[:2], 255, np.uint8), homography, size,
+                                   flags=cv2.INTER_NEAREST)
+        # 가장자리에서 멀수록 큰 가중치로 겹치는 부분을 부드럽게 섞음 (feather blending)
+        weight = cv2.distanceTransform(mask, cv2.DIST_L2, 3)
+        return warped, weight
+    
+    def warp_images(self, images, homographies, executor):
+        corners = []
+        for image, homography in zip(images, homographies):
+            h, w = image.shape[:2]
+            points = np.float32([[0, 0], [w, 0], [w, h], [0, h]]).reshape(-1, 1, 2)
+            corners.append(cv2.perspectiveTransform(points, homography))
+        corners = np.vstack(corners).reshape(-1, 2)
+        x_min, y_min = np.floor(corners.min(axis=0)).astype(int)
+        x_max, y_max = np.ceil(corners.max(axis=0)).astype(int)
+        translation = np.array([[1, 0, -x_min], [0, 1, -y_min], [0, 0, 1]], dtype=np.float64)
+        size = (int(x_max - x_min), int(y_max - y_min))
+        
+        return list(executor.map(lambda item: self.warp_image(item[0], translation @ item[1], size),
+                                 zip(images, homographies)))
+    
+    def blend_images(self, warped):
+        total = np.zeros(warped[0][0].shape, np.float32)
+        weights = np.zeros(warped[0][1].shape, np.float32)
+        for image, weight in warped:
+            total += image.astype(np.float32) * weight[..., None]
+            weights += weight
+        covered = weights > 0
+        total[covered] /= weights[covered][..., None]
+        return total.astype(np.uint8)
+    
+    def stitch_pipeline(self, images):
+        # 특징점 검출 -> 이웃 쌍 매칭 -> RANSAC 호모그래피 -> 워핑 -> 블렌딩 (단계별 시간은 self.timings)
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            start = time.perf_counter()
+            features = self.detect_features(images, executor)
+            self.timings['detect'] = time.perf_counter() - start
+            
+            start = time.perf_counter()
+            pairs = list(zip(features, features[1:]))
+            matches = list(executor.map(lambda pair: self.match_features(*pair), pairs))
+            self.timings['match'] = time.perf_counter() - start
+            
+            start = time.perf_counter()
+            pair_homographies = []
+            for (features_a, features_b), pair_matches in zip(pairs, matches):
+                homography, inliers = self.estimate_homography(features_a, features_b, pair_matches)
+                if homography is None or inliers < 10:
+                    return False, None
+                pair_homographies.append(homography)
+            homographies = self.chain_homographies(pair_homographies)
+            self.timings['homography'] = time.perf_counter() - start
+            
+            start = time.perf_counter()
+            warped = self.warp_images(images, homographies, executor)
+            self.timings['warp'] = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        panorama = self.blend_images(warped)
+        self.timings['blend'] = time.perf_counter() - start
+        return True, panorama
+    
     def create_panorama(self, input_dir, pattern="*.jpg", output_path="panorama.jpg"):
+        self.timings = {}
+        start = time.perf_counter()
         images = self.load_images(input_dir, pattern)
+        self.timings['load'] = time.perf_counter() - start
+        
+        start = time.perf_counter()
         processed_images = self.preprocess_images(images)
+        self.timings['preprocess'] = time.perf_counter() - start
+        
+        start = time.perf_counter()
         success, panorama = self.stitch_images(processed_images)
+        self.timings['stitch'] = time.perf_counter() - start
         
         if success:
             cv2.imwrite(output_path, panorama)
@@ -56,12 +225,20 @@ def main():
     parser.add_argument("--input_dir", required=True)
     parser.add_argument("--pattern", default="*.jpg")
     parser.add_argument("--output", default="panorama.jpg")
+    parser.add_argument("--mode", choices=["stitcher", "pipeline"], default="stitcher")
+    parser.add_argument("--detector", choices=["orb", "sift"], default="orb")
+    parser.add_argument("--tiles", default="2x2", help="columns x rows, e.g. 2x2")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max_features", type=int, default=4000)
     args = parser.parse_args()
     
-    stitcher = PanoramaStitcher()
+    tiles = tuple(int(n) for n in args.tiles.lower().split("x"))
+    stitcher = PanoramaStitcher(args.mode, args.detector, tiles, args.workers, args.max_features)
     success = stitcher.create_panorama(args.input_dir, args.pattern, args.output)
     
     print(f"Panorama creation {'succeeded' if success else 'failed'}")
+    for stage, seconds in stitcher.timings.items():
+        print(f"  {stage:<11}{seconds * 1000:8.1f} ms")
     return 0 if success else 1
 
 if __name__ == "__main__":